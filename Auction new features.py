@@ -1,11 +1,56 @@
+from startup_timing import prewarm_imports, startup_timer
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
-import pandas as pd
-from openpyxl import Workbook, load_workbook
-from openpyxl.utils import get_column_letter
+from tkinter import filedialog, messagebox, simpledialog
 from datetime import datetime
+import argparse
 import os
-import re
+import queue
+from analytics_pane import AnalyticsPane
+from auction_analytics import AuctionAnalytics
+from auction_engine import (AuctionEngine, BIDDING_CLOSED, FIRST_PLAYER_ID, FIRST_TEAM_ID, INSUFFICIENT_FUNDS, NO_BIDS,
+                            NO_PLAYER, NO_TEAM, NOTHING_TO_REDO, NOTHING_TO_UNDO, OK, SQUAD_BUDGET, apply_event,
+                            execute)
+from auction_history import AuctionHistory
+from bid_ladder import DEFAULT_LADDER, load_ladder
+from bid_server import BidServerThread
+from event_journal import EventJournal, SessionExporter
+from instrumentation import DEFAULT_REPORT, instruments
+from notifications import RoundCountdown, TimerWheel, ToastArea
+from player_catalog import ORDER_ID, ORDER_NAME, ORDER_PRICE, PlayerCatalog
+from player_list import PlayerListView
+from render import InventoryText, LabelRenderer
+from roster_cache import load_roster_cached
+from roster_loader import RosterError
+from session_manifest import SessionManifest
+from session_recovery import (SNAPSHOT_EVENTS, SessionState, find_unfinished_sessions, recover_session,
+                              restore_history, snapshot_path)
+from session_snapshot import SnapshotWriter
+from team_panel import COLUMNS, TABLE, TeamPanelView
+
+DEFAULT_AUCTION_NAME = "AuctionSession"
+
+# Number of logged events between two background exports of the session sheet
+CHECKPOINT_EVENTS = 200
+# Maximum time between two background exports while events keep arriving
+CHECKPOINT_INTERVAL_MS = 60000
+# Modules the file picker does not need; imported in the background while the user browses
+PREWARM_MODULES = ("openpyxl",)
+# Grid columns taken by the team panel and the buttons below it; the player list comes after them
+CONTROL_COLUMNS = 4
+# How often the Tk loop picks up events pushed by the bidding server
+EVENT_POLL_MS = 5
+# How long the bidding server's address is shown after it starts
+SERVER_ADDRESS_TOAST_MS = 60000
+# Player list filter bar choices
+ALL_CATEGORIES = "All categories"
+PLAYER_SORTS = {
+    "Roster order": (ORDER_ID, False),
+    "Name": (ORDER_NAME, False),
+    "Price (low first)": (ORDER_PRICE, False),
+    "Price (high first)": (ORDER_PRICE, True),
+}
+
+startup_timer.mark("imports")
 
 class FileSelectPage(tk.Frame):
     def __init__(self, master, on_file_loaded):
@@ -19,50 +64,79 @@ class FileSelectPage(tk.Frame):
             filetypes=[("Excel files", "*.xls;*.xlsx")]
         )
         if file_path:
+            startup_timer.mark("file_chosen")
+            try:
+                # An unchanged roster comes from the parsed-roster cache; otherwise the first
+                # sheet is streamed and split into teams/players at the blank row
+                roster = instruments.timed("load_roster", load_roster_cached)(file_path)
+            except RosterError as e:
+                messagebox.showerror("Error", str(e))
+                return
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load file: {e}")
+                return
+            startup_timer.mark("roster_loaded")
             try:
-                df = pd.read_excel(file_path, sheet_name=None)
-                sheet = list(df.values())[0]
-                # Find the split (blank row)
-                blank_idx = sheet[sheet.isnull().all(axis=1)].index[0]
-                teams_df = sheet.iloc[:blank_idx, :2].copy()
-                players_df = sheet.iloc[blank_idx+2:, :2].copy()
-                teams_df.columns = ["Team name", "Team starting money"]
-                players_df.columns = ["Player name", "Bid value"]
-                # Check for missing values
-                if teams_df.isnull().any().any() or players_df.isnull().any().any():
-                    messagebox.showerror("Error", "File contains missing values. Please fill all cells.")
-                    return
-                self.on_file_loaded(teams_df, players_df)
+                self.on_file_loaded(roster)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {e}")
 
 class AuctionApp(tk.Frame):
-    def __init__(self, master, teams_df, players_df, auction_name="AuctionSession"):
+    def __init__(self, master, roster, auction_name=DEFAULT_AUCTION_NAME, resume_state=None, serve=None,
+                 ladder=None, squad_size=0, countdown=0, compact_teams=False):
         super().__init__(master)
         self.master = master
         self.pack(fill="both", expand=True)
-        self.auction_name = auction_name
-        self.excel_filename = f"{auction_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        self.setup_excel()
-
-        # Parse teams and players from dataframes
-        self.teams = list(teams_df["Team name"])
-        self.manager_ids = {team: i+1 for i, team in enumerate(self.teams)}
-        self.team_money = {row["Team name"]: int(row["Team starting money"]) for _, row in teams_df.iterrows()}
-        self.team_inventory = {team: {} for team in self.teams}
-        self.items = [(row["Player name"], int(row["Bid value"])) for _, row in players_df.iterrows()]
-        self.player_ids = {name: 101+i for i, (name, _) in enumerate(self.items)}
+        # Hot paths get latency histograms when --instrument is given; otherwise this is a no-op
+        instruments.wrap(self, "dispatch", "on_event", "poll_server_events", "log_state", "remove_sold_item")
+        if resume_state is None:
+            self.auction_name = auction_name
+            self.manifest = SessionManifest.for_day(auction_name)
+            self.setup_excel()
+
+            self.starting_teams = list(roster.teams)
+            self.starting_items = list(roster.players)
+            # A ladder given on the command line wins over the one in the roster file
+            self.engine = AuctionEngine(self.starting_teams, self.starting_items,
+                                        ladder or roster.ladder or DEFAULT_LADDER)
+            if squad_size:
+                self.engine.set_squad_size(squad_size)
+            AuctionHistory(self.engine)
+        else:
+            # Resume an interrupted session with the roster it started with
+            self.auction_name = resume_state.auction_name
+            self.excel_filename = resume_state.excel_filename
+            self.manifest = None
+            self.setup_excel(resume_state.session_name)
+            self.starting_teams = list(resume_state.teams)
+            self.starting_items = list(resume_state.players)
+            self.engine = resume_state.engine
+        # A session resumed from a snapshot only has the history since the snapshot until it is needed
+        self.history_complete = resume_state is None or resume_state.history_complete
+        self.teams = [team for team, _ in self.starting_teams]
+        self.manager_ids = {team: FIRST_TEAM_ID+i for i, team in enumerate(self.teams)}
+        # Unsold players by stable player ID, so players who share a name stay distinct
+        self.catalog = PlayerCatalog(self.engine.player_names, self.engine.player_base, self.engine.remaining)
+        # Live statistics fed by log_state; the pane showing them is opened on demand
+        self.analytics = AuctionAnalytics(self.engine, [money for _, money in self.starting_teams])
+        self.analytics_pane = None
         self.write_header_to_excel()
+        self.start_journal(resume=resume_state is not None)
+        self.bid_server = None
+        if serve is not None:
+            self.start_bid_server(*serve)
 
         # --- GUI Layout ---
-        self.money_labels = {}
-        self.inventory_heading_labels = {}
-        self.inventory_list_labels = {}
-        self.bid_history = []
-        self.current_item = None
-        self.current_bid = None
-        self.highest_bidder = None
-        self.bidding_enabled = 0
+        # Toasts and the round countdown share one timer wheel
+        self.timer_wheel = TimerWheel(self)
+        self.toasts = ToastArea(self, self.timer_wheel)
+        self.toasts.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-10)
+        if self.bid_server is not None:
+            # Stays up long enough to read the address out to the managers; a click dismisses it
+            self.toasts.show(f"Bidding Server: listening on {self.server_address}", "info",
+                             duration_ms=SERVER_ADDRESS_TOAST_MS)
+        self.countdown = (RoundCountdown(self.timer_wheel, int(countdown * 1000), self.announce_call,
+                                         self.end_bidding_round) if countdown else None)
 
         # Current item label
         self.current_item_label = tk.Label(
@@ -72,7 +146,7 @@ class AuctionApp(tk.Frame):
             width=50,
             anchor="w"
         )
-        self.current_item_label.grid(row=0, column=0, columnspan=len(self.teams), pady=10, padx=5, sticky="w")
+        self.current_item_label.grid(row=0, column=0, columnspan=CONTROL_COLUMNS, pady=10, padx=5, sticky="w")
 
         # Bidding status label
         self.bid_status_label = tk.Label(
@@ -80,61 +154,34 @@ class AuctionApp(tk.Frame):
             text="Bidding Status: ",
             font=('Arial', 14)
         )
-        self.bid_status_label.grid(row=1, column=0, columnspan=len(self.teams), pady=10, padx=5, sticky="w")
-
-        # Team columns
-        for i, team in enumerate(self.teams):
-            # Money label
-            money_label = tk.Label(
-                self,
-                text=f"{team} \nMoney: ₹{self.team_money[team]}",
-                font=('Arial', 12, 'bold'),
-                width=20,
-                anchor="n"
-            )
-            money_label.grid(row=2, column=i, pady=3, padx=3, sticky="nsew")
-            self.money_labels[team] = money_label
-
-            # Create a frame for each team's inventory (heading + list)
-            inventory_frame = tk.Frame(self)
-            inventory_frame.grid(row=3, column=i, rowspan=2, pady=3, padx=3, sticky="nsew")
-
-            # Inventory heading label (inside frame)
-            inventory_heading_label = tk.Label(
-                inventory_frame,
-                text=f"{team} \nInventory:",
-                font=('Arial', 12, 'bold'),
-                width=20,
-                anchor="n"
-            )
-            inventory_heading_label.pack(side="top", fill="x")
-
-            # Inventory list label (inside frame)
-            inventory_list_label = tk.Label(
-                inventory_frame,
-                text="",
-                font=('Arial', 12),
-                width=20,
-                wraplength=200,
-                justify="center",
-                anchor="n"
-            )
-            inventory_list_label.pack(side="top", fill="both", expand=True)
-
-            self.inventory_heading_labels[team] = inventory_heading_label
-            self.inventory_list_labels[team] = inventory_list_label
-
-            # Bid button
-            bid_button = tk.Button(
-                self,
-                text=f"Bid",
-                font=('Arial', 12),
-                command=lambda team=team: self.place_bid(team),
-                width=12,
-                height=2,
-                bg="lightblue"
-            )
-            bid_button.grid(row=10, column=i, pady=5, padx=5, sticky="s")
+        self.bid_status_label.grid(row=1, column=0, columnspan=CONTROL_COLUMNS, pady=10, padx=5, sticky="w")
+
+        # Team panel: widgets only exist for the teams in view, as full columns or compact summary rows
+        self.team_panel = TeamPanelView(
+            self,
+            self.engine.team_ids(),
+            money_text=self.money_text,
+            inventory_text=lambda team_id: self.inventory_text.get(team_id),
+            summary=self.team_summary,
+            can_bid=self.can_bid,
+            on_bid=lambda team_id: self.place_bid(self.engine.team_names[team_id]),
+            on_proxy=lambda team_id: self.ask_proxy_ceiling(self.engine.team_names[team_id]),
+            mode=TABLE if compact_teams else COLUMNS,
+            font=('Arial', 12)
+        )
+        self.team_panel.grid(row=2, column=0, rowspan=9, columnspan=CONTROL_COLUMNS, pady=3, padx=3, sticky="nsew")
+
+        # Open lots: a click makes a lot the active one; with the box ticked, picking a player
+        # opens another lot next to the active one instead of replacing it
+        lot_frame = tk.Frame(self)
+        lot_frame.grid(row=11, column=0, columnspan=CONTROL_COLUMNS, padx=5, sticky="nsew")
+        self.parallel_lots = tk.BooleanVar(self, value=False)
+        tk.Checkbutton(lot_frame, text="Open as parallel lot", variable=self.parallel_lots,
+                       font=('Arial', 12)).pack(side="left")
+        self.lot_buttons_frame = tk.Frame(lot_frame)
+        self.lot_buttons_frame.pack(side="left", fill="x", expand=True)
+        self.lot_buttons = []
+        self.shown_lot = self.engine.current_player
 
         # Undo Button
         self.undo_button = tk.Button(
@@ -159,308 +206,860 @@ class AuctionApp(tk.Frame):
         )
         end_bidding_button.grid(row=15, column=1, columnspan=2, pady=10, padx=5, sticky="nsew")
 
-        # Player list (scrolled text) in the rightmost column
-        player_list_col = len(self.teams)
-        self.item_list_text = scrolledtext.ScrolledText(
+        # Proxy Bids Button
+        proxy_button = tk.Button(
             self,
-            width=40,
-            height=30,
+            text="Settle Proxy Bids",
+            height=2,
+            bg="lightgreen",
             font=('Arial', 12),
-            wrap=tk.WORD
+            command=self.settle_proxy_bids
         )
-        self.item_list_text.grid(row=2, column=player_list_col, rowspan=8, padx=5, pady=5, sticky="nsew")
-        for item, price in self.items:
-            item_button = tk.Button(
-                self,
-                text=f"{item} (Starting Price: ₹{price})",
-                font=('Arial', 12),
-                command=lambda item=(item, price): self.select_item(item)
-            )
-            item_button.grid(sticky="w")
-            self.item_list_text.window_create("end", window=item_button)
-            self.item_list_text.insert("end", "\n")
+        proxy_button.grid(row=16, column=1, columnspan=2, pady=10, padx=5, sticky="nsew")
+
+        # Analytics Button
+        analytics_button = tk.Button(
+            self,
+            text="Analytics",
+            height=2,
+            font=('Arial', 12),
+            command=self.show_analytics
+        )
+        analytics_button.grid(row=16, column=3, pady=10, padx=5, sticky="nsew")
+
+        # Switches the team panel between full columns and one summary row per team
+        compact_button = tk.Button(
+            self,
+            text="Compact Teams",
+            height=2,
+            font=('Arial', 12),
+            command=self.team_panel.toggle_mode
+        )
+        compact_button.grid(row=16, column=0, pady=10, padx=5, sticky="nsew")
+
+        # Auction history: step back/forward through selects, bids and sales, or jump to any step
+        step_back_button = tk.Button(
+            self,
+            text="Step Back",
+            height=2,
+            font=('Arial', 12),
+            command=self.step_back
+        )
+        step_back_button.grid(row=17, column=0, pady=10, padx=5, sticky="nsew")
+        step_forward_button = tk.Button(
+            self,
+            text="Step Forward",
+            height=2,
+            font=('Arial', 12),
+            command=self.step_forward
+        )
+        step_forward_button.grid(row=17, column=1, pady=10, padx=5, sticky="nsew")
+        go_to_button = tk.Button(
+            self,
+            text="Go To Step...",
+            height=2,
+            font=('Arial', 12),
+            command=self.go_to_step
+        )
+        go_to_button.grid(row=17, column=2, columnspan=2, pady=10, padx=5, sticky="nsew")
+        self.master.bind("<Control-z>", lambda event: self.step_back())
+        self.master.bind("<Control-y>", lambda event: self.step_forward())
+        self.master.bind("<F9>", lambda event: self.toggle_profile())
+
+        # Number of ladder steps a Bid click raises the bid by; more than one makes it a jump bid
+        jump_frame = tk.Frame(self)
+        jump_frame.grid(row=15, column=0, pady=10, padx=5, sticky="nsew")
+        tk.Label(jump_frame, text="Bid steps", font=('Arial', 12)).pack(side="top")
+        self.jump_steps = tk.Spinbox(jump_frame, from_=1, to=99, width=4, font=('Arial', 12))
+        self.jump_steps.pack(side="top")
+
+        # Player list right of the team panel and controls; only the visible rows get widgets
+        player_list_col = CONTROL_COLUMNS
+        filter_frame = tk.Frame(self)
+        filter_frame.grid(row=1, column=player_list_col, padx=5, sticky="nsew")
+        # Search-as-you-type over name words and tags; the token index is built when the box gets focus
+        self.search_entry = tk.Entry(filter_frame, width=14, font=('Arial', 12))
+        self.search_entry.pack(side="left")
+        self.search_entry.bind("<KeyRelease>", self.apply_player_filter)
+        self.search_entry.bind("<FocusIn>", lambda event: self.catalog.build_search_index())
+        self.category_filter = tk.StringVar(self, value=ALL_CATEGORIES)
+        tk.OptionMenu(filter_frame, self.category_filter, ALL_CATEGORIES, *self.catalog.categories,
+                      command=self.apply_player_filter).pack(side="left")
+        tk.Label(filter_frame, text="₹", font=('Arial', 12)).pack(side="left")
+        self.min_price_entry = tk.Entry(filter_frame, width=6, font=('Arial', 12))
+        self.min_price_entry.pack(side="left")
+        tk.Label(filter_frame, text="-", font=('Arial', 12)).pack(side="left")
+        self.max_price_entry = tk.Entry(filter_frame, width=6, font=('Arial', 12))
+        self.max_price_entry.pack(side="left")
+        for entry in (self.min_price_entry, self.max_price_entry):
+            entry.bind("<Return>", self.apply_player_filter)
+            entry.bind("<FocusOut>", self.apply_player_filter)
+        self.sort_choice = tk.StringVar(self, value="Roster order")
+        tk.OptionMenu(filter_frame, self.sort_choice, *PLAYER_SORTS,
+                      command=self.apply_player_filter).pack(side="left")
+
+        self.item_list = PlayerListView(
+            self,
+            text_for=self.item_text,
+            on_select=self.select_item,
+            font=('Arial', 12)
+        )
+        self.item_list.grid(row=2, column=player_list_col, rowspan=8, padx=5, pady=5, sticky="nsew")
+        self.item_list.set_players(self.engine.remaining)
 
         # --- Grid configuration for resizing ---
-        for i in range(16):
+        for i in range(18):
             self.rowconfigure(i, weight=1)
-        for i in range(len(self.teams)):
+        for i in range(CONTROL_COLUMNS):
             self.columnconfigure(i, weight=1)
         self.columnconfigure(player_list_col, weight=0, minsize=320)
 
+        # Label updates are batched: handlers mark what changed, one idle callback redraws it
+        self.renderer = LabelRenderer(self, self.render_status, self.render_money, self.render_inventory)
+        instruments.wrap(self.renderer, "flush", prefix="render_")
+        self.inventory_text = InventoryText(
+            lambda position, player_id, price: f"{position}. {self.engine.player_name(player_id)} (Value: ₹{price})"
+        )
+        for team_id in self.engine.team_ids():
+            self.inventory_text.rebuild(team_id, self.engine.inventory[team_id])
+        self.team_panel.refresh()
+        if self.engine.current_player != NO_PLAYER:
+            self.renderer.mark_status()
+
     # --- Excel Integration Methods ---
 
-    def setup_excel(self):
-        """Create or open an Excel workbook and add a new session sheet for this session."""
+    def setup_excel(self, session_name=None):
+        """Create the workbook of this session, holding only its own session sheet.
+
+        Each session of the day gets its own ``{auction}_{YYYYMMDD}_Session_N.xlsx``
+        listed in the day's manifest, so starting and saving a session never
+        touches earlier sessions; ``session_manifest.py`` merges them on demand.
+        When resuming, ``session_name`` names the interrupted session, whose
+        sheet is recreated and refilled from the journal.
+        """
+        # openpyxl is imported lazily so that the file picker shows up without waiting for it
+        from openpyxl import Workbook, load_workbook
+        if session_name is None:
+            session_name = self.manifest.next_session_name()
+            self.excel_filename = self.manifest.session_workbook(session_name)
+        suffix = f"_{session_name}.xlsx"
+        if self.excel_filename.endswith(suffix):
+            self.daily_stem = self.excel_filename[:-len(suffix)]
+            if self.manifest is None:
+                self.manifest = SessionManifest(self.daily_stem)
+        else:
+            # Session started before sessions had their own workbooks: it stays in the daily workbook
+            self.daily_stem = os.path.splitext(self.excel_filename)[0]
         if os.path.exists(self.excel_filename):
             self.wb = load_workbook(self.excel_filename)
-            # Find the next available session number
-            session_base = "Session"
-            session_nums = [int(re.search(rf"{session_base}_(\d+)", ws).group(1))
-                            for ws in self.wb.sheetnames if re.match(rf"{session_base}_\d+", ws)]
-            next_num = max(session_nums + [1]) + 1 if session_nums else 2
-            session_name = f"{session_base}_{next_num}"
         else:
             self.wb = Workbook()
-            session_name = "Session_1"
             # Remove default sheet if present
             if "Sheet" in self.wb.sheetnames:
                 std = self.wb["Sheet"]
                 self.wb.remove(std)
-        self.session_ws = self.wb.create_sheet(session_name)
+        instruments.wrap(self.wb, "save", prefix="workbook_")
+        self.session_name = session_name
+        if session_name in self.wb.sheetnames:
+            sheet_index = self.wb.sheetnames.index(session_name)
+            self.wb.remove(self.wb[session_name])
+            self.session_ws = self.wb.create_sheet(session_name, sheet_index)
+        else:
+            self.session_ws = self.wb.create_sheet(session_name)
         self.wb.save(self.excel_filename)
+        if self.manifest is not None:
+            self.manifest.add_session(session_name)
 
     def write_header_to_excel(self):
-        """Write auction header info, player list, and prepare StateLog in the same sheet."""
+        """Write auction header info, player list, and prepare StateLog in the same sheet.
+
+        The sheet is fresh, so the whole header is appended row by row
+        instead of being assigned one cell at a time.
+        """
         ws = self.session_ws
-        ws["A1"] = "Auction Name"
-        ws["B1"] = self.auction_name
-        ws["A2"] = "Date"
-        ws["B2"] = datetime.now().strftime("%Y-%m-%d")
-        ws["A3"] = "Time"
-        ws["B3"] = datetime.now().strftime("%H:%M:%S")
-        ws["A4"] = "Total Players"
-        ws["B4"] = len(self.items)
-
-        # Player databse header
-        ws["A6"] = "PlayerID"
-        ws["B6"] = "Player Name"
-        ws["C6"] = "Base Bid Value"
-
-        # Team info header (starting from column E)
-        ws["E6"] = "Team Name"
-        ws["F6"] = "Team ID"
-        ws["G6"] = "Starting Money"
-        ws["H6"] = "End Money"
-        # Fill player info
-        for idx, (name, base) in enumerate(self.items):
-            ws[f"A{7+idx}"] = self.player_ids[name]
-            ws[f"B{7+idx}"] = name
-            ws[f"C{7+idx}"] = base
-
-        # Fill team info
-        for idx, team in enumerate(self.teams):
-            ws[f"E{7+idx}"] = team
-            ws[f"F{7+idx}"] = self.manager_ids[team]
-            ws[f"G{7+idx}"] = self.team_money[team]  # Starting money
-            ws[f"H{7+idx}"] = self.team_money[team]  # End money (will be updated at end)
-            
+        now = datetime.now()
+        ws.append(["Auction Name", self.auction_name])
+        ws.append(["Date", now.strftime("%Y-%m-%d")])
+        ws.append(["Time", now.strftime("%H:%M:%S")])
+        ws.append(["Total Players", len(self.starting_items)])
+        ws.append([])
+
+        # Player database (columns A-C) and team info (columns E-H) share rows from row 6
+        ws.append(["PlayerID", "Player Name", "Base Bid Value", None,
+                   "Team Name", "Team ID", "Starting Money", "End Money"])
+        players = self.starting_items
+        teams = self.starting_teams
+        for idx in range(max(len(players), len(teams))):
+            row = [FIRST_PLAYER_ID + idx, players[idx][0], players[idx][1]] if idx < len(players) else [None] * 3
+            if idx < len(teams):
+                team, money = teams[idx]
+                # End money starts at the starting money and is filled in when the session closes
+                row += [None, team, FIRST_TEAM_ID + idx, money, money]
+            ws.append(row)
+
         # Leave a blank row, then start StateLog
-        self.statelog_start_row = 8 + len(self.items)
-        ws[f"A{self.statelog_start_row}"] = "Timestamp"
-        ws[f"B{self.statelog_start_row}"] = "Event"
-        ws[f"C{self.statelog_start_row}"] = "ManagerID"
-        ws[f"D{self.statelog_start_row}"] = "ManagerName"
-        ws[f"E{self.statelog_start_row}"] = "PlayerID"
-        ws[f"F{self.statelog_start_row}"] = "PlayerName"
-        ws[f"G{self.statelog_start_row}"] = "BaseBid"
-        ws[f"H{self.statelog_start_row}"] = "BidAmount"
-        ws[f"I{self.statelog_start_row}"] = "Comment"
+        ws.append([])
+        ws.append(["Timestamp", "Event", "ManagerID", "ManagerName", "PlayerID", "PlayerName", "BaseBid",
+                   "BidAmount", "Comment", "Steps", "Replaces"])
+        self.statelog_start_row = 8 + max(len(players), len(teams))
         self.next_statelog_row = self.statelog_start_row + 1
         self.wb.save(self.excel_filename)
 
-    def log_state(self, event, manager, player=None, base_bid=None, bid_amount=None, comment=""):
-        """Log an event to the StateLog section of the session sheet."""
-        ws = self.session_ws
+    def start_journal(self, resume=False):
+        """Open the session journal and hand the workbook over to the background exporter."""
+        self.journal_filename = f"{self.daily_stem}_{self.session_name}.journal"
+        self.journal = EventJournal(self.journal_filename)
+        if not resume:
+            self.journal.append({
+                "event": "SessionStart",
+                "auction_name": self.auction_name,
+                "excel_filename": self.excel_filename,
+                "session_name": self.session_name,
+                "teams": self.starting_teams,
+                "players": self.starting_items,
+                "bid_ladder": self.engine.ladder.tiers(),
+                "squad_size": self.engine.squad_size,
+            })
+        self.exporter = SessionExporter(self.wb, self.session_ws, self.excel_filename, self.journal_filename)
+        self.events_since_checkpoint = 0
+        self.events_since_snapshot = 0
+        # Set while the rows of one event are journaled, so no snapshot lands between them
+        self.journaling_batch = False
+        self.snapshot_writer = SnapshotWriter(snapshot_path(self.journal_filename))
+        self.after(CHECKPOINT_INTERVAL_MS, self.periodic_checkpoint)
+
+    def log_state(self, event, team_id=NO_TEAM, player_id=NO_PLAYER, bid_amount=None, comment="", steps=None,
+                  replaces=None):
+        """Append an event to the session journal; the StateLog sheet is filled in at checkpoints."""
+        engine = self.engine
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        manager_id = self.manager_ids.get(manager, "")
-        player_id = self.player_ids.get(player, "") if player else ""
-        ws.append([
-            timestamp, event, manager_id, manager, player_id, player, base_bid, bid_amount, comment
-        ])
-        self.wb.save(self.excel_filename)
+        record = {
+            "timestamp": timestamp,
+            "event": event,
+            "manager_id": team_id or "",
+            "manager": engine.team_names[team_id],
+            "player_id": player_id or "",
+            "player": engine.player_name(player_id) if player_id else None,
+            "base_bid": engine.base_bid(player_id) if player_id else None,
+            "bid_amount": bid_amount,
+            "comment": comment,
+        }
+        if steps is not None:
+            # Rewind and Redo records say how far they moved through the auction history
+            record["steps"] = steps
+        if replaces is not None:
+            # A selection made while other lots are open names the lot it drops
+            record["replaces"] = replaces or ""
+        self.journal.append(record)
+        self.analytics.observe(record)
+        if self.analytics_pane is not None:
+            self.analytics_pane.mark_dirty()
+        self.events_since_checkpoint += 1
+        self.events_since_snapshot += 1
+        if not self.journaling_batch:
+            self.save_when_due()
+
+    def save_when_due(self):
+        """Write the snapshot or checkpoint once enough events have been journaled since the last one."""
+        if self.events_since_snapshot >= SNAPSHOT_EVENTS:
+            self.save_snapshot()
+        if self.events_since_checkpoint >= CHECKPOINT_EVENTS:
+            self.checkpoint()
+
+    def capture_state(self):
+        """Return the current auction state as a SessionState."""
+        state = SessionState(self.auction_name, self.excel_filename, self.session_name,
+                             self.starting_teams, self.starting_items, self.engine)
+        state.seq = self.journal.seq
+        return state
+
+    def save_snapshot(self):
+        """Write a binary state snapshot so that recovery only replays the journal tail."""
+        self.journal.sync()
+        self.snapshot_writer.write(self.capture_state(), self.journal.offset)
+        self.events_since_snapshot = 0
+
+    def checkpoint(self):
+        """Sync the journal and let the exporter bring the session sheet up to date."""
+        self.journal.sync()
+        self.exporter.checkpoint()
+        self.events_since_checkpoint = 0
+
+    def periodic_checkpoint(self):
+        """Checkpoint on a timer so a quiet session still reaches the workbook."""
+        if self.journal is None:
+            return
+        if self.events_since_checkpoint:
+            self.checkpoint()
+        self.after(CHECKPOINT_INTERVAL_MS, self.periodic_checkpoint)
+
+    def close_session(self):
+        """Flush the journal and write the final session sheet, including end money."""
+        if self.journal is None:
+            return
+        self.stop_bid_server()
+        self.timer_wheel.stop()
+        self.update_end_money_in_excel()
+        self.journal.append({"event": "SessionEnd"})
+        self.journal.close()
+        self.journal = None
+        self.exporter.close()
+        if self.manifest is not None:
+            self.manifest.end_session(self.session_name)
+
+    # --- Bidding Server ---
+
+    def start_bid_server(self, host, port):
+        """Let managers bid from their own devices; this window becomes one subscriber of the server.
+
+        The server owns the authoritative engine. Its events reach the Tk
+        loop through a queue and are applied to ``self.engine`` as a replica.
+        """
+        server_engine = AuctionEngine(self.starting_teams, self.starting_items, self.engine.ladder)
+        server_engine.load_state(self.engine.to_state())
+        server_engine.set_squad_size(self.engine.squad_size)
+        AuctionHistory(server_engine)
+        self.server_events = queue.Queue()
+        self.bid_server = BidServerThread(server_engine, host, port)
+        self.bid_server.subscribe(self.server_events.put)
+        self.server_address = f"{host}:{self.bid_server.start()}"
+        self.after(EVENT_POLL_MS, self.poll_server_events)
+
+    def poll_server_events(self):
+        """Apply the events and rejections the bidding server pushed since the last poll."""
+        if self.bid_server is None:
+            return
+        while True:
+            try:
+                message = self.server_events.get_nowait()
+            except queue.Empty:
+                break
+            if message["type"] == "event":
+                apply_event(self.engine, message)
+                self.on_event(message)
+            elif message["type"] == "rejected":
+                self.on_rejected(message["command"], message["code"])
+        self.after(EVENT_POLL_MS, self.poll_server_events)
+
+    def stop_bid_server(self):
+        """Disconnect all managers and stop the server thread."""
+        if self.bid_server is not None:
+            self.bid_server.stop()
+            self.bid_server = None
 
     # --- Auction Logic Methods ---
 
-    def select_item(self, item):
-        """Select an item to start bidding on."""
-        self.toggle_bidding_enabled()
-        self.current_item = item
-        self.current_bid = item[1]
-        self.highest_bidder = None
-        self.bid_history = []
-        self.update_labels()
-        # Log event
-        self.log_state(
-            event="SelectPlayer",
-            manager="",
-            player=item[0],
-            base_bid=item[1],
-            comment="Player selected for auction"
-        )
+    def dispatch(self, command):
+        """Run a command locally, or queue it on the bidding server behind the managers' bids."""
+        if self.bid_server is not None:
+            self.bid_server.submit(command, self.server_events.put)
+            return
+        result, event = execute(self.engine, command)
+        if event is not None:
+            self.on_event(event)
+        elif result != OK:
+            self.on_rejected(command, result)
+
+    def select_item(self, player_id):
+        """Select an item to start bidding on, next to the open lots if parallel lots are on."""
+        if player_id in self.engine.lots:
+            self.focus_lot(player_id)
+            return
+        self.dispatch({"type": "open" if self.parallel_lots.get() else "select", "player_id": player_id})
+
+    def focus_lot(self, player_id):
+        """Make an open lot the one the display and the bid buttons act on."""
+        self.dispatch({"type": "focus", "player_id": player_id})
 
     def place_bid(self, team):
-        """Handle a bid placed by a team."""
-        if self.bidding_enabled and self.current_item and self.team_money[team] >= int(self.current_bid):
-            if self.highest_bidder != team:
-                if self.highest_bidder is None:
-                    next_bid = self.current_bid
-                else:
-                    # Determine bid increment based on current bid value
-                    if int(self.current_bid) < 50:
-                        bid_increment = 0
-                    elif int(self.current_bid) < 100:
-                        bid_increment = 5
-                    elif int(self.current_bid) < 200:
-                        bid_increment = 10
-                    else:
-                        bid_increment = 25
-
-                    next_bid = self.current_bid + bid_increment
-
-                # Check if team has enough money for the next bid
-                if self.team_money[team] < next_bid:
-                    messagebox.showinfo(
-                        "Bid Rejected",
-                        f"{team} does not have enough money to place this bid."
-                    )
-                    return
-
-                # Record bid history for undo functionality
-                self.bid_history.append((self.highest_bidder, self.current_bid))
-                self.current_bid = next_bid
-                self.highest_bidder = team
-                self.update_labels()
-                # Log bid event
-                self.log_state(
-                    event="Bid",
-                    manager=team,
-                    player=self.current_item[0],
-                    base_bid=self.current_item[1],
-                    bid_amount=self.current_bid,
-                    comment=f"Manager {team} bid for player {self.current_item[0]}"
-                )
+        """Handle a bid placed by a team, jumping ahead when more than one bid step is set."""
+        try:
+            steps = int(self.jump_steps.get())
+        except ValueError:
+            steps = 1
+        if steps > 1:
+            self.jump_bid(team, steps)
+        else:
+            self.dispatch({"type": "bid", "manager_id": self.manager_ids[team],
+                           "player_id": self.engine.current_player})
+
+    def jump_bid(self, team, steps):
+        """Raise the bid by ``steps`` ladder steps in one go on behalf of a team."""
+        self.dispatch({"type": "jump", "manager_id": self.manager_ids[team], "steps": steps,
+                       "player_id": self.engine.current_player})
 
     def undo_last_bid(self):
         """Undo the last bid placed."""
-        if self.bid_history:
-            previous_bidder, previous_bid = self.bid_history.pop()
-            self.current_bid = previous_bid
-            self.highest_bidder = previous_bidder
+        self.dispatch({"type": "undo", "player_id": self.engine.current_player})
+
+    def end_bidding_round(self):
+        """End the current bidding round and assign the item to the highest bidder."""
+        self.dispatch({"type": "sell", "player_id": self.engine.current_player})
+
+    def step_back(self):
+        """Revert the last select, bid or sale of the auction."""
+        if self.engine.history.position == 0:
+            self.complete_history()
+        self.dispatch({"type": "rewind", "steps": 1})
+
+    def step_forward(self):
+        """Redo the last reverted step of the auction."""
+        self.dispatch({"type": "redo", "steps": 1})
+
+    def go_to_step(self):
+        """Ask for a point in the auction history and move there in one go."""
+        self.complete_history()
+        history = self.engine.history
+        step = simpledialog.askinteger(
+            "Go To Step",
+            f"Step of the auction to go to (0-{len(history)}, now at {history.position}):",
+            minvalue=0,
+            maxvalue=len(history),
+            parent=self
+        )
+        if step is None or step == history.position:
+            return
+        if step < history.position:
+            self.dispatch({"type": "rewind", "steps": history.position - step})
+        else:
+            self.dispatch({"type": "redo", "steps": step - history.position})
+
+    def complete_history(self):
+        """Bring back the history from before the snapshot a session was resumed from.
+
+        With a bidding server the history is the server's, which starts
+        when the server does, so it is left alone.
+        """
+        if self.history_complete or self.bid_server is not None:
+            return
+        self.history_complete = True
+        if not restore_history(self.engine, self.journal_filename):
+            self.notify("Step Back", "The steps from before the session was resumed could not be rebuilt.")
+
+    def ask_proxy_ceiling(self, team):
+        """Ask for the most a team will pay for the current player; 0 withdraws its proxy bid."""
+        player_id = self.engine.current_player
+        if player_id == NO_PLAYER:
+            return
+        ceiling = simpledialog.askinteger(
+            "Proxy Bid",
+            f"Maximum bid of {team} for {self.engine.player_name(player_id)} (0 to withdraw):",
+            minvalue=0,
+            parent=self
+        )
+        if ceiling is not None:
+            self.dispatch({"type": "proxy", "manager_id": self.manager_ids[team], "player_id": player_id,
+                           "ceiling": ceiling})
+
+    def settle_proxy_bids(self):
+        """Settle the proxy ceilings registered for the current player in one step."""
+        self.dispatch({"type": "resolve", "player_id": self.engine.current_player})
+
+    def on_event(self, event):
+        """Update the display and the journal for an event that has been applied to ``self.engine``."""
+        engine = self.engine
+        kind = event["event"]
+        team_id = event["manager_id"]
+        player_id = event["player_id"]
+        self.renderer.mark_status()
+        if engine.current_player != self.shown_lot:
+            # Another open lot is now the active one. Which bids are reserved, and so every team's
+            # money and limits, changes with it
+            self.shown_lot = engine.current_player
             self.update_labels()
+        # Any bid, undo, sale or rewind restarts (or stops) the countdown to the automatic close
+        self.restart_countdown()
+        if engine.squad_size and kind in ("SelectPlayer", "OpenLot", "Bought"):
+            # Every team's maximum safe bid moves when the player on offer or the unsold pool changes
+            for other_id in engine.team_ids():
+                self.renderer.mark_team(other_id, inventory=False)
+        if kind == "SelectPlayer":
+            # Log event
+            self.log_state(
+                event="SelectPlayer",
+                player_id=player_id,
+                comment="Player selected for auction",
+                replaces=event.get("replaces")
+            )
+        elif kind == "OpenLot":
+            self.log_state(
+                event="OpenLot",
+                player_id=player_id,
+                comment="Lot opened next to the other open lots"
+            )
+        elif kind == "FocusLot":
+            self.log_state(
+                event="FocusLot",
+                player_id=player_id,
+                comment="Lot made the active one"
+            )
+        elif kind == "Bid":
+            if "first_bid" not in startup_timer.marks:
+                startup_timer.mark("first_bid")
+                startup_timer.print_report()
+            # Log bid event
+            self.log_state(
+                event="Bid",
+                team_id=team_id,
+                player_id=player_id,
+                bid_amount=event["bid_amount"],
+                comment=f"Manager {engine.team_names[team_id]} bid for player {engine.player_name(player_id)}"
+            )
+        elif kind == "ProxyBids":
+            # Each bid the proxies placed becomes its own StateLog row. The engine already holds
+            # the whole batch, so a snapshot taken between the rows would be replayed onto twice
+            self.journaling_batch = True
+            try:
+                for team_id, amount in event["bids"]:
+                    self.log_state(
+                        event="Bid",
+                        team_id=team_id,
+                        player_id=player_id,
+                        bid_amount=amount,
+                        comment=f"Proxy bid of manager {engine.team_names[team_id]} for player "
+                                f"{engine.player_name(player_id)}"
+                    )
+            finally:
+                self.journaling_batch = False
+            self.save_when_due()
+        elif kind == "UndoBid":
             # Log undo event
             self.log_state(
                 event="UndoBid",
-                manager=previous_bidder if previous_bidder else "",
-                player=self.current_item[0] if self.current_item else "",
-                base_bid=self.current_item[1] if self.current_item else "",
-                bid_amount=previous_bid,
+                team_id=team_id,
+                player_id=player_id,
+                bid_amount=event["bid_amount"],
                 comment="Undo last bid"
             )
-        else:
-            messagebox.showinfo(
-                "Undo",
-                "No previous bid to undo."
-            )
-
-    def end_bidding_round(self):
-        """End the current bidding round and assign the item to the highest bidder."""
-        if self.bidding_enabled and self.highest_bidder:
-            item_name, item_value = self.current_item
-            # Deduct bid amount from winning team's money and add item to their inventory
-            self.team_money[self.highest_bidder] -= int(self.current_bid)
-            self.team_inventory[self.highest_bidder][item_name] = int(self.current_bid)
-            self.remove_current_item()
-            messagebox.showinfo(
-                "Auction Result",
-                f"{self.highest_bidder} won {item_name} for ₹{self.current_bid}!"
+        elif kind in ("Rewind", "Redo"):
+            # Any number of rounds and sales may have changed: resync the views with the engine
+            self.sync_with_engine()
+            self.log_state(
+                event=kind,
+                team_id=team_id,
+                player_id=player_id,
+                bid_amount=event["bid_amount"],
+                comment=f"{'Stepped back' if kind == 'Rewind' else 'Redid'} {event['steps']} step(s)",
+                steps=event["steps"]
             )
-            self.toggle_bidding_disabled()
-            self.update_labels()
+        elif kind == "Bought":
+            winner = engine.team_names[team_id]
+            item_name = engine.player_name(player_id)
+            self.remove_sold_item(player_id)
+            self.inventory_text.append(team_id, player_id, event["bid_amount"])
+            self.renderer.mark_team(team_id)
             # Log bought event
             self.log_state(
                 event="Bought",
-                manager=self.highest_bidder,
-                player=item_name,
-                base_bid=item_value,
-                bid_amount=self.current_bid,
-                comment=f"Manager {self.highest_bidder} bought player {item_name}"
+                team_id=team_id,
+                player_id=player_id,
+                bid_amount=event["bid_amount"],
+                comment=f"Manager {winner} bought player {item_name}"
             )
-        else:
-            messagebox.showinfo(
+            self.notify(
                 "Auction Result",
-                "No bids were placed in this round."
+                f"{winner} won {item_name} for ₹{event['bid_amount']}!",
+                kind="success"
             )
 
-    def remove_current_item(self):
-        """Remove the current item from the list after it is won."""
-        if self.current_item in self.items:
-            self.items.remove(self.current_item)
-        self.item_list_text.config(state=tk.NORMAL)
-        self.item_list_text.delete("1.0", tk.END)
-        for item, price in self.items:
-            item_button = tk.Button(
-                self,
-                text=f"{item} (Starting Price: ₹{price})",
-                font=('Arial', 12),
-                command=lambda item=(item, price): self.select_item(item)
+    def on_rejected(self, command, result):
+        """Tell the operator, without blocking input, why one of their commands was not applied."""
+        if result in (INSUFFICIENT_FUNDS, SQUAD_BUDGET) and command["type"] == "undo":
+            self.notify(
+                "Undo",
+                "The previous bidder's other leading bids no longer leave room for that bid."
+            )
+        elif result == INSUFFICIENT_FUNDS:
+            self.notify(
+                "Bid Rejected",
+                f"{self.engine.team_names[command['manager_id']]} does not have enough money to place this bid."
+            )
+        elif result == SQUAD_BUDGET:
+            self.notify(
+                "Bid Rejected",
+                f"{self.engine.team_names[command['manager_id']]} must keep enough money to fill its squad."
+            )
+        elif result == NOTHING_TO_UNDO and command["type"] == "rewind":
+            self.notify(
+                "Step Back",
+                "The auction history has no step to go back to."
+            )
+        elif result == NOTHING_TO_REDO:
+            self.notify(
+                "Step Forward",
+                "No reverted step to redo."
             )
-            item_button.grid(sticky="w")
-            self.item_list_text.window_create("end", window=item_button)
-            self.item_list_text.insert("end", "\n")
-        self.item_list_text.config(state=tk.DISABLED)
+        elif result == NOTHING_TO_UNDO:
+            self.notify(
+                "Undo",
+                "No previous bid to undo."
+            )
+        elif result == BIDDING_CLOSED and command["type"] == "undo":
+            self.notify(
+                "Undo",
+                "The round is closed; use Step Back to take back a sale."
+            )
+        elif result == BIDDING_CLOSED and command["type"] in ("select", "open"):
+            self.notify(
+                "Select Player",
+                "That player has already been sold."
+            )
+        elif result == NO_BIDS and command["type"] == "resolve":
+            self.notify(
+                "Proxy Bids",
+                "No proxy ceiling beats the current bid."
+            )
+        elif result == NO_BIDS:
+            self.notify(
+                "Auction Result",
+                "No bids were placed in this round."
+            )
+
+    def toggle_profile(self):
+        """Start or pause the cProfile capture; it is saved with the instrumentation report on close."""
+        running = instruments.toggle_profile()
+        self.notify("Profiler", "capturing" if running else "paused", kind="info")
+
+    def notify(self, title, text, kind="warning"):
+        """Show a toast that goes away on its own, instead of a modal message box."""
+        self.toasts.show(f"{title}: {text}", kind)
+
+    def announce_call(self, call):
+        """Announce a countdown call on the current lot, e.g. "Going once"."""
+        engine = self.engine
+        self.notify(call, f"{engine.player_name(engine.current_player)} to "
+                          f"{engine.team_names[engine.highest_bidder]} for ₹{engine.current_bid}", kind="info")
+
+    def restart_countdown(self):
+        """Restart the round countdown if a round with a bid is open, or stop it otherwise."""
+        if self.countdown is None:
+            return
+        engine = self.engine
+        if engine.bidding_enabled and engine.highest_bidder != NO_TEAM:
+            self.countdown.reset()
+        else:
+            self.countdown.stop()
+
+    def sync_with_engine(self):
+        """Bring the player list, inventories and labels in line with the engine after a rewind or redo."""
+        engine = self.engine
+        for player_id in [player_id for player_id in self.catalog.players if player_id not in engine.remaining]:
+            self.catalog.remove(player_id)
+        for player_id in engine.remaining:
+            self.catalog.add(player_id)
+        self.apply_player_filter()
+        for team_id in engine.team_ids():
+            self.inventory_text.rebuild(team_id, engine.inventory[team_id])
+        self.analytics.rebuild(engine)
+        self.update_labels()
+
+    def show_analytics(self):
+        """Open the live analytics window, or raise it if it is already open."""
+        if self.analytics_pane is not None:
+            self.analytics_pane.lift()
+            return
+        self.analytics_pane = AnalyticsPane(self.master, self.analytics, self.engine.player_name)
+        self.analytics_pane.protocol("WM_DELETE_WINDOW", self.close_analytics)
+
+    def close_analytics(self):
+        """Close the analytics window."""
+        if self.analytics_pane is not None:
+            self.analytics_pane.destroy()
+            self.analytics_pane = None
+
+    def apply_player_filter(self, *args):
+        """Show the unsold players that match the filter bar, in the chosen order."""
+        category = self.category_filter.get()
+        order, descending = PLAYER_SORTS[self.sort_choice.get()]
+        self.item_list.set_players(self.catalog.query(
+            category=None if category == ALL_CATEGORIES else category,
+            min_price=self._price_filter(self.min_price_entry),
+            max_price=self._price_filter(self.max_price_entry),
+            order=order,
+            descending=descending,
+            text=self.search_entry.get()
+        ))
+
+    def _price_filter(self, entry):
+        try:
+            return int(entry.get().strip())
+        except ValueError:
+            return None
+
+    def remove_sold_item(self, player_id):
+        """Take a sold player off the catalog and the player list."""
+        self.catalog.remove(player_id)
+        self.item_list.remove(player_id)
+
+    def item_text(self, player_id):
+        """Return the player list text of a player."""
+        engine = self.engine
+        return f"{engine.player_name(player_id)} (Starting Price: ₹{engine.base_bid(player_id)})"
 
     def update_labels(self):
-        """Update all labels to reflect the current auction state."""
-        if self.current_item:
+        """Schedule a redraw of all labels to reflect the current auction state."""
+        self.renderer.mark_all(self.engine.team_ids())
+
+    def render_status(self):
+        """Update the current item and bidding status labels."""
+        engine = self.engine
+        if engine.current_player != NO_PLAYER:
             self.current_item_label.config(
-                text=f"Current Item: {self.current_item[0]} (Starting Price: ₹{self.current_item[1]})"
+                text=f"Current Item: {engine.player_name(engine.current_player)} "
+                     f"(Starting Price: ₹{engine.base_bid(engine.current_player)})"
             )
-            if self.highest_bidder:
+            if engine.highest_bidder != NO_TEAM:
                 self.bid_status_label.config(
-                    text=f"Current Highest Bid: ₹{self.current_bid} by {self.highest_bidder}"
+                    text=f"Current Highest Bid: ₹{engine.current_bid} by {engine.team_names[engine.highest_bidder]}"
                 )
             else:
                 self.bid_status_label.config(
                     text=f"No bids placed yet"
                 )
-            for team in self.teams:
-                # Update money label for each team
-                self.money_labels[team].config(
-                    text=f"{team} \nMoney: ₹{self.team_money[team]}"
-                )
-                # Update the inventory list label
-                inventory_text = "\n".join(
-                    [f"{idx+1}. {item} (Value: ₹{bid_price})"
-                     for idx, (item, bid_price) in enumerate(self.team_inventory[team].items())]
-                )
-                self.inventory_list_labels[team].config(
-                    text=inventory_text,
-                    wraplength=200,
-                    justify="center",
-                    anchor="n"
-                )
         else:
             self.current_item_label.config(
                 text="No items available for auction"
             )
+        self.render_bid_buttons()
+        self.render_lots()
+
+    def render_lots(self):
+        """Show one button per open lot, the active one sunken."""
+        engine = self.engine
+        lots = engine.open_lots()
+        while len(self.lot_buttons) < len(lots):
+            self.lot_buttons.append(tk.Button(self.lot_buttons_frame, font=('Arial', 10)))
+        for button, lot in zip(self.lot_buttons, lots):
+            player_id, bid, leader = lot
+            leading = f"₹{bid} {engine.team_names[leader]}" if leader != NO_TEAM else "no bids"
+            button.config(
+                text=f"{engine.player_name(player_id)}: {leading}",
+                relief="sunken" if player_id == engine.current_player else "raised",
+                command=lambda player_id=player_id: self.focus_lot(player_id)
+            )
+            button.pack(side="left", padx=2)
+        for button in self.lot_buttons[len(lots):]:
+            button.pack_forget()
+
+    def render_bid_buttons(self):
+        """Grey out the Bid buttons in view of teams that cannot make the next bid."""
+        self.team_panel.refresh_bid_buttons()
 
-    def toggle_bidding_enabled(self):
-        """Enable bidding for the current round."""
-        self.bidding_enabled = 1
+    def can_bid(self, team_id):
+        """Return whether a team can make the next bid on the active lot."""
+        engine = self.engine
+        return engine.bidding_enabled and engine.available(team_id) >= engine.next_bid()
 
-    def toggle_bidding_disabled(self):
-        """Disable bidding after a round ends."""
-        self.bidding_enabled = 0
+    def render_money(self, team_id):
+        """Update the money shown for one team, if it is in view."""
+        self.team_panel.refresh_money(team_id)
+
+    def render_inventory(self, team_id):
+        """Update the inventory shown for one team, if it is in view."""
+        self.team_panel.refresh_inventory(team_id)
+
+    def money_text(self, team_id):
+        """Return the money label text of one team, with its maximum safe bid when squads are enforced."""
+        engine = self.engine
+        text = f"{engine.team_names[team_id]} \nMoney: ₹{engine.money[team_id]}"
+        if engine.reserved[team_id]:
+            text += f"\nHeld on other lots: ₹{engine.reserved[team_id]}"
+        if engine.squad_size:
+            limit = engine.bid_limits[team_id]
+            text += f"\nMax Bid: ₹{engine.max_safe_bid(team_id)}" if limit >= 0 else "\nSquad Full"
+        return text
+
+    def team_summary(self, team_id):
+        """Return the summary table row of one team."""
+        engine = self.engine
+        if not engine.squad_size:
+            max_bid = "-"
+        elif engine.bid_limits[team_id] >= 0:
+            max_bid = f"₹{engine.max_safe_bid(team_id)}"
+        else:
+            max_bid = "Squad Full"
+        return (engine.team_names[team_id], f"₹{engine.money[team_id]}", max_bid, len(engine.inventory[team_id]))
 
     def update_end_money_in_excel(self):
         """Update the End Money column for each team in the Excel header."""
-        ws = self.session_ws
-        for idx, team in enumerate(self.teams):
-            ws[f"H{7+idx}"] = self.team_money[team]
-        self.wb.save(self.excel_filename)
+        self.exporter.set_end_money(self.engine.money[self.manager_ids[team]] for team in self.teams)
 
 def main():
+    parser = argparse.ArgumentParser(description="Auction Manager")
+    parser.add_argument("--resume", metavar="JOURNAL",
+                        help="resume an interrupted session by replaying its journal")
+    parser.add_argument("--startup-timing", action="store_true",
+                        help="print import, first-paint and load-to-first-bid timings")
+    parser.add_argument("--ladder", metavar="FILE",
+                        help="JSON file of [bid from, increment] tiers replacing the standard bid ladder")
+    parser.add_argument("--squad-size", type=int, default=0, metavar="N",
+                        help="players every team must be able to buy; bids that would prevent it are refused")
+    parser.add_argument("--countdown", type=float, default=0, metavar="SECONDS",
+                        help="seconds between the \"going once\", \"going twice\" and \"sold\" calls "
+                             "that close a round on their own; every bid restarts the count")
+    parser.add_argument("--instrument", nargs="?", const=DEFAULT_REPORT, metavar="FILE",
+                        help="record latency histograms of the hot paths and write them to FILE on close "
+                             f"(default {DEFAULT_REPORT}); F9 toggles a cProfile capture saved next to it")
+    parser.add_argument("--profile", action="store_true",
+                        help="start the cProfile capture at launch instead of on F9")
+    parser.add_argument("--compact-teams", action="store_true",
+                        help="start with the team panel as a summary table, e.g. for leagues with many teams")
+    parser.add_argument("--serve", metavar="HOST:PORT",
+                        help="accept bids from managers' devices through a bidding server, e.g. 0.0.0.0:8765")
+    args = parser.parse_args()
+    startup_timer.enabled = args.startup_timing
+    instruments.enabled = args.instrument is not None
+    if args.instrument:
+        instruments.output = args.instrument
+    if args.profile:
+        instruments.toggle_profile()
+
     root = tk.Tk()
     root.title("Auction Manager")
+    session = {}
+    ladder = load_ladder(args.ladder) if args.ladder else None
+    serve = None
+    if args.serve:
+        host, _, port = args.serve.rpartition(":")
+        serve = (host or "127.0.0.1", int(port))
 
-    def start_auction(teams_df, players_df):
+    def start_auction(roster, resume_state=None):
         for widget in root.winfo_children():
             widget.destroy()
-        app = AuctionApp(root, teams_df, players_df)
+        app = AuctionApp(root, roster, resume_state=resume_state, serve=serve, ladder=ladder,
+                         squad_size=args.squad_size, countdown=args.countdown,
+                         compact_teams=args.compact_teams)
         app.pack(fill="both", expand=True)
+        session["app"] = app
+        startup_timer.mark("auction_ready")
 
+    def on_close():
+        if "app" in session:
+            session["app"].close_session()
+        startup_timer.print_report()
+        for path in instruments.save():
+            print(f"Wrote {path}")
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
     file_page = FileSelectPage(root, start_auction)
     file_page.pack(fill="both", expand=True)
+    file_page.bind("<Map>", lambda event: root.after_idle(startup_timer.mark, "first_paint"), add="+")
+    prewarm_imports(*PREWARM_MODULES)
+
+    resume_journal = args.resume
+    if resume_journal is None:
+        unfinished = find_unfinished_sessions(DEFAULT_AUCTION_NAME)
+        if unfinished and messagebox.askyesno(
+            "Resume Session",
+            f"An interrupted session was found:\n{unfinished[0]}\n\nResume it?"
+        ):
+            resume_journal = unfinished[0]
+    if resume_journal:
+        try:
+            start_auction(None, recover_session(resume_journal))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to resume session: {e}")
     root.mainloop()
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
+from auction_engine import AuctionEngine, INSUFFICIENT_FUNDS, NO_PLAYER, NO_TEAM, OK
+from notifications import TimerWheel, ToastArea
+from player_list import PlayerListView
+from render import InventoryText, LabelRenderer
 
 class AuctionApp:
     def __init__(self, master):
@@ -7,9 +10,8 @@ class AuctionApp:
         master.title("Auction")
 
         self.teams = ["KAISER SQUADRA", "the minions", "Flat is Justice", "Team BKL(Bahut Khas Log)"]
-        self.team_money = {team: 1000 for team in self.teams}  # Starting money for each team
-        self.team_inventory = {team: {} for team in self.teams}  # Inventory for each team
-        self.items = [("Neel Gajjar (Q15)", 120), ("Neha (Q17)", 50), ("Vishal Sai Vetrivel (Q15)", 75),
+        team_money = {team: 1000 for team in self.teams}  # Starting money for each team
+        items = [("Neel Gajjar (Q15)", 120), ("Neha (Q17)", 50), ("Vishal Sai Vetrivel (Q15)", 75),
                       ("Sailesh Kumar Mahanta (Q15)", 75), ("Akshat Sharma (Q13)", 100),
                       ("Chanderpal (Q15)", 75), ("Ankit Gautam (Q16)", 75), ("Pratik Singh (Q15)", 50),
                       ("Sangram Tudu (Q16)", 75), ("Abhijit Jeffy (Q17)", 50), ("Manan Rawat (Q14)", 100),
@@ -19,19 +21,16 @@ class AuctionApp:
                       ("Atharva Raj (Q17)", 50), ("Rajeshwar Sahu (Q17)", 50), ("Parul (Q13)", 100),
                       ("Yashobanta Sahu (Q16)", 50)]
 
-        self.current_item = None
-        self.current_bid = 0
-        self.highest_bidder = None
+        # Auction rules and state live in the engine, keyed by team/player ID
+        self.engine = AuctionEngine([(team, team_money[team]) for team in self.teams], items)
+        self.manager_ids = {team: i+1 for i, team in enumerate(self.teams)}
         self.separator_lines = []
-        self.bidding_enabled = True  # Flag to control bidding process
-
-        self.bid_history = []  # Stack to store previous bid states
 
         # Create labels for each team's money and inventory
         self.money_labels = {}
         self.inventory_labels = {}
         for i, team in enumerate(self.teams):
-            money_label = tk.Label(master, text=f"{team} \n Money: ₹{self.team_money[team]}", font=('Arial', 12,'bold'))
+            money_label = tk.Label(master, text=f"{team} \n Money: ₹{team_money[team]}", font=('Arial', 12,'bold'))
             money_label.grid(row=2, column=i, pady=5, padx=5, sticky="ew")
             self.money_labels[team] = money_label
 
@@ -49,128 +48,103 @@ class AuctionApp:
         self.bid_status_label = tk.Label(master, text="Bidding Status: ", font=('Arial', 14))
         self.bid_status_label.grid(row=1, column=0, columnspan=2, pady=10, padx=5, sticky="w")
 
-        # Undo Button
+        # Undo button and player list go right of the last team column
+        side_col = len(self.teams)
         self.undo_button = tk.Button(master, text="Undo", width=12, height=2, bg="orange", font=('Arial', 12), command=self.undo_last_bid, )
-        self.undo_button.grid(row=15, column=4, columnspan=1, pady=10, padx=5, sticky="nsew")
+        self.undo_button.grid(row=15, column=side_col, columnspan=1, pady=10, padx=5, sticky="nsew")
 
         # Display items along with starting prices
-        self.item_list_text = scrolledtext.ScrolledText(master, width=30, height=30, font=('Arial', 12), wrap=tk.WORD)
-        self.item_list_text.grid(row=2, column=4, rowspan=6, columnspan=2, padx=5, pady=5, sticky="sew")
-        for item, price in self.items:
-            item_button = tk.Button(master, text=f"{item} (Starting Price: ₹{price})", font=('Arial', 12),
-                                    command=lambda item=(item, price): self.select_item(item))
-            item_button.grid(sticky="w")
-            self.item_list_text.window_create("end", window=item_button)
-            self.item_list_text.insert("end", "\n")
+        self.item_list = PlayerListView(master, text_for=self.item_text, on_select=self.select_item, font=('Arial', 12))
+        self.item_list.grid(row=2, column=side_col, rowspan=6, columnspan=2, padx=5, pady=5, sticky="nsew")
+        self.item_list.set_players(self.engine.remaining)
 
         # Button to end bidding round
         end_bidding_button = tk.Button(master, text="End Bidding Round", height=2, bg="red", font=('Arial', 12), command=self.end_bidding_round)
         end_bidding_button.grid(row=15, column=1, columnspan=2, pady=10, padx=5, sticky="nsew")
 
+        # Only the widgets marked as changed are redrawn, once per idle cycle
+        self.renderer = LabelRenderer(master, self.render_status, self.render_money, self.render_inventory)
+        self.inventory_text = InventoryText(
+            lambda position, player_id, price: f"{self.engine.player_name(player_id)} (Value: ₹{price})")
+
+        # Results and rejections are shown as toasts, so bidding is never blocked by a dialog
+        self.timer_wheel = TimerWheel(master)
+        self.toasts = ToastArea(master, self.timer_wheel)
+        self.toasts.place(relx=1.0, rely=1.0, anchor="se", x=-10, y=-10)
+
         # Set row and column weights for resizing
         for i in range(9):
             master.rowconfigure(i, weight=1)
-        for i in range(6):
+        for i in range(side_col + 2):
             master.columnconfigure(i, weight=1)
 
-    def select_item(self, item):
-        self.toggle_bidding_enabled()
-        self.current_item = item
-        self.current_bid = item[1]  # Set current bid to the starting price of the selected item
-        self.highest_bidder = None
-        self.update_labels()
+    def select_item(self, player_id):
+        self.engine.select(player_id)
+        self.renderer.mark_status()
 
     def place_bid(self, team):
-        if self.bidding_enabled and self.current_item and self.team_money[team] >= int(self.current_bid):
-            if self.highest_bidder != team:  # Only allow a bid from a different team
-                if self.highest_bidder is None:  # Base price, no increment for the first bid
-                    next_bid = self.current_bid
-                else:
-                    # Increment logic based on current bid
-                    if int(self.current_bid) < 50:
-                        bid_increment = 0  # No increment for bids below 50
-                    elif int(self.current_bid) < 100:
-                        bid_increment = 5  # Increment by 5 for bids between 50-100
-                    elif int(self.current_bid) < 200:
-                        bid_increment = 10  # Increment by 10 for bids between 100-200
-                    else:
-                        bid_increment = 25  # Increment by 25 for bids above 200
-                    
-                    next_bid = self.current_bid + bid_increment  # Calculate the next bid amount
-
-                # Check if the team has enough money to place this bid
-                if self.team_money[team] < next_bid:
-                    messagebox.showinfo("Bid Rejected", f"{team} does not have enough money to place this bid.")
-                    return  # Stop execution if the team can't afford the bid
-
-                self.bid_history.append((self.highest_bidder, self.current_bid)) # Save current bid state before updating
-                self.current_bid = next_bid
-                self.highest_bidder = team
-                self.update_labels()
+        team_id = self.manager_ids[team]
+        result = self.engine.bid(team_id)  # Engine applies the increment rules
+        # A team that cannot even match the current bid is ignored; only a missed increment is reported
+        if result == INSUFFICIENT_FUNDS and self.engine.available(team_id) >= self.engine.current_bid:
+            self.notify("Bid Rejected", f"{team} does not have enough money to place this bid.")
+        elif result == OK:
+            self.renderer.mark_status()
 
     def undo_last_bid(self):
         """Restores the last bid before the most recent one."""
-        if self.bid_history:
-            previous_bidder, previous_bid = self.bid_history.pop()
-
-            # Restore previous bid state
-            self.current_bid = previous_bid
-            self.highest_bidder = previous_bidder
-            self.update_labels()
+        if self.engine.undo() == OK:
+            self.renderer.mark_status()
         else:
-            messagebox.showinfo("Undo", "No previous bid to undo.")
+            self.notify("Undo", "No previous bid to undo.")
 
     def end_bidding_round(self):
-        if self.bidding_enabled and self.highest_bidder:
-            item_name, item_value = self.current_item
-            self.team_money[self.highest_bidder] -= int(self.current_bid)
-            self.team_inventory[self.highest_bidder][item_name] = int(self.current_bid)
+        engine = self.engine
+        if engine.sell() == OK:  # Deducts the money and adds the item to the winner's inventory
             self.remove_current_item()  # Remove the current item from the items list
-            messagebox.showinfo("Auction Result", f"{self.highest_bidder} won {item_name} for ₹{self.current_bid}!")
-            self.toggle_bidding_disabled()  # Disable bidding until a new item is selected
-            self.update_labels()
+            self.inventory_text.append(engine.highest_bidder, engine.current_player, engine.current_bid)
+            self.renderer.mark_team(engine.highest_bidder)
+            self.renderer.mark_status()
+            self.notify("Auction Result", f"{engine.team_names[engine.highest_bidder]} won "
+                                          f"{engine.player_name(engine.current_player)} for ₹{engine.current_bid}!",
+                        kind="success")
         else:
-            messagebox.showinfo("Auction Result", "No bids were placed in this round.")
+            self.notify("Auction Result", "No bids were placed in this round.")
+
+    def notify(self, title, text, kind="warning"):
+        """Show a toast that goes away on its own, instead of a modal message box."""
+        self.toasts.show(f"{title}: {text}", kind)
+
+    def item_text(self, player_id):
+        return f"{self.engine.player_name(player_id)} (Starting Price: ₹{self.engine.base_bid(player_id)})"
 
     def remove_current_item(self):
-        if self.current_item in self.items:
-            self.items.remove(self.current_item)
-        # Clear the existing text in the item list widget
-        self.item_list_text.config(state=tk.NORMAL)
-        self.item_list_text.delete("1.0", tk.END)
-        # Insert the updated items list
-        for item, price in self.items:
-            item_button = tk.Button(self.master, text=f"{item} (Starting Price: ₹{price})", font=('Arial', 12),
-                                    command=lambda item=(item, price): self.select_item(item))
-            item_button.grid(sticky="w")
-            self.item_list_text.window_create("end", window=item_button)
-            self.item_list_text.insert("end", "\n")
-        self.item_list_text.config(state=tk.DISABLED)
+        # Drop only the sold player's row from the list
+        self.item_list.remove(self.engine.current_player)
 
     def update_labels(self):
-        if self.current_item:
+        self.renderer.mark_all(self.engine.team_ids())
+
+    def render_status(self):
+        engine = self.engine
+        if engine.current_player != NO_PLAYER:
             self.current_item_label.config(
-                text=f"Current Item: {self.current_item[0]} (Starting Price: ₹{self.current_item[1]})")
-            if self.highest_bidder:
+                text=f"Current Item: {engine.player_name(engine.current_player)} (Starting Price: ₹{engine.base_bid(engine.current_player)})")
+            if engine.highest_bidder != NO_TEAM:
                 self.bid_status_label.config(
-                    text=f"Current Highest Bid: ₹{self.current_bid} by {self.highest_bidder}")
+                    text=f"Current Highest Bid: ₹{engine.current_bid} by {engine.team_names[engine.highest_bidder]}")
             else:
                 self.bid_status_label.config(text=f"No bids placed yet")
-            for team in self.teams:
-                # Update money label
-                self.money_labels[team].config(text=f"{team} \n Money: ₹{self.team_money[team]}")
-                # Update inventory label
-                inventory_text = "\n".join(
-                    [f"{item} (Value: ₹{bid_price})" for item, bid_price in self.team_inventory[team].items()])
-                self.inventory_labels[team].config(text=f"{team} \n Inventory:\n{inventory_text}")
         else:
             self.current_item_label.config(text="No items available for auction")
 
-    def toggle_bidding_enabled(self):
-        self.bidding_enabled = 1
-        
-    def toggle_bidding_disabled(self):
-        self.bidding_enabled = 0
+    def render_money(self, team_id):
+        team = self.engine.team_names[team_id]
+        self.money_labels[team].config(text=f"{team} \n Money: ₹{self.engine.money[team_id]}")
+
+    def render_inventory(self, team_id):
+        team = self.engine.team_names[team_id]
+        self.inventory_labels[team].config(text=f"{team} \n Inventory:\n{self.inventory_text.get(team_id)}")
 
 if __name__ == "__main__":
     root = tk.Tk()
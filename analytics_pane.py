@@ -0,0 +1,82 @@
+import tkinter as tk
+
+from team_panel import ROW_HEIGHT, TABLE, TeamPanelView
+
+# Minimum time between two redraws of the pane while events keep arriving
+REFRESH_MS = 250
+# Players listed under "Most contested"
+CONTESTED_ROWS = 5
+TEAM_COLUMNS = ("Team", "Spent", "Purse", "Players", "Bids", "Avg Price", "Avg Premium")
+# Team rows shown before the table scrolls, and the table's width in pixels
+TEAM_ROWS = 12
+TABLE_WIDTH = 760
+
+
+class AnalyticsPane(tk.Toplevel):
+    """Window showing live AuctionAnalytics figures.
+
+    Events only mark the pane dirty; it redraws at most once every
+    REFRESH_MS, so a fast bidding war costs one redraw per interval
+    instead of one per bid. The team table is a TeamPanelView, so only
+    the rows in view have widgets and are redrawn.
+    """
+
+    def __init__(self, master, analytics, player_name, font=('Arial', 12)):
+        super().__init__(master)
+        self.title("Auction Analytics")
+        self.analytics = analytics
+        self.player_name = player_name
+        self._scheduled = None
+
+        self.overview_label = tk.Label(self, text="", font=font, justify="left", anchor="w")
+        self.overview_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        team_ids = range(1, len(analytics.team_names))
+        self.team_table = TeamPanelView(
+            self, team_ids, None, None, self.team_row, None, None, None, mode=TABLE, font=font,
+            columns=TEAM_COLUMNS, width=TABLE_WIDTH, height=ROW_HEIGHT * (min(len(team_ids), TEAM_ROWS) + 1)
+        )
+        # The table keeps the size asked for here; its rows are placed, not packed
+        self.team_table.pack_propagate(False)
+        self.team_table.grid(row=1, column=0, padx=5, sticky="nsew")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.contested_label = tk.Label(self, text="", font=font, justify="left", anchor="w")
+        self.contested_label.grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        self.bind("<Destroy>", self._on_destroy)
+        self.refresh()
+
+    def _on_destroy(self, event):
+        # Children's Destroy events reach this binding too; only the window's own cancels the redraw
+        if event.widget is self and self._scheduled is not None:
+            self.after_cancel(self._scheduled)
+            self._scheduled = None
+
+    def team_row(self, team_id):
+        """Return the TEAM_COLUMNS values of one team."""
+        team = self.analytics.team(team_id)
+        return (team["team"], f"₹{team['spent']}", f"₹{team['purse']}", team["players"], team["bids"],
+                f"₹{team['average_price']:.0f}", f"₹{team['average_premium']:.0f}")
+
+    def mark_dirty(self):
+        """Schedule a redraw; calls within one refresh interval share it."""
+        if self._scheduled is None:
+            self._scheduled = self.after(REFRESH_MS, self.refresh)
+
+    def refresh(self):
+        """Redraw the pane from the current aggregates."""
+        self._scheduled = None
+        analytics = self.analytics
+        overview = analytics.overview()
+        self.overview_label.config(
+            text=f"Players sold: {overview['players_sold']}   Total spent: ₹{overview['total_spent']}   "
+                 f"Bids: {overview['bids']}\n"
+                 f"Average price: ₹{overview['average_price']:.0f}   "
+                 f"Average premium over base: ₹{overview['average_premium']:.0f} "
+                 f"({overview['premium_percent']:.1f}%)"
+        )
+        self.team_table.refresh()
+        contested = analytics.most_contested(CONTESTED_ROWS)
+        self.contested_label.config(
+            text="Most contested: " + (", ".join(f"{self.player_name(player_id)} ({bids})"
+                                                 for player_id, bids in contested if bids) or "-")
+        )
@@ -0,0 +1,136 @@
+import heapq
+
+from auction_engine import NO_TEAM
+from auction_history import BID, OPEN, SELECT, UNDO
+
+
+class AuctionAnalytics:
+    """Running auction statistics, updated in O(1) per StateLog event.
+
+    Fed the same records ``AuctionApp.log_state`` journals, it keeps per-team
+    spend, purchases and bid counts, per-player bid counts and the totals
+    behind the average price and premium over base bid. Queries read these
+    aggregates and never rescan the log. A Rewind or Redo moves through any
+    number of steps at once, so it rebuilds the aggregates from the engine.
+    """
+
+    def __init__(self, engine, starting_money):
+        """``starting_money`` holds each team's starting purse, in team ID order."""
+        self.team_names = engine.team_names
+        self.starting_money = [0] + list(starting_money)
+        self.rebuild(engine)
+
+    def rebuild(self, engine):
+        """Recompute every aggregate from the engine's purchases and undo history."""
+        teams = len(self.team_names)
+        self.spent = [0] * teams
+        self.bought = [0] * teams
+        self.premium = [0] * teams
+        self.team_bids = [0] * teams
+        self.player_bids = {}
+        self.rounds = 0
+        self.sold = 0
+        self.sold_price = 0
+        self.sold_base = 0
+        # Teams behind the live bids of each open lot, so an undone bid is taken off the right team
+        self.round_bidders = {}
+        for team_id in engine.team_ids():
+            for player_id, price in engine.inventory[team_id].items():
+                self._sale(team_id, price, engine.base_bid(player_id))
+        history = engine.history
+        if history is not None:
+            for step in history.steps[:history.position]:
+                kind = step[0]
+                if kind in (SELECT, OPEN):
+                    self.rounds += 1
+                elif kind == BID:
+                    self._bid(step[2], step[1])
+                elif kind == UNDO:
+                    self._undo_bid(step[2], step[1])
+        lots = dict(engine.lots)
+        if engine.bidding_enabled:
+            lots[engine.current_player] = (engine.current_bid, engine.highest_bidder, engine.bid_history)
+        for player_id, (_, leader, bid_history) in lots.items():
+            if leader != NO_TEAM:
+                self.round_bidders[player_id] = [team_id for team_id, _ in bid_history[1:]] + [leader]
+
+    def observe(self, record):
+        """Update the aggregates with one StateLog record."""
+        kind = record["event"]
+        player_id = record["player_id"]
+        if kind == "Bid":
+            self._bid(record["manager_id"], player_id)
+            self.round_bidders.setdefault(player_id, []).append(record["manager_id"])
+        elif kind == "UndoBid":
+            bidders = self.round_bidders.get(player_id)
+            if bidders:
+                self._undo_bid(bidders.pop(), player_id)
+                if not bidders:
+                    del self.round_bidders[player_id]
+        elif kind in ("SelectPlayer", "OpenLot"):
+            self.rounds += 1
+            if kind == "SelectPlayer":
+                # A selection drops the active lot: the one it names while other lots are open, else the only one
+                if "replaces" in record:
+                    self.round_bidders.pop(record["replaces"], None)
+                else:
+                    self.round_bidders.clear()
+        elif kind == "Bought":
+            self.round_bidders.pop(player_id, None)
+            self._sale(record["manager_id"], record["bid_amount"], record["base_bid"])
+
+    def _bid(self, team_id, player_id):
+        self.team_bids[team_id] += 1
+        self.player_bids[player_id] = self.player_bids.get(player_id, 0) + 1
+
+    def _undo_bid(self, team_id, player_id):
+        self.team_bids[team_id] -= 1
+        self.player_bids[player_id] -= 1
+
+    def _sale(self, team_id, price, base):
+        self.spent[team_id] += price
+        self.bought[team_id] += 1
+        self.premium[team_id] += price - base
+        self.sold += 1
+        self.sold_price += price
+        self.sold_base += base
+
+    # --- Queries ---
+
+    def team(self, team_id):
+        """Return the statistics of one team."""
+        bought = self.bought[team_id]
+        return {
+            "team": self.team_names[team_id],
+            "spent": self.spent[team_id],
+            "purse": self.starting_money[team_id] - self.spent[team_id],
+            "players": bought,
+            "bids": self.team_bids[team_id],
+            "average_price": self.spent[team_id] / bought if bought else 0.0,
+            "average_premium": self.premium[team_id] / bought if bought else 0.0,
+        }
+
+    def teams(self):
+        """Return the statistics of every team, in team ID order."""
+        return [self.team(team_id) for team_id in range(1, len(self.team_names))]
+
+    def overview(self):
+        """Return auction-wide totals."""
+        sold = self.sold
+        return {
+            "rounds": self.rounds,
+            "players_sold": sold,
+            "total_spent": self.sold_price,
+            "bids": sum(self.team_bids),
+            "average_price": self.sold_price / sold if sold else 0.0,
+            "average_premium": (self.sold_price - self.sold_base) / sold if sold else 0.0,
+            "premium_percent": 100.0 * (self.sold_price - self.sold_base) / self.sold_base if self.sold_base else 0.0,
+        }
+
+    def bids_for(self, player_id):
+        """Return how many live bids a player has drawn."""
+        return self.player_bids.get(player_id, 0)
+
+    def most_contested(self, count=5):
+        """Return ``(player ID, bids)`` of the ``count`` players with the most bids."""
+        return heapq.nlargest(count, self.player_bids.items(), key=lambda item: item[1])
@@ -0,0 +1,636 @@
+from bid_ladder import DEFAULT_LADDER, NO_CEILING
+from budget_index import BudgetIndex
+
+# Result codes returned by AuctionEngine operations
+OK = 0
+BIDDING_CLOSED = 1       # no player selected, the round has already ended, or the player is sold or unknown
+SAME_BIDDER = 2          # the team already holds the highest bid
+INSUFFICIENT_FUNDS = 3   # the team cannot afford the next bid
+NOTHING_TO_UNDO = 4      # the bid history of the round is empty
+NO_BIDS = 5              # the round cannot be closed without a bid
+SQUAD_BUDGET = 6         # the team could no longer fill its squad at base prices, or its squad is full
+NOTHING_TO_REDO = 7      # no reverted step of the auction history is left to redo
+
+# Team IDs match AuctionApp.manager_ids; player IDs are the keys of PlayerCatalog
+FIRST_TEAM_ID = 1
+FIRST_PLAYER_ID = 101
+NO_TEAM = 0
+NO_PLAYER = 0
+
+
+def bid_increment(bid):
+    """Return the increment the standard ladder applies on top of the current highest bid."""
+    return DEFAULT_LADDER.increment(bid)
+
+
+class AuctionEngine:
+    """Auction state and rules keyed by integer team and player IDs.
+
+    Every operation returns one of the result codes above instead of
+    reporting to the user, so the engine runs without a display. Bids are
+    raised by the session's BidLadder, the standard one unless given.
+
+    With a squad size set, a team may only bid what leaves it enough money
+    to fill its remaining squad slots with the cheapest unsold players.
+    ``bid_limits`` holds that maximum safe bid per team, kept current by a
+    BudgetIndex; without a squad size it is simply ``money``.
+
+    ``history`` is an AuctionHistory once one is attached; ``execute`` and
+    ``apply_event`` then record every event in it for undo/redo.
+
+    Several lots can be open at once. The active lot lives in the
+    ``current_*`` fields, so the rules above run unchanged on it; the others
+    are parked in ``lots`` as ``{player ID: (bid, highest bidder, bid
+    history)}`` and made active again with ``focus``. Each team's leading
+    bids on parked lots are held in a reservation ledger, ``reserved`` and
+    ``reserved_slots``, and taken off what it may bid on the active lot, so
+    its leading bids together never exceed its purse (or squad budget).
+    """
+
+    __slots__ = (
+        "team_names", "money", "inventory", "player_names", "player_base", "remaining",
+        "current_player", "current_bid", "highest_bidder", "bid_history", "bidding_enabled", "ladder",
+        "tier_floor", "tier_ceiling", "tier_increment", "proxy_ceilings", "budget_shares",
+        "squad_size", "budget_index", "bid_limits", "history", "lots", "reserved", "reserved_slots",
+    )
+
+    def __init__(self, teams, players, ladder=DEFAULT_LADDER):
+        """Create an engine from ``(team name, money)`` and ``(player name, base bid)`` pairs."""
+        # Per-team lists are indexed by team ID; slot 0 stands for "no team"
+        self.team_names = [""] + [name for name, _ in teams]
+        self.money = [0] + [int(money) for _, money in teams]
+        self.inventory = [None] + [{} for _ in teams]
+        # Per-player lists are indexed by player ID - FIRST_PLAYER_ID
+        self.player_names = [name for name, _ in players]
+        self.player_base = [int(base) for _, base in players]
+        self.remaining = dict.fromkeys(range(FIRST_PLAYER_ID, FIRST_PLAYER_ID + len(players)))
+        self.current_player = NO_PLAYER
+        self.current_bid = 0
+        self.highest_bidder = NO_TEAM
+        self.bid_history = []
+        self.bidding_enabled = False
+        self.ladder = ladder
+        # Ladder tier of the latest raise; bids move up one tier at a time, so bid() rarely looks it up
+        self.tier_floor, self.tier_ceiling, self.tier_increment = ladder.tier(0)
+        # Private proxy bids: {player ID: {team ID: maximum bid}} and each team's budget share, if any
+        self.proxy_ceilings = {}
+        self.budget_shares = [None] * len(self.team_names)
+        self.squad_size = 0
+        self.budget_index = None
+        self.bid_limits = self.money
+        self.history = None
+        self.lots = {}
+        self.reserved = [0] * len(self.team_names)
+        self.reserved_slots = [0] * len(self.team_names)
+
+    # --- Lookups ---
+
+    def team_ids(self):
+        """Return the IDs of all teams."""
+        return range(FIRST_TEAM_ID, len(self.team_names))
+
+    def player_name(self, player_id):
+        """Return the display name of a player."""
+        return self.player_names[player_id - FIRST_PLAYER_ID]
+
+    def base_bid(self, player_id):
+        """Return the starting price of a player."""
+        return self.player_base[player_id - FIRST_PLAYER_ID]
+
+    # --- Auction rules ---
+
+    def select(self, player_id):
+        """Open a bidding round for a player at their base bid."""
+        if player_id not in self.remaining:
+            return BIDDING_CLOSED
+        self.bidding_enabled = True
+        self.current_player = player_id
+        self.current_bid = self.player_base[player_id - FIRST_PLAYER_ID]
+        self.highest_bidder = NO_TEAM
+        self.bid_history = []
+        if self.squad_size:
+            self.update_bid_limits()
+        return OK
+
+    def next_bid(self):
+        """Return the amount the next bid of the round would have to be."""
+        return self.bid_after(1)
+
+    def bid_after(self, steps):
+        """Return the amount the bid would reach after ``steps`` consecutive raises."""
+        bid = self.current_bid
+        if self.highest_bidder == NO_TEAM:
+            # The first bid of a round is made at the base price
+            steps -= 1
+        return self.ladder.jump(bid, steps) if steps > 0 else bid
+
+    def bid(self, team_id):
+        """Raise the current bid on behalf of a team."""
+        if not self.bidding_enabled:
+            return BIDDING_CLOSED
+        money = self.bid_limits[team_id] - self.reserved[team_id]
+        current_bid = self.current_bid
+        if money < current_bid:
+            return self._over_limit(team_id, current_bid)
+        leader = self.highest_bidder
+        if leader == team_id:
+            return SAME_BIDDER
+        if leader != NO_TEAM:
+            # BidLadder.next_bid() inlined on the hot path, with the current tier cached
+            if not self.tier_floor <= current_bid < self.tier_ceiling:
+                self.tier_floor, self.tier_ceiling, self.tier_increment = self.ladder.tier(current_bid)
+            current_bid += self.tier_increment
+            if money < current_bid:
+                return self._over_limit(team_id, current_bid)
+        self.bid_history.append((leader, self.current_bid))
+        self.current_bid = current_bid
+        self.highest_bidder = team_id
+        return OK
+
+    def bid_many(self, team_ids):
+        """Apply a sequence of bids and return how many of them were accepted."""
+        bid = self.bid
+        accepted = 0
+        for team_id in team_ids:
+            if bid(team_id) == OK:
+                accepted += 1
+        return accepted
+
+    def jump_bid(self, team_id, steps):
+        """Raise the bid ``steps`` ladder steps at once on behalf of a team; one undo reverts it."""
+        if not self.bidding_enabled:
+            return BIDDING_CLOSED
+        if self.highest_bidder == team_id:
+            return SAME_BIDDER
+        amount = self.bid_after(max(1, steps))
+        if self.available(team_id) < amount:
+            return self._over_limit(team_id, amount)
+        self.bid_history.append((self.highest_bidder, self.current_bid))
+        self.current_bid = amount
+        self.highest_bidder = team_id
+        return OK
+
+    def record_bid(self, team_id, amount):
+        """Apply a bid that was already accepted, e.g. when replaying a journal."""
+        self.bid_history.append((self.highest_bidder, self.current_bid))
+        self.current_bid = amount
+        self.highest_bidder = team_id
+        return OK
+
+    def undo(self):
+        """Restore the highest bid as it was before the most recent bid."""
+        if not self.bidding_enabled:
+            return BIDDING_CLOSED
+        if not self.bid_history:
+            return NOTHING_TO_UNDO
+        self.highest_bidder, self.current_bid = self.bid_history.pop()
+        return OK
+
+    def sell(self):
+        """Close the round and sell the current player to the highest bidder."""
+        if not (self.bidding_enabled and self.highest_bidder != NO_TEAM):
+            return NO_BIDS
+        winner = self.highest_bidder
+        self.money[winner] -= self.current_bid
+        self.inventory[winner][self.current_player] = self.current_bid
+        self.remaining.pop(self.current_player, None)
+        self.bidding_enabled = False
+        if self.budget_index is not None:
+            self.budget_index.remove(self.current_player)
+            self.update_bid_limits()
+        return OK
+
+    def unsell(self):
+        """Take back the sale that closed the current round and reopen the round.
+
+        Only valid while the sold round is still the current one, which is
+        how AuctionHistory uses it; the caller refreshes ``bid_limits``.
+        """
+        winner = self.highest_bidder
+        player_id = self.current_player
+        self.money[winner] += self.current_bid
+        del self.inventory[winner][player_id]
+        self.remaining[player_id] = None
+        self.bidding_enabled = True
+        if self.budget_index is not None:
+            self.budget_index.add(player_id)
+        return OK
+
+    def round_state(self):
+        """Return the fields of the current round, as AuctionHistory records them before a change."""
+        return self.current_player, self.current_bid, self.highest_bidder, self.bid_history, self.bidding_enabled
+
+    def restore_round(self, state):
+        """Make a round captured with ``round_state`` the active one, in place of the active round.
+
+        The round is taken out of the parked lots if it is there. The active
+        round is dropped, not parked.
+        """
+        lot = self.lots.pop(state[0], None)
+        if lot is not None:
+            self._reserve(lot[1], -lot[0], -1)
+        (self.current_player, self.current_bid, self.highest_bidder, self.bid_history,
+         self.bidding_enabled) = state
+
+    # --- Concurrent lots ---
+
+    def open_lot(self, player_id):
+        """Open a bidding round for a player next to the active one, which is parked if still open."""
+        if player_id == self.current_player or player_id in self.lots:
+            return self.focus(player_id)
+        if player_id not in self.remaining:
+            return BIDDING_CLOSED
+        self.park()
+        return self.select(player_id)
+
+    def focus(self, player_id):
+        """Make the open lot of a player the active one, parking the active lot if it is still open."""
+        if player_id == self.current_player:
+            return OK
+        lot = self.lots.pop(player_id, None)
+        if lot is None:
+            return BIDDING_CLOSED
+        self._reserve(lot[1], -lot[0], -1)
+        self.park()
+        self.current_player = player_id
+        self.current_bid, self.highest_bidder, self.bid_history = lot
+        self.bidding_enabled = True
+        if self.squad_size:
+            self.update_bid_limits()
+        return OK
+
+    def park(self):
+        """Move the active lot, if still open, into ``lots`` and reserve its leading bid.
+
+        The ``current_*`` fields keep their values until another round is made active.
+        """
+        if self.bidding_enabled and self.current_player != NO_PLAYER:
+            self.lots[self.current_player] = (self.current_bid, self.highest_bidder, self.bid_history)
+            self._reserve(self.highest_bidder, self.current_bid)
+            self.bidding_enabled = False
+
+    def open_lots(self):
+        """Return ``(player ID, bid, highest bidder)`` of every open lot, the active one included."""
+        lots = [(player_id, bid, leader) for player_id, (bid, leader, _) in self.lots.items()]
+        if self.bidding_enabled and self.current_player != NO_PLAYER:
+            lots.append((self.current_player, self.current_bid, self.highest_bidder))
+        lots.sort()
+        return lots
+
+    def available(self, team_id):
+        """Return the most a team may bid on the active lot, after what its leading bids on other lots hold."""
+        return self.bid_limits[team_id] - self.reserved[team_id]
+
+    def restore_lots(self, lots):
+        """Replace the parked lots with ``{player ID: (bid, highest bidder, bid history)}`` and rebuild the ledger."""
+        self.lots = lots
+        self.reserved = [0] * len(self.team_names)
+        self.reserved_slots = [0] * len(self.team_names)
+        for bid, leader, _ in lots.values():
+            self._reserve(leader, bid)
+
+    def _reserve(self, team_id, amount, slots=1):
+        if team_id != NO_TEAM:
+            self.reserved[team_id] += amount
+            self.reserved_slots[team_id] += slots
+
+    # --- Squad budget ---
+
+    def set_squad_size(self, squad_size):
+        """Require every team to keep enough money to fill ``squad_size`` players; 0 turns it off."""
+        self.squad_size = squad_size
+        self.budget_index = (BudgetIndex(self.remaining, self.player_base, FIRST_PLAYER_ID)
+                             if squad_size else None)
+        self.update_bid_limits()
+
+    def update_bid_limits(self):
+        """Recompute every team's maximum safe bid on the current player."""
+        if not self.squad_size:
+            self.bid_limits = self.money
+            return
+        index = self.budget_index
+        current = self.current_player if self.current_player in self.remaining else None
+        limits = [0] * len(self.money)
+        # Teams with the same number of open slots share one reserve lookup
+        reserves = {}
+        for team_id in self.team_ids():
+            # Lots the team leads elsewhere would fill squad slots too
+            open_slots = self.squad_size - len(self.inventory[team_id]) - self.reserved_slots[team_id]
+            if open_slots <= 0:
+                limits[team_id] = -1
+                continue
+            reserve = reserves.get(open_slots)
+            if reserve is None:
+                # Money held back for the other open slots, at the cheapest base bids still available
+                reserve = reserves[open_slots] = index.cheapest_sum(open_slots - 1, current)
+            limits[team_id] = self.money[team_id] - reserve
+        self.bid_limits = limits
+
+    def max_safe_bid(self, team_id):
+        """Return the most a team can bid on the current player and still fill its squad."""
+        return self.available(team_id)
+
+    def _over_limit(self, team_id, amount):
+        return INSUFFICIENT_FUNDS if self.money[team_id] - self.reserved[team_id] < amount else SQUAD_BUDGET
+
+    # --- Proxy bidding ---
+
+    def set_proxy(self, team_id, player_id, ceiling):
+        """Register the most a team is willing to pay for a player; a ceiling of 0 withdraws it."""
+        ceilings = self.proxy_ceilings.setdefault(player_id, {})
+        ceilings.pop(team_id, None)
+        if ceiling > 0:
+            ceilings[team_id] = ceiling
+        return OK
+
+    def set_budget_policy(self, team_id, share):
+        """Let a team bid by proxy up to ``share`` of its remaining money on any player; None turns it off."""
+        self.budget_shares[team_id] = share if share else None
+        return OK
+
+    def proxy_ceiling(self, team_id, player_id):
+        """Return the most a team will bid by proxy on a player, capped by its maximum safe bid."""
+        ceiling = self.proxy_ceilings.get(player_id, {}).get(team_id)
+        if ceiling is None:
+            share = self.budget_shares[team_id]
+            ceiling = int((self.money[team_id] - self.reserved[team_id]) * share) if share else 0
+        return min(ceiling, self.available(team_id))
+
+    def resolve_proxies(self):
+        """Settle the round's proxy ceilings in one step, as an ascending second-price auction would.
+
+        The team with the highest ceiling wins at one ladder step above the
+        best the runner-up could bid (or at its own ceiling, if lower). Ties
+        go to the current leader, then to the team that registered first.
+        The bids that produce this outcome, the runner-up's last bid and the
+        winner's, are applied as one batch and returned as ``(result code,
+        [(team ID, amount), ...])``.
+        """
+        if not self.bidding_enabled:
+            return BIDDING_CLOSED, []
+        player_id = self.current_player
+        leader = self.highest_bidder
+        registered = list(self.proxy_ceilings.get(player_id, ()))
+        teams = registered + [team_id for team_id in self.team_ids()
+                              if self.budget_shares[team_id] and team_id not in registered]
+        first = self.bid_after(1)
+        bidders = []
+        for order, team_id in enumerate(teams):
+            ceiling = self.proxy_ceiling(team_id, player_id)
+            if ceiling >= first or (team_id == leader and ceiling >= self.current_bid):
+                bidders.append((ceiling, team_id == leader, -order, team_id))
+        if not bidders:
+            return OK, []
+        bidders.sort(reverse=True)
+        winner = bidders[0][3]
+        runner_up = bidders[1][3] if len(bidders) > 1 else NO_TEAM
+        if winner == leader and runner_up == NO_TEAM:
+            return OK, []
+
+        winner_steps = self._steps_within(bidders[0][0])
+        runner_up_steps = self._steps_within(bidders[1][0]) if runner_up != NO_TEAM else 0
+        steps = min(runner_up_steps + 1, winner_steps)
+        price = self.bid_after(steps) if steps > 0 else self.current_bid
+        bids = []
+        if steps > 1 and runner_up != NO_TEAM and runner_up != leader:
+            counter = self.bid_after(steps - 1)
+            if counter < price:
+                bids.append((runner_up, counter))
+        if winner != leader or price > self.current_bid:
+            bids.append((winner, price))
+        for team_id, amount in bids:
+            self.record_bid(team_id, amount)
+        return OK, bids
+
+    def _steps_within(self, ceiling):
+        """Return how many raises from the current state stay at or below ``ceiling``."""
+        if self.highest_bidder == NO_TEAM:
+            # The first raise is the opening bid at the base price
+            if ceiling < self.current_bid:
+                return 0
+            steps = self.ladder.steps_within(self.current_bid, ceiling)
+            return steps if steps == NO_CEILING else steps + 1
+        if ceiling < self.current_bid:
+            return 0
+        return self.ladder.steps_within(self.current_bid, ceiling)
+
+    # --- Persistence ---
+
+    def to_state(self):
+        """Return a JSON-serializable copy of the mutable auction state."""
+        return {
+            "money": self.money[1:],
+            "inventory": [list(inv.items()) for inv in self.inventory[1:]],
+            "remaining": list(self.remaining),
+            "current_player": self.current_player,
+            "current_bid": self.current_bid,
+            "highest_bidder": self.highest_bidder,
+            "bid_history": self.bid_history,
+            "bidding_enabled": self.bidding_enabled,
+            "lots": [[player_id, bid, leader, history]
+                     for player_id, (bid, leader, history) in sorted(self.lots.items())],
+        }
+
+    def load_state(self, state):
+        """Restore a state captured with ``to_state``."""
+        self.money = [0] + list(state["money"])
+        self.inventory = [None] + [{pid: price for pid, price in inv} for inv in state["inventory"]]
+        self.remaining = dict.fromkeys(state["remaining"])
+        self.current_player = state["current_player"]
+        self.current_bid = state["current_bid"]
+        self.highest_bidder = state["highest_bidder"]
+        self.bid_history = [tuple(entry) for entry in state["bid_history"]]
+        self.bidding_enabled = state["bidding_enabled"]
+        self.restore_lots({player_id: (bid, leader, [tuple(entry) for entry in history])
+                           for player_id, bid, leader, history in state.get("lots", ())})
+        if self.squad_size:
+            self.set_squad_size(self.squad_size)
+        else:
+            self.bid_limits = self.money
+
+
+# --- Commands and events ---
+#
+# A command is a dict such as {"type": "bid", "manager_id": 3}, or
+# {"type": "jump", "manager_id": 3, "steps": 4} for a jump bid. Executing it
+# yields an event dict named after the StateLog event it produces, e.g.
+# {"event": "Bid", "manager_id": 3, "player_id": 105, "bid_amount": 60}.
+# Applying the events in order to another engine reproduces the state,
+# which is how journals are replayed and how replicas follow a server.
+# Registering a proxy ceiling or budget policy is private to the engine
+# that settles proxies and yields no event; "resolve" yields a ProxyBids
+# event whose "bids" list holds the [team ID, amount] bids it placed.
+# {"type": "open", "player_id": 105} opens a lot next to the active one and
+# yields an OpenLot event; while other lots are open, a SelectPlayer event
+# names the lot it drops in "replaces". {"type": "focus", "player_id": 105}
+# makes an open lot the active one and yields a FocusLot event, as does
+# selecting or opening a player whose lot is already open. Bid, jump,
+# undo, sell and resolve commands with a "player_id" are routed to that
+# player's open lot, and every event names its lot by "player_id", which
+# is how replicas and replays follow along.
+# With an AuctionHistory attached, {"type": "rewind", "steps": n} and
+# {"type": "redo", "steps": n} move through the whole auction and yield
+# Rewind and Redo events that carry the same "steps".
+
+# Commands and events that act on one lot, named by their "player_id"
+LOT_COMMANDS = ("bid", "jump", "undo", "sell", "resolve")
+LOT_EVENTS = ("Bid", "ProxyBids", "UndoBid", "Bought")
+
+
+def execute(engine, command):
+    """Run a command against the engine and return ``(result code, event or None)``."""
+    kind = command["type"]
+    player_id = command.get("player_id")
+    if kind in LOT_COMMANDS and player_id and player_id != engine.current_player:
+        active = engine.round_state()
+        if engine.focus(player_id) != OK:
+            return BIDDING_CLOSED, None
+        result, event = _execute_recorded(engine, command)
+        if event is None:
+            # A rejected command leaves the active lot as it was
+            if active[4]:
+                engine.focus(active[0])
+            else:
+                engine.park()
+                engine.restore_round(active)
+                engine.update_bid_limits()
+        return result, event
+    return _execute_recorded(engine, command)
+
+
+def _execute_recorded(engine, command):
+    kind = command["type"]
+    history = engine.history
+    if history is None:
+        return _execute(engine, command)
+    if kind in ("rewind", "redo"):
+        steps = int(command.get("steps", 1))
+        result = history.rewind(steps) if kind == "rewind" else history.redo(steps)
+        if result != OK:
+            return result, None
+        return OK, {"event": "Rewind" if kind == "rewind" else "Redo", "manager_id": engine.highest_bidder,
+                    "player_id": engine.current_player, "bid_amount": engine.current_bid, "steps": steps}
+    before = engine.round_state()
+    result, event = _execute(engine, command)
+    if event is not None:
+        history.record(event, before)
+    return result, event
+
+
+def _execute(engine, command):
+    kind = command["type"]
+    if kind in ("select", "open", "focus"):
+        player_id = command["player_id"]
+        if kind == "focus" or player_id in engine.lots:
+            # The player already has an open lot: it only becomes the active one
+            if player_id == engine.current_player:
+                return (OK if engine.bidding_enabled else BIDDING_CLOSED), None
+            result = engine.focus(player_id)
+            if result != OK:
+                return result, None
+            return OK, {"event": "FocusLot", "manager_id": NO_TEAM, "player_id": player_id, "bid_amount": None}
+        if player_id not in engine.remaining:
+            # A sold player, or an ID outside the roster, cannot be put up for auction
+            return BIDDING_CLOSED, None
+        if kind == "select":
+            event = {"event": "SelectPlayer", "manager_id": NO_TEAM, "player_id": player_id, "bid_amount": None}
+            if engine.lots:
+                # Which lot is active is not journaled, so name the open lot the selection drops
+                event["replaces"] = engine.current_player if engine.bidding_enabled else NO_PLAYER
+            engine.select(player_id)
+            return OK, event
+        if player_id == engine.current_player:
+            return OK, None
+        engine.open_lot(player_id)
+        return OK, {"event": "OpenLot", "manager_id": NO_TEAM, "player_id": player_id, "bid_amount": None}
+    if kind in ("bid", "jump"):
+        if kind == "bid":
+            result = engine.bid(command["manager_id"])
+        else:
+            result = engine.jump_bid(command["manager_id"], int(command["steps"]))
+        if result != OK:
+            return result, None
+        return OK, {"event": "Bid", "manager_id": engine.highest_bidder, "player_id": engine.current_player,
+                    "bid_amount": engine.current_bid}
+    if kind == "proxy":
+        return engine.set_proxy(command["manager_id"], command["player_id"], int(command["ceiling"])), None
+    if kind == "budget":
+        share = command.get("share")
+        return engine.set_budget_policy(command["manager_id"], float(share) if share else None), None
+    if kind == "resolve":
+        result, bids = engine.resolve_proxies()
+        if not bids:
+            return (NO_BIDS if result == OK else result), None
+        return OK, {"event": "ProxyBids", "manager_id": engine.highest_bidder, "player_id": engine.current_player,
+                    "bid_amount": engine.current_bid, "bids": bids}
+    if kind == "undo":
+        if engine.bidding_enabled and engine.bid_history:
+            # The bidder put back in the lead must still afford the bid next to its other leading bids
+            leader, amount = engine.bid_history[-1]
+            if leader != NO_TEAM and engine.available(leader) < amount:
+                return engine._over_limit(leader, amount), None
+        result = engine.undo()
+        if result != OK:
+            return result, None
+        return OK, {"event": "UndoBid", "manager_id": engine.highest_bidder, "player_id": engine.current_player,
+                    "bid_amount": engine.current_bid}
+    if kind == "sell":
+        result = engine.sell()
+        if result != OK:
+            return result, None
+        return OK, {"event": "Bought", "manager_id": engine.highest_bidder, "player_id": engine.current_player,
+                    "bid_amount": engine.current_bid}
+    if kind in ("rewind", "redo"):
+        return (NOTHING_TO_UNDO if kind == "rewind" else NOTHING_TO_REDO), None
+    raise ValueError(f"Unknown command type: {kind}")
+
+
+def apply_event(engine, event):
+    """Apply an event produced by ``execute`` (or read back from a journal) to an engine.
+
+    Returns OK, the result code of a Rewind or Redo the engine's history
+    cannot follow, or BIDDING_CLOSED for an event on a lot that is not open
+    or a selection of a player who is sold or not in the roster.
+    """
+    kind = event["event"]
+    history = engine.history
+    if kind in ("Rewind", "Redo"):
+        if history is None:
+            return NOTHING_TO_UNDO if kind == "Rewind" else NOTHING_TO_REDO
+        steps = int(event.get("steps", 1))
+        return history.rewind(steps) if kind == "Rewind" else history.redo(steps)
+    if kind in ("SelectPlayer", "OpenLot") and event["player_id"] not in engine.remaining:
+        return BIDDING_CLOSED
+    if kind in LOT_EVENTS:
+        if event["player_id"] != engine.current_player and engine.focus(event["player_id"]) != OK:
+            return BIDDING_CLOSED
+        if not engine.bidding_enabled:
+            # The round was sold or never opened; a bid or sale on it would charge a team again
+            return BIDDING_CLOSED
+    replaces = event.get("replaces")
+    if replaces is not None and (replaces or NO_PLAYER) != engine.current_player:
+        # Make the lot the selection drops the active one, or park the active lot if none was dropped
+        if not replaces or engine.focus(replaces) != OK:
+            engine.park()
+    if kind == "FocusLot":
+        # Switching lots is no step of the history
+        return engine.focus(event["player_id"])
+    before = engine.round_state() if history is not None else None
+    if kind == "SelectPlayer":
+        engine.select(event["player_id"])
+    elif kind == "OpenLot":
+        engine.open_lot(event["player_id"])
+    elif kind == "Bid":
+        engine.record_bid(event["manager_id"], event["bid_amount"])
+    elif kind == "ProxyBids":
+        for team_id, amount in event["bids"]:
+            engine.record_bid(team_id, amount)
+    elif kind == "UndoBid":
+        engine.undo()
+    elif kind == "Bought":
+        engine.sell()
+    else:
+        return OK
+    if history is not None:
+        history.record(event, before)
+    return OK
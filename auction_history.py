@@ -0,0 +1,156 @@
+from auction_engine import NOTHING_TO_REDO, NOTHING_TO_UNDO, OK
+
+# Kinds of history steps; each step is a small tuple that starts with its kind and lot's player ID
+SELECT = 0   # (SELECT, player ID, round's bid history, then the previous round_state())
+BID = 1      # (BID, player ID, team ID, amount, round's bid history, highest bidder and bid before it)
+UNDO = 2     # (UNDO, player ID, highest bidder, bid, round's bid history, highest bidder and bid after it)
+SALE = 3     # (SALE, player ID, winner, price, round's bid history)
+OPEN = 4     # (OPEN, player ID, round's bid history, then the previous round_state())
+
+
+class AuctionHistory:
+    """Undo/redo across the whole auction, kept as a log of per-event deltas.
+
+    Every applied event becomes one step holding only what it changed:
+    a select keeps the previous round and the new round's bid history list
+    (both shared with the engine, not copied), a bid keeps the team and
+    amount, and a sale needs nothing since the engine still holds the sold
+    round. Steps before ``position`` are applied; the ones after it can be
+    redone until a new event truncates them. Moving ``n`` steps costs O(n)
+    small updates, whatever the length of the history or the roster size.
+
+    Steps name their lot, and each one is undone or redone on that lot, so
+    switching between open lots needs no steps of its own. Bid and undo
+    steps also keep the lot's round around them, to bring it back should
+    the lot not be open when the step is reverted or redone.
+
+    Proxy settlements count one step per bid they placed, as they do in
+    the StateLog, so a journal replay rebuilds the same history.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.steps = []
+        self.position = 0
+        engine.history = self
+
+    def __len__(self):
+        return len(self.steps)
+
+    def can_redo(self):
+        """Return how many reverted steps can be redone."""
+        return len(self.steps) - self.position
+
+    def record(self, event, before):
+        """Add the step of an event that was just applied; ``before`` is ``round_state()`` from before it."""
+        kind = event["event"]
+        if kind == "FocusLot":
+            # Switching lots changes nothing the steps undo, and keeps the steps that can be redone
+            return
+        steps = self.steps
+        if self.position < len(steps):
+            del steps[self.position:]
+        engine = self.engine
+        player_id = event["player_id"]
+        history = engine.bid_history
+        if kind == "SelectPlayer":
+            steps.append((SELECT, player_id, history) + before)
+        elif kind == "OpenLot":
+            steps.append((OPEN, player_id, history) + before)
+        elif kind == "Bid":
+            steps.append((BID, player_id, event["manager_id"], event["bid_amount"], history, before[2], before[1]))
+        elif kind == "ProxyBids":
+            leader, bid = before[2], before[1]
+            for team_id, amount in event["bids"]:
+                steps.append((BID, player_id, team_id, amount, history, leader, bid))
+                leader, bid = team_id, amount
+        elif kind == "UndoBid":
+            steps.append((UNDO, player_id, before[2], before[1], history, engine.highest_bidder, engine.current_bid))
+        elif kind == "Bought":
+            steps.append((SALE, player_id, engine.highest_bidder, engine.current_bid, history))
+        else:
+            return
+        self.position = len(steps)
+
+    def _enter(self, player_id, leader, bid, history):
+        """Make a step's lot the active one, bringing its round back as recorded if the lot is not open."""
+        engine = self.engine
+        if engine.focus(player_id) != OK:
+            engine.park()
+            engine.restore_round((player_id, bid, leader, history, True))
+
+    def rewind(self, count=1):
+        """Revert the last ``count`` applied steps; nothing is reverted if there are fewer."""
+        if count < 1 or count > self.position:
+            return NOTHING_TO_UNDO
+        engine = self.engine
+        steps = self.steps
+        reopened = False
+        for position in range(self.position - 1, self.position - count - 1, -1):
+            step = steps[position]
+            kind = step[0]
+            if kind == SALE:
+                if engine.current_player != step[1]:
+                    # Another lot was made active since the sale: bring the sold round back
+                    engine.park()
+                    engine.restore_round((step[1], step[3], step[2], step[4], False))
+                engine.unsell()
+                reopened = True
+                continue
+            if kind == BID:
+                self._enter(step[1], step[2], step[3], step[4])
+                engine.undo()
+            elif kind == UNDO:
+                self._enter(step[1], step[5], step[6], step[4])
+                engine.record_bid(step[2], step[3])
+            else:
+                if engine.focus(step[1]) != OK:
+                    # The lot the step opened is gone: the active lot is not the one to drop
+                    engine.park()
+                # The lot the step opened is dropped and the round before it made active again
+                engine.restore_round(step[3:])
+        self.position -= count
+        if reopened:
+            # Unsold players are kept in player ID order; put the reopened ones back in place once
+            engine.remaining = dict.fromkeys(sorted(engine.remaining))
+        if engine.squad_size:
+            engine.update_bid_limits()
+        return OK
+
+    def redo(self, count=1):
+        """Re-apply ``count`` reverted steps; nothing is redone if there are fewer."""
+        if count < 1 or count > self.can_redo():
+            return NOTHING_TO_REDO
+        engine = self.engine
+        for step in self.steps[self.position:self.position + count]:
+            kind = step[0]
+            if kind in (SELECT, OPEN):
+                if kind == SELECT and engine.current_player != step[3] and engine.focus(step[3]) != OK:
+                    # The round the select replaced is closed: the lot active now stays open
+                    engine.park()
+                if kind == SELECT:
+                    engine.select(step[1])
+                else:
+                    engine.open_lot(step[1])
+                # Bids of the round are redone into the list the steps after this one were recorded with
+                engine.bid_history = step[2]
+                continue
+            if kind == BID:
+                self._enter(step[1], step[5], step[6], step[4])
+                engine.record_bid(step[2], step[3])
+            elif kind == UNDO:
+                self._enter(step[1], step[2], step[3], step[4])
+                engine.undo()
+            else:
+                self._enter(step[1], step[2], step[3], step[4])
+                engine.sell()
+        self.position += count
+        return OK
+
+    def go_to(self, position):
+        """Move to the state after the first ``position`` steps of the history."""
+        if position < self.position:
+            return self.rewind(self.position - position)
+        if position > self.position:
+            return self.redo(position - self.position)
+        return OK
@@ -0,0 +1,424 @@
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from auction_engine import FIRST_PLAYER_ID, FIRST_TEAM_ID, AuctionEngine
+from roster_loader import Roster
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Auction new features.py")
+STRATEGIES = ("uniform", "rivals", "skewed")
+BASE_BIDS = (20, 50, 100, 200)
+# Teams never run out of money, so every round lasts as long as its bids do
+UNLIMITED_MONEY = 10 ** 12
+# Workbook and journal sizes are sampled every this many events of the application benchmark
+GROWTH_SAMPLE_EVENTS = 500
+# In the skewed strategy the k-th team places a share of the bids proportional to k ** -ZIPF_EXPONENT
+ZIPF_EXPONENT = 1.5
+
+
+# --- Synthetic workloads ---
+
+def synthetic_roster(n_teams, n_players, seed=0):
+    """Build a Roster of ``n_teams`` rich teams and ``n_players`` players with random base bids."""
+    teams = [(f"Team {i}", UNLIMITED_MONEY) for i in range(1, n_teams + 1)]
+    if np is not None:
+        bases = np.random.default_rng(seed).choice(BASE_BIDS, n_players).tolist()
+    else:
+        rng = random.Random(seed)
+        bases = [rng.choice(BASE_BIDS) for _ in range(n_players)]
+    players = [(f"Player {i}", base) for i, base in enumerate(bases, 1)]
+    return Roster(teams, players)
+
+
+def bidder_sequence(strategy, n_teams, n_bids, seed=0):
+    """Return the team IDs of ``n_bids`` bids, drawn in one batch.
+
+    ``uniform`` picks any team, ``rivals`` has two teams outbid each other
+    with the odd interloper, and ``skewed`` follows a Zipf distribution so a
+    few teams place most of the bids. With or without NumPy the bids follow
+    the same distributions, only the random streams differ.
+    """
+    last = FIRST_TEAM_ID + n_teams
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        if strategy == "uniform":
+            ids = rng.integers(FIRST_TEAM_ID, last, n_bids)
+        elif strategy == "rivals":
+            ids = FIRST_TEAM_ID + np.arange(n_bids) % min(2, n_teams)
+            interlopers = rng.random(n_bids) < 0.1
+            ids[interlopers] = rng.integers(FIRST_TEAM_ID, last, int(interlopers.sum()))
+        elif strategy == "skewed":
+            ids = FIRST_TEAM_ID + rng.choice(n_teams, n_bids, p=zipf_weights(n_teams))
+        else:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        return ids.tolist()
+    rng = random.Random(seed)
+    if strategy == "uniform":
+        return [rng.randrange(FIRST_TEAM_ID, last) for _ in range(n_bids)]
+    if strategy == "rivals":
+        return [rng.randrange(FIRST_TEAM_ID, last) if rng.random() < 0.1 else FIRST_TEAM_ID + i % min(2, n_teams)
+                for i in range(n_bids)]
+    if strategy == "skewed":
+        return rng.choices(range(FIRST_TEAM_ID, last), weights=zipf_weights(n_teams), k=n_bids)
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def zipf_weights(n_teams, exponent=ZIPF_EXPONENT):
+    """Return each team's share of the bids under a Zipf law over ``n_teams`` teams."""
+    weights = [rank ** -exponent for rank in range(1, n_teams + 1)]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def rounds_of(bidders, n_players, bids_per_round):
+    """Split a bid sequence into ``(player ID, bidders)`` rounds, one player per round."""
+    n_rounds = min(n_players, -(-len(bidders) // bids_per_round))
+    for idx in range(n_rounds):
+        yield FIRST_PLAYER_ID + idx, bidders[idx * bids_per_round:(idx + 1) * bids_per_round]
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at ``fraction`` of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+# --- Pure auction logic ---
+
+def bench_engine(n_teams, n_players, strategy="uniform", n_bids=200_000, bids_per_round=20, seed=0):
+    """Measure the AuctionEngine alone: build time, bid throughput, per-bid latency and memory."""
+    roster = synthetic_roster(n_teams, n_players, seed)
+    bidders = bidder_sequence(strategy, n_teams, n_bids, seed)
+    rounds = list(rounds_of(bidders, n_players, bids_per_round))
+
+    start = time.perf_counter()
+    engine = AuctionEngine(roster.teams, roster.players)
+    build = time.perf_counter() - start
+
+    # Throughput: the batch API, as a server or replay would drive it
+    events = 0
+    accepted = 0
+    start = time.perf_counter()
+    for player_id, round_bidders in rounds:
+        engine.select(player_id)
+        accepted += engine.bid_many(round_bidders)
+        engine.sell()
+        events += len(round_bidders) + 2
+    elapsed = time.perf_counter() - start
+
+    # Latency: every bid timed on its own, on a fresh engine
+    engine = AuctionEngine(roster.teams, roster.players)
+    latencies = []
+    clock = time.perf_counter_ns
+    for player_id, round_bidders in rounds:
+        engine.select(player_id)
+        bid = engine.bid
+        for team_id in round_bidders:
+            t0 = clock()
+            bid(team_id)
+            latencies.append(clock() - t0)
+        engine.sell()
+    latencies.sort()
+
+    # Memory: what building the engine and running the auction allocates
+    del engine
+    gc.collect()
+    tracemalloc.start()
+    engine = AuctionEngine(roster.teams, roster.players)
+    for player_id, round_bidders in rounds:
+        engine.select(player_id)
+        engine.bid_many(round_bidders)
+        engine.sell()
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "bench": "engine",
+        "teams": n_teams,
+        "players": n_players,
+        "strategy": strategy,
+        "bids": len(bidders),
+        "accepted": accepted,
+        "build_ms": build * 1000,
+        "events_per_sec": events / elapsed if elapsed else 0.0,
+        "bids_per_sec": sum(len(b) for _, b in rounds) / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "memory_mb": memory / 2 ** 20,
+    }
+
+
+# --- The Tk application ---
+
+class _HeadlessWidget:
+    """Stand-in for every Tk widget when there is no display: accepts any call and does nothing."""
+
+    def __init__(self, *args, **kwargs):
+        self.options = kwargs
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+
+    configure = config
+
+    def winfo_width(self):
+        return 1200
+
+    def winfo_height(self):
+        return 800
+
+    def after(self, ms, func=None, *args):
+        return "after"
+
+    def after_idle(self, func, *args):
+        return "after"
+
+    def get(self):
+        return ""
+
+
+class _HeadlessVar:
+    """Stand-in for Tk variables."""
+
+    def __init__(self, master=None, value=None, name=None):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def trace_add(self, mode, callback):
+        pass
+
+
+def _install_headless_tk():
+    tk = types.ModuleType("tkinter")
+    for name in ("Tk", "Toplevel", "Frame", "Label", "Button", "Scrollbar", "Spinbox", "Entry", "OptionMenu",
+                 "Checkbutton"):
+        setattr(tk, name, type(name, (_HeadlessWidget,), {}))
+    for name in ("StringVar", "IntVar", "BooleanVar"):
+        setattr(tk, name, type(name, (_HeadlessVar,), {}))
+    for name in ("messagebox", "filedialog", "simpledialog"):
+        module = types.ModuleType(f"tkinter.{name}")
+        setattr(tk, name, module)
+        sys.modules[module.__name__] = module
+    sys.modules["tkinter"] = tk
+
+
+def load_app_module(headless):
+    """Import the Auction Manager app, with stubbed Tk widgets when ``headless``."""
+    if headless:
+        _install_headless_tk()
+    spec = importlib.util.spec_from_file_location("auction_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # Result popups are modal; the benchmark must not wait for someone to click OK
+    module.messagebox.showinfo = lambda *args, **kwargs: None
+    module.messagebox.showerror = lambda *args, **kwargs: None
+    return module
+
+
+def _max_rss_mb():
+    if resource is None:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_app(module, n_teams, n_players, strategy="uniform", n_bids=5000, bids_per_round=20, seed=0):
+    """Drive AuctionApp through its handlers and time the whole bid path, redraw included.
+
+    Runs in the current directory, where the session workbook and journal
+    are created.
+    """
+    roster = synthetic_roster(n_teams, n_players, seed)
+    bidders = bidder_sequence(strategy, n_teams, n_bids, seed)
+    team_names = [name for name, _ in roster.teams]
+
+    root = module.tk.Tk()
+    root.withdraw()
+    start = time.perf_counter()
+    app = module.AuctionApp(root, roster)
+    setup = time.perf_counter() - start
+    redraw = app.renderer.flush
+    idle = root.update_idletasks
+
+    def files_size():
+        return [os.path.getsize(app.excel_filename), os.path.getsize(app.journal_filename)]
+
+    initial_sizes = files_size()
+    growth = [[0] + initial_sizes]
+    latencies = []
+    clock = time.perf_counter_ns
+    events = 0
+    start = time.perf_counter()
+    for player_id, round_bidders in rounds_of(bidders, n_players, bids_per_round):
+        timed = [(app.select_item, player_id)]
+        timed += [(app.place_bid, team_names[team_id - FIRST_TEAM_ID]) for team_id in round_bidders]
+        for handler, arg in timed:
+            t0 = clock()
+            handler(arg)
+            redraw()
+            idle()
+            latencies.append(clock() - t0)
+        t0 = clock()
+        app.end_bidding_round()
+        redraw()
+        idle()
+        latencies.append(clock() - t0)
+        events += len(timed) + 1
+        if events // GROWTH_SAMPLE_EVENTS != (events - len(timed) - 1) // GROWTH_SAMPLE_EVENTS:
+            growth.append([events] + files_size())
+    elapsed = time.perf_counter() - start
+    t0 = time.perf_counter()
+    app.close_session()
+    close = time.perf_counter() - t0
+    final_sizes = files_size()
+    growth.append([events] + final_sizes)
+    root.destroy()
+    latencies.sort()
+
+    return {
+        "bench": "app",
+        "teams": n_teams,
+        "players": n_players,
+        "strategy": strategy,
+        "bids": len(bidders),
+        "events": events,
+        "setup_ms": setup * 1000,
+        "events_per_sec": events / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "close_ms": close * 1000,
+        "workbook_kb": final_sizes[0] / 1024,
+        "workbook_growth_bytes_per_event": (final_sizes[0] - initial_sizes[0]) / events if events else 0.0,
+        "journal_bytes_per_event": (final_sizes[1] - initial_sizes[1]) / events if events else 0.0,
+        "max_rss_mb": _max_rss_mb(),
+        "growth": growth,
+    }
+
+
+# --- Reporting ---
+
+REPORT_COLUMNS = (
+    ("bench", "{}"), ("teams", "{}"), ("players", "{}"), ("strategy", "{}"),
+    ("events_per_sec", "{:.0f}"), ("p50_us", "{:.2f}"), ("p99_us", "{:.2f}"),
+    ("memory_mb", "{:.1f}"), ("workbook_kb", "{:.1f}"), ("max_rss_mb", "{:.1f}"),
+)
+
+
+def case_key(result):
+    return f"{result['bench']}/{result['teams']}x{result['players']}/{result['strategy']}"
+
+
+def print_results(results, baseline=None):
+    """Print one line per case, with the change against ``baseline`` results when given."""
+    header = "  ".join(f"{name:>14}" for name, _ in REPORT_COLUMNS)
+    print(header + ("  vs baseline" if baseline else ""))
+    previous = {case_key(r): r for r in baseline or ()}
+    for result in results:
+        cells = []
+        for name, fmt in REPORT_COLUMNS:
+            value = result.get(name)
+            cells.append(f"{fmt.format(value) if value is not None else '-':>14}")
+        line = "  ".join(cells)
+        old = previous.get(case_key(result))
+        if old:
+            # Throughput up is good, latency up is a regression
+            changes = [f"rate {result['events_per_sec'] / old['events_per_sec'] - 1:+.0%}",
+                       f"p99 {result['p99_us'] / old['p99_us'] - 1:+.0%}"]
+            line += "  " + ", ".join(changes)
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auction Manager bid path benchmarks")
+    parser.add_argument("--teams", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="team counts of the engine benchmark")
+    parser.add_argument("--players", type=int, nargs="+", default=[100, 10000, 1000000],
+                        help="player counts of the engine benchmark")
+    parser.add_argument("--bids", type=int, default=200_000, help="bids per engine case")
+    parser.add_argument("--app-teams", type=int, nargs="+", default=[10, 100],
+                        help="team counts of the application benchmark")
+    parser.add_argument("--app-players", type=int, nargs="+", default=[100, 10000],
+                        help="player counts of the application benchmark")
+    parser.add_argument("--app-bids", type=int, default=5000, help="bids per application case")
+    parser.add_argument("--strategy", choices=STRATEGIES, nargs="+", default=["uniform"],
+                        help="bidding strategies to run")
+    parser.add_argument("--bids-per-round", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-engine", action="store_true", help="only run the application benchmark")
+    parser.add_argument("--skip-app", action="store_true", help="only run the engine benchmark")
+    parser.add_argument("--headless", action="store_true",
+                        help="use stubbed Tk widgets (the default when no display is available)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare against results saved with --save")
+    args = parser.parse_args()
+
+    if np is None:
+        print("NumPy is not installed; bidding strategies are generated with the random module.")
+    results = []
+    if not args.skip_engine:
+        for strategy in args.strategy:
+            for n_teams in args.teams:
+                for n_players in args.players:
+                    results.append(bench_engine(n_teams, n_players, strategy, args.bids,
+                                                args.bids_per_round, args.seed))
+                    print_results(results[-1:])
+
+    if not args.skip_app:
+        headless = args.headless or (os.name != "nt" and not os.environ.get("DISPLAY"))
+        try:
+            import openpyxl  # noqa: F401 - the app cannot start a session without it
+        except ImportError:
+            print("openpyxl is not installed; skipping the application benchmark.")
+        else:
+            module = load_app_module(headless)
+            cwd = os.getcwd()
+            for strategy in args.strategy:
+                for n_teams in args.app_teams:
+                    for n_players in args.app_players:
+                        with tempfile.TemporaryDirectory() as workdir:
+                            os.chdir(workdir)
+                            try:
+                                results.append(bench_app(module, n_teams, n_players, strategy, args.app_bids,
+                                                         args.bids_per_round, args.seed))
+                            finally:
+                                os.chdir(cwd)
+                        print_results(results[-1:])
+
+    print()
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import json
+from bisect import bisect_right
+
+# (bid from, increment) tiers of the standard ladder: nothing below 50, then 5, 10 and 25
+DEFAULT_TIERS = ((0, 0), (50, 5), (100, 10), (200, 25))
+# Name of the optional roster sheet that holds a league's ladder
+LADDER_SHEET = "BidLadder"
+# Upper bound of the last tier
+NO_CEILING = 1 << 63
+
+
+class LadderError(ValueError):
+    """Raised when bid ladder tiers are missing, unsorted or negative."""
+
+
+class BidLadder:
+    """Bid increment ladder compiled into a sorted breakpoint table.
+
+    ``tiers`` are ``(bid from, increment)`` pairs: a bid at or above ``bid
+    from`` (and below the next tier) is raised by ``increment``. Lookups
+    bisect the breakpoints, so they cost O(log tiers) whatever the ladder.
+    """
+
+    __slots__ = ("thresholds", "increments")
+
+    def __init__(self, tiers=DEFAULT_TIERS):
+        tiers = [(int(start), int(increment)) for start, increment in tiers]
+        if not tiers:
+            raise LadderError("The bid ladder has no tiers.")
+        if tiers[0][0] > 0:
+            # Bids below the first listed tier are not raised
+            tiers.insert(0, (0, 0))
+        for (start, _), (next_start, _) in zip(tiers, tiers[1:]):
+            if next_start <= start:
+                raise LadderError("Bid ladder tiers must be sorted by strictly increasing bid.")
+        if any(start < 0 or increment < 0 for start, increment in tiers):
+            raise LadderError("Bid ladder values cannot be negative.")
+        self.thresholds = [start for start, _ in tiers]
+        self.increments = [increment for _, increment in tiers]
+
+    def tiers(self):
+        """Return the ladder as ``[bid from, increment]`` pairs, e.g. for a journal record."""
+        return [[start, increment] for start, increment in zip(self.thresholds, self.increments)]
+
+    def increment(self, bid):
+        """Return the increment applied on top of a highest bid of ``bid``."""
+        return self.increments[bisect_right(self.thresholds, bid) - 1]
+
+    def tier(self, bid):
+        """Return ``(bid from, next tier's bid from, increment)`` of the tier holding ``bid``."""
+        index = bisect_right(self.thresholds, bid) - 1
+        ceiling = self.thresholds[index + 1] if index + 1 < len(self.thresholds) else NO_CEILING
+        return self.thresholds[index], ceiling, self.increments[index]
+
+    def next_bid(self, bid):
+        """Return the bid one step above ``bid``."""
+        return bid + self.increments[bisect_right(self.thresholds, bid) - 1]
+
+    def steps_within(self, bid, ceiling):
+        """Return the most raises above ``bid`` that stay at or below ``ceiling``.
+
+        Returns NO_CEILING when the climb stalls in a zero-increment tier
+        below the ceiling, since any number of raises then stays within it.
+        """
+        thresholds = self.thresholds
+        increments = self.increments
+        tier = bisect_right(thresholds, bid) - 1
+        steps = 0
+        while True:
+            increment = increments[tier]
+            if increment == 0:
+                return NO_CEILING
+            within = (ceiling - bid) // increment
+            if tier + 1 == len(thresholds) or bid + within * increment < thresholds[tier + 1]:
+                return steps + within
+            to_next = -(-(thresholds[tier + 1] - bid) // increment)
+            bid += to_next * increment
+            steps += to_next
+            tier = bisect_right(thresholds, bid) - 1
+
+    def jump(self, bid, steps):
+        """Return the bid ``steps`` raises above ``bid``.
+
+        Whole runs of steps inside a tier are taken at once, so the cost
+        depends on the number of tiers crossed, not on ``steps``. A tier
+        with a zero increment cannot be climbed out of and ends the jump.
+        """
+        thresholds = self.thresholds
+        increments = self.increments
+        tier = bisect_right(thresholds, bid) - 1
+        while steps > 0:
+            increment = increments[tier]
+            if increment == 0:
+                break
+            if tier + 1 == len(thresholds):
+                return bid + steps * increment
+            # Steps needed to reach the next tier, where the increment changes
+            to_next = -(-(thresholds[tier + 1] - bid) // increment)
+            if steps < to_next:
+                return bid + steps * increment
+            bid += to_next * increment
+            steps -= to_next
+            tier = bisect_right(thresholds, bid) - 1
+        return bid
+
+
+DEFAULT_LADDER = BidLadder()
+
+
+def parse_ladder_rows(rows):
+    """Build a BidLadder from ``(bid from, increment)`` rows, skipping a header row and blank rows."""
+    tiers = []
+    for row in rows:
+        start, increment = (tuple(row[:2]) + (None, None))[:2]
+        if start is None or start == "" or increment is None or increment == "":
+            continue
+        try:
+            tiers.append((int(start), int(increment)))
+        except (TypeError, ValueError):
+            if tiers:
+                raise LadderError(f"Invalid bid ladder row: {row!r}")
+            # Header row
+    return BidLadder(tiers)
+
+
+def load_ladder(path):
+    """Load a ladder from a JSON config file.
+
+    The file holds a list of ``[bid from, increment]`` pairs, either on its
+    own or under a ``"bid_ladder"`` key.
+    """
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    if isinstance(config, dict):
+        config = config.get("bid_ladder")
+    if not isinstance(config, list):
+        raise LadderError(f"{path} does not contain a bid ladder.")
+    return BidLadder(config)
@@ -0,0 +1,331 @@
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from auction_engine import BIDDING_CLOSED, FIRST_PLAYER_ID, NO_TEAM, OK, AuctionEngine, execute
+
+# Commands a connected team may send; selecting, settling proxies, undoing and selling stay with the operator
+CLIENT_COMMANDS = ("bid", "jump", "proxy", "budget")
+# A client whose unsent output grows past this many bytes is too slow and gets disconnected
+MAX_CLIENT_BUFFER = 1 << 20
+# Most commands applied before their events are flushed to the clients as one write
+MAX_BATCH = 256
+
+
+def encode(message):
+    """Encode one protocol message as a JSON line."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class ClientConnection:
+    """One connected team (or spectator when ``manager_id`` is 0)."""
+
+    def __init__(self, writer, manager_id):
+        self.writer = writer
+        self.manager_id = manager_id
+
+    def send(self, data):
+        """Queue encoded bytes for the client; return False if the client had to be dropped."""
+        transport = self.writer.transport
+        if transport.is_closing():
+            return False
+        if transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+            transport.abort()
+            return False
+        self.writer.write(data)
+        return True
+
+
+class BidServer:
+    """Line-delimited JSON bidding server around an AuctionEngine.
+
+    Every command, whether from a TCP client or from ``submit``, goes
+    through one asyncio queue, so bids are applied strictly in arrival
+    order. The events produced by the commands waiting in the queue are
+    encoded once and pushed to every client in a single write, and handed
+    to local subscribers, as state deltas.
+
+    Protocol: a client first sends ``{"type": "hello", "manager_id": N}``
+    (or omits the ID to watch only) and receives a ``welcome`` message
+    with the current state. It may then send ``{"type": "bid"}``, or
+    ``{"type": "jump", "steps": N}`` to raise the bid N ladder steps at
+    once, optionally with the ``player_id`` of the open lot it bids on
+    (the active lot otherwise). Accepted bids reach everyone as
+    ``{"type": "event", ...}``; a rejected command is answered to its
+    sender only with ``{"type": "rejected", "code": ...}``, plus a
+    ``"reason"`` when the command itself was malformed.
+    Proxy ceilings (``{"type": "proxy", "player_id": P, "ceiling": N}``)
+    and budget policies (``{"type": "budget", "share": 0.25}``) stay
+    private: only the sender gets an ``{"type": "accepted"}`` answer.
+    """
+
+    def __init__(self, engine, host="127.0.0.1", port=8765):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.clients = set()
+        self.subscribers = []
+        self.seq = 0
+        # Commands that could not be executed at all, e.g. with a malformed field
+        self.bad_commands = 0
+        self.queue = None
+        self.loop = None
+        self._server = None
+        self._consumer = None
+        self._handlers = set()
+
+    async def start(self):
+        """Start listening and processing commands; returns once the server is ready."""
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._consumer = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        """Stop accepting clients and disconnect everyone."""
+        self._server.close()
+        self._consumer.cancel()
+        for client in list(self.clients):
+            client.writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def subscribe(self, callback):
+        """Call ``callback(message)`` on the server thread for every event."""
+        self.subscribers.append(callback)
+
+    def submit(self, command, reply=None):
+        """Queue a command from another thread; ``reply(message)`` receives a rejection, if any."""
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, (command, reply))
+
+    # --- Internals ---
+
+    async def _handle_client(self, reader, writer):
+        client = None
+        self._handlers.add(asyncio.current_task())
+        try:
+            hello = json.loads(await reader.readline() or b"{}")
+            manager_id = int(hello.get("manager_id") or NO_TEAM) if isinstance(hello, dict) else NO_TEAM
+            if (not isinstance(hello, dict) or hello.get("type") != "hello"
+                    or not 0 <= manager_id < len(self.engine.team_names)):
+                writer.write(encode({"type": "error", "message": "expected hello with a valid manager_id"}))
+                return
+            client = ClientConnection(writer, manager_id)
+            client.send(encode({"type": "welcome", "manager_id": manager_id, "seq": self.seq,
+                                "state": self.summary()}))
+            self.clients.add(client)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    command = json.loads(line)
+                except ValueError:
+                    continue
+                # Valid JSON that is not an object (a list, a number) is as unknown as a bad command type
+                if (not isinstance(command, dict) or command.get("type") not in CLIENT_COMMANDS
+                        or manager_id == NO_TEAM):
+                    client.send(encode({"type": "rejected", "code": BIDDING_CLOSED, "command": command}))
+                    continue
+                # The bidding team is the one the connection said hello as, not whatever the line claims
+                command["manager_id"] = manager_id
+                self.queue.put_nowait((command, client))
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self.clients.discard(client)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    async def _consume(self):
+        queue = self.queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < MAX_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            messages = []
+            for command, reply in batch:
+                event = self._execute(command, reply)
+                if event is not None:
+                    self.seq += 1
+                    messages.append({"type": "event", "seq": self.seq, "ts": time.perf_counter(), **event})
+            if messages:
+                self._broadcast(messages)
+
+    def _execute(self, command, reply):
+        # A "player_id" routes the command to that player's open lot; execute rejects lots that are not open
+        try:
+            result, event = execute(self.engine, command)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # Any client can send these, so they are counted and explained to the sender, not logged
+            self.bad_commands += 1
+            self._reply(reply, {"type": "rejected", "code": BIDDING_CLOSED, "command": command,
+                                "reason": f"malformed command: {e!r}"})
+            return None
+        if event is None:
+            self._reply(reply, {"type": "accepted" if result == OK else "rejected", "code": result,
+                                "command": command})
+        return event
+
+    def _reply(self, reply, message):
+        if isinstance(reply, ClientConnection):
+            reply.send(encode(message))
+        elif reply is not None:
+            reply(message)
+
+    def _broadcast(self, messages):
+        data = b"".join(encode(message) for message in messages)
+        for client in list(self.clients):
+            if not client.send(data):
+                self.clients.discard(client)
+        for callback in self.subscribers:
+            for message in messages:
+                callback(message)
+
+    def summary(self):
+        """Return the state a newly connected client needs to follow along."""
+        engine = self.engine
+        current = engine.current_player
+        return {
+            "teams": engine.team_names[1:],
+            "money": engine.money[1:],
+            "current_player": current,
+            "current_player_name": engine.player_name(current) if current else None,
+            "current_bid": engine.current_bid,
+            "highest_bidder": engine.highest_bidder,
+            "bidding_enabled": engine.bidding_enabled,
+            "open_lots": [list(lot) for lot in engine.open_lots()],
+        }
+
+
+class BidServerThread:
+    """Runs a BidServer on its own event loop thread next to the Tk main loop."""
+
+    def __init__(self, engine, host="127.0.0.1", port=8765):
+        self.server = BidServer(engine, host, port)
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="BidServer", daemon=True)
+
+    def start(self):
+        """Start the server thread and wait until it is listening."""
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self.server.port
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.server.start())
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        loop.run_forever()
+
+    def subscribe(self, callback):
+        """Register ``callback(message)``; it is called on the server thread."""
+        self.server.subscribe(callback)
+
+    def submit(self, command, reply=None):
+        """Queue a command from the calling thread."""
+        self.server.submit(command, reply)
+
+    def stop(self):
+        """Disconnect all clients and stop the server thread."""
+        loop = self.server.loop
+        asyncio.run_coroutine_threadsafe(self.server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+
+
+# --- Loopback load test ---
+
+async def _loopback_client(port, manager_id, bids, latencies, done):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(encode({"type": "hello", "manager_id": manager_id}))
+    await reader.readline()  # welcome
+
+    async def receive():
+        # Only the newest event of each read is decoded; its age is the client's fan-out latency
+        pending = b""
+        while True:
+            chunk = await reader.read(1 << 16)
+            if not chunk:
+                return
+            pending += chunk
+            end = pending.rfind(b"\n")
+            if end < 0:
+                continue
+            lines, pending = pending[:end], pending[end + 1:]
+            message = json.loads(lines[lines.rfind(b"\n") + 1:])
+            if message["type"] == "event":
+                latencies.append(time.perf_counter() - message["ts"])
+                if message["event"] == "Bought":
+                    return
+
+    receiver = asyncio.create_task(receive())
+    bid = encode({"type": "bid"})
+    for _ in range(bids):
+        writer.write(bid)
+        await writer.drain()
+        await asyncio.sleep(0)
+    done.append(manager_id)
+    await receiver
+    writer.close()
+
+
+async def run_loopback(clients=200, bids=50):
+    """Connect ``clients`` teams over loopback TCP, let each send ``bids`` bids, and report timings."""
+    teams = [(f"Team {i}", 10 ** 12) for i in range(clients)]
+    engine = AuctionEngine(teams, [("Loopback Player", 100)])
+    server = BidServer(engine, port=0)
+    await server.start()
+    server.submit({"type": "select", "player_id": FIRST_PLAYER_ID})
+
+    latencies = []
+    done = []
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(_loopback_client(server.port, team_id, bids, latencies, done))
+             for team_id in range(1, clients + 1)]
+    while len(done) < clients:
+        await asyncio.sleep(0.01)
+    # Every bid has been sent; drain the queue before closing the round
+    while not server.queue.empty():
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    accepted = server.seq - 1
+    server.submit({"type": "sell"})
+    await asyncio.gather(*tasks)
+    await server.stop()
+
+    latencies.sort()
+    return {
+        "clients": clients,
+        "bids_sent": clients * bids,
+        "bids_accepted": accepted,
+        "bids_per_sec": clients * bids / elapsed,
+        "latency_samples": len(latencies),
+        "fanout_p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "fanout_p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auction bidding server loopback load test")
+    parser.add_argument("--clients", type=int, default=200, help="number of connected teams")
+    parser.add_argument("--bids", type=int, default=50, help="bids sent by each team")
+    args = parser.parse_args()
+    results = asyncio.run(run_loopback(args.clients, args.bids))
+    for key, value in results.items():
+        print(f"{key:<16} {value:.2f}" if isinstance(value, float) else f"{key:<16} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from array import array
+
+
+class BudgetIndex:
+    """Remaining players ordered by base bid, for "cheapest k players" sums in O(log n).
+
+    Two Fenwick trees over the players sorted by ``(base bid, player ID)``
+    hold how many of them are still unsold and what their base bids add up
+    to. Selling a player, or putting one back, updates both in O(log n).
+    """
+
+    def __init__(self, player_ids, base_bids, first_player_id):
+        """Index ``player_ids``; ``base_bids`` is indexed by player ID - ``first_player_id``."""
+        self.first_player_id = first_player_id
+        order = sorted(player_ids, key=lambda player_id: (base_bids[player_id - first_player_id], player_id))
+        size = len(order)
+        self.size = size
+        self.rank = array("i", [0]) * len(base_bids)
+        self.base = array("q", [0]) * (size + 1)
+        counts = array("q", [0]) * (size + 1)
+        sums = array("q", [0]) * (size + 1)
+        for position, player_id in enumerate(order, 1):
+            base = base_bids[player_id - first_player_id]
+            self.rank[player_id - first_player_id] = position
+            self.base[position] = base
+            counts[position] = 1
+            sums[position] = base
+        # Linear-time Fenwick construction: push each node's total into its parent
+        for position in range(1, size + 1):
+            parent = position + (position & -position)
+            if parent <= size:
+                counts[parent] += counts[position]
+                sums[parent] += sums[position]
+        self.counts = counts
+        self.sums = sums
+        self.unsold = bytearray(b"\1") * (size + 1)
+        self.live = size
+        self._top_step = 1 << size.bit_length() if size else 0
+
+    def __len__(self):
+        return self.live
+
+    def _update(self, position, count, amount):
+        counts = self.counts
+        sums = self.sums
+        size = self.size
+        while position <= size:
+            counts[position] += count
+            sums[position] += amount
+            position += position & -position
+
+    def remove(self, player_id):
+        """Take a sold player out of the index."""
+        position = self.rank[player_id - self.first_player_id]
+        if position and self.unsold[position]:
+            self.unsold[position] = 0
+            self._update(position, -1, -self.base[position])
+            self.live -= 1
+
+    def add(self, player_id):
+        """Put a player back, e.g. when a sale is undone."""
+        position = self.rank[player_id - self.first_player_id]
+        if position and not self.unsold[position]:
+            self.unsold[position] = 1
+            self._update(position, 1, self.base[position])
+            self.live += 1
+
+    def count_before(self, player_id):
+        """Return how many remaining players sort before ``player_id``."""
+        position = self.rank[player_id - self.first_player_id] - 1
+        counts = self.counts
+        total = 0
+        while position > 0:
+            total += counts[position]
+            position -= position & -position
+        return total
+
+    def cheapest_sum(self, k, exclude=None):
+        """Return the total base bid of the ``k`` cheapest remaining players, leaving out ``exclude``."""
+        if k <= 0:
+            return 0
+        if exclude is not None:
+            position = self.rank[exclude - self.first_player_id]
+            if position and self.unsold[position] and self.count_before(exclude) < k:
+                # The excluded player is one of the k cheapest: take one more and drop it
+                return self._smallest_sum(k + 1) - self.base[position]
+        return self._smallest_sum(k)
+
+    def _smallest_sum(self, k):
+        counts = self.counts
+        sums = self.sums
+        size = self.size
+        position = 0
+        total = 0
+        step = self._top_step
+        while step:
+            following = position + step
+            if following <= size and counts[following] <= k:
+                position = following
+                k -= counts[following]
+                total += sums[following]
+            step >>= 1
+        return total
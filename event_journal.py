@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+
+# Column order of the StateLog section written by AuctionApp.write_header_to_excel
+STATELOG_FIELDS = (
+    "timestamp", "event", "manager_id", "manager", "player_id",
+    "player", "base_bid", "bid_amount", "comment", "steps", "replaces"
+)
+# Bookkeeping records that are journaled but not part of the StateLog
+INTERNAL_EVENTS = ("SessionStart", "SessionEnd")
+
+
+class EventJournal:
+    """Append-only, line-delimited journal of auction events.
+
+    Each record is one JSON object per line. Records are flushed to the OS on
+    every append, while fsync is batched: it runs after ``fsync_every`` records
+    or once ``fsync_interval`` seconds have passed since the last sync.
+    """
+
+    def __init__(self, path, fsync_every=64, fsync_interval=0.5):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.seq = 0
+        self.offset = 0
+        if os.path.exists(path):
+            # Drop a partial record left behind by a crash before appending to it
+            end = 0
+            for record, end in iter_journal(path):
+                self.seq = record.get("seq", self.seq + 1)
+            if os.path.getsize(path) > end:
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+            self.offset = end
+        self._file = open(path, "ab")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record):
+        """Append one event record and return its sequence number."""
+        self.seq += 1
+        record["seq"] = self.seq
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        self._file.write(line)
+        self._file.flush()
+        self.offset += len(line)
+        self._unsynced += 1
+        if (self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval):
+            self.sync()
+        return self.seq
+
+    def sync(self):
+        """Force all appended records to stable storage."""
+        if self._unsynced and not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the journal file."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+def last_record(path):
+    """Return the last complete record of a journal, or None if it is empty."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 65536))
+        lines = f.read().split(b"\n")
+    for line in reversed(lines[:-1]):
+        try:
+            return json.loads(line)
+        except ValueError:
+            continue
+    return None
+
+
+def read_journal(path, offset=0):
+    """Yield the records of a journal starting at byte ``offset``.
+
+    A trailing partial line (e.g. from a crash mid-write) is ignored.
+    """
+    for record, _ in iter_journal(path, offset):
+        yield record
+
+
+def iter_journal(path, offset=0):
+    """Yield ``(record, end_offset)`` pairs for the complete lines of a journal."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            yield record, offset
+
+
+class SessionExporter:
+    """Background thread that mirrors a journal into the session's StateLog sheet.
+
+    The exporter owns the workbook once started: rows are appended from the
+    journal and the workbook is saved only on ``checkpoint()`` and ``close()``.
+    """
+
+    def __init__(self, wb, ws, excel_filename, journal_path, team_row_start=7):
+        self.wb = wb
+        self.ws = ws
+        self.excel_filename = excel_filename
+        self.journal_path = journal_path
+        self.team_row_start = team_row_start
+        self._offset = 0
+        self._end_money = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="SessionExporter", daemon=True)
+        self._thread.start()
+
+    def checkpoint(self):
+        """Ask the exporter to bring the session sheet up to date."""
+        self._wakeup.set()
+
+    def set_end_money(self, end_money):
+        """Record the End Money column values to write on the next export."""
+        with self._lock:
+            self._end_money = list(end_money)
+        self._wakeup.set()
+
+    def close(self):
+        """Run a final export and wait for the exporter thread to finish."""
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                self._export()
+            except Exception as e:
+                print(f"Session export failed: {e}")
+            if self._stopping:
+                break
+
+    def _export(self):
+        rows = 0
+        for record, self._offset in iter_journal(self.journal_path, self._offset):
+            if record.get("event") in INTERNAL_EVENTS:
+                continue
+            self.ws.append([record.get(field, "") for field in STATELOG_FIELDS])
+            rows += 1
+        with self._lock:
+            end_money, self._end_money = self._end_money, None
+        if end_money is not None:
+            for idx, money in enumerate(end_money):
+                self.ws[f"H{self.team_row_start+idx}"] = money
+        if rows or end_money is not None:
+            self.wb.save(self.excel_filename)
@@ -0,0 +1,184 @@
+import argparse
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+# Histogram bucket i counts calls that took less than 2**i microseconds; the last bucket takes the rest
+BUCKETS = 32
+DEFAULT_REPORT = "auction-instrumentation.json"
+# Percentiles listed by the report
+PERCENTILES = (50, 95, 99)
+
+
+class Histogram:
+    """Call count, total, extremes and a log2 latency histogram of one instrumented function."""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0] * BUCKETS
+
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[min(int(seconds * 1e6).bit_length(), BUCKETS - 1)] += 1
+
+    def percentile(self, percent):
+        """Return the upper bound, in seconds, of the bucket holding the given percentile."""
+        if not self.count:
+            return 0.0
+        wanted = self.count * percent / 100
+        seen = 0
+        for idx, count in enumerate(self.buckets):
+            seen += count
+            if seen >= wanted:
+                return min((1 << idx) / 1e6, self.max)
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total * 1000 / self.count if self.count else 0.0,
+            "min_ms": (self.min or 0.0) * 1000,
+            "max_ms": self.max * 1000,
+            **{f"p{percent}_ms": self.percentile(percent) * 1000 for percent in PERCENTILES},
+            "buckets_us": self.buckets,
+        }
+
+
+class Instruments:
+    """Opt-in latency histograms of the app's hot paths, plus an on-demand cProfile capture.
+
+    Instrumented functions are only wrapped while ``enabled`` is set at the
+    time they are wrapped; otherwise ``timed`` and ``wrap`` hand back the
+    functions untouched, so a normal session pays nothing per call.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output = DEFAULT_REPORT
+        self.histograms = {}
+        self.profiler = None
+        self.profiling = False
+        self.started = datetime.now()
+        self._lock = threading.Lock()
+
+    def timed(self, name, function):
+        """Return ``function`` timed under ``name`` if instrumentation is enabled, else ``function`` itself."""
+        if not self.enabled:
+            return function
+        histogram = self.histograms.setdefault(name, Histogram())
+        lock = self._lock
+        clock = time.perf_counter
+
+        def timed_function(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                # Workbook saves are timed on the exporter thread too
+                with lock:
+                    histogram.record(elapsed)
+        return timed_function
+
+    def wrap(self, obj, *names, prefix=""):
+        """Replace the named methods of one object with timed versions."""
+        if self.enabled:
+            for name in names:
+                setattr(obj, name, self.timed(prefix + name, getattr(obj, name)))
+
+    # --- Profiling ---
+
+    def toggle_profile(self):
+        """Start or pause the cProfile capture of the Tk thread and return whether it is now running.
+
+        Captures accumulate: pausing and resuming adds to the same profile.
+        """
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+        if self.profiling:
+            self.profiler.disable()
+        else:
+            self.profiler.enable()
+        self.profiling = not self.profiling
+        return self.profiling
+
+    # --- Export ---
+
+    def report(self):
+        """Return the histograms as a JSON-ready dict."""
+        with self._lock:
+            functions = {name: histogram.as_dict() for name, histogram in sorted(self.histograms.items())}
+        return {
+            "started": self.started.isoformat(timespec="seconds"),
+            "ended": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "functions": functions,
+        }
+
+    def save(self, path=None):
+        """Write the report, and the cProfile capture next to it as ``.prof``; return the files written."""
+        path = path or self.output
+        paths = []
+        if self.histograms:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, indent=2)
+            os.replace(tmp_path, path)
+            paths.append(path)
+        if self.profiler is not None:
+            if self.profiling:
+                self.toggle_profile()
+            profile_path = os.path.splitext(path)[0] + ".prof"
+            self.profiler.dump_stats(profile_path)
+            paths.append(profile_path)
+        return paths
+
+
+instruments = Instruments()
+
+
+def format_report(report, baseline=None):
+    """Return a report as a text table; with a baseline report, add the change in mean and p95."""
+    lines = [f"{'Function':<20} {'Calls':>8} {'Mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Max ms':>9}"]
+    base_functions = baseline["functions"] if baseline else {}
+    for name, stats in report["functions"].items():
+        line = (f"{name:<20} {stats['count']:>8} {stats['mean_ms']:>9.3f} {stats['p50_ms']:>9.3f} "
+                f"{stats['p95_ms']:>9.3f} {stats['p99_ms']:>9.3f} {stats['max_ms']:>9.3f}")
+        base = base_functions.get(name)
+        if base:
+            line += f"   mean {stats['mean_ms'] - base['mean_ms']:+.3f}   p95 {stats['p95_ms'] - base['p95_ms']:+.3f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print an instrumentation report, optionally against a baseline")
+    parser.add_argument("report", help="report written by the app's --instrument option")
+    parser.add_argument("baseline", nargs="?", help="earlier report to compare with")
+    args = parser.parse_args()
+    with open(args.report, encoding="utf-8") as f:
+        report = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print(format_report(report, baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import tkinter as tk
+
+# Resolution of the timer wheel
+TICK_MS = 100
+# Slots of the timer wheel; delays longer than SLOTS * TICK_MS take extra turns of the wheel
+SLOTS = 512
+# How long a toast stays up, and how many are shown at once
+TOAST_MS = 3000
+MAX_TOASTS = 4
+TOAST_COLORS = {"info": "#333333", "warning": "#b35900", "success": "#2e7d32"}
+# Calls announced before a round closes on its own, one per countdown phase
+ROUND_CALLS = ("Going once", "Going twice")
+
+
+class Timer:
+    """Handle of a callback scheduled on a TimerWheel."""
+
+    __slots__ = ("rounds", "callback", "cancelled")
+
+    def __init__(self, rounds, callback):
+        self.rounds = rounds
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """Keep the callback from running."""
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Runs any number of timers from one Tk ``after`` tick.
+
+    Timers are hashed into SLOTS buckets by expiry tick, so scheduling and
+    cancelling are O(1) and each tick only looks at one bucket. The tick is
+    only armed while timers are pending.
+    """
+
+    def __init__(self, widget, tick_ms=TICK_MS, slots=SLOTS):
+        self.widget = widget
+        self.tick_ms = tick_ms
+        self.slots = [[] for _ in range(slots)]
+        self.current = 0
+        self.pending = 0
+        self._after = None
+
+    def schedule(self, delay_ms, callback):
+        """Run ``callback()`` after about ``delay_ms`` milliseconds and return its Timer."""
+        ticks = max(1, -(-delay_ms // self.tick_ms))
+        timer = Timer((ticks - 1) // len(self.slots), callback)
+        self.slots[(self.current + ticks) % len(self.slots)].append(timer)
+        self.pending += 1
+        if self._after is None:
+            self._after = self.widget.after(self.tick_ms, self._tick)
+        return timer
+
+    def _tick(self):
+        self._after = None
+        self.current = (self.current + 1) % len(self.slots)
+        due = []
+        waiting = []
+        for timer in self.slots[self.current]:
+            if timer.cancelled:
+                self.pending -= 1
+            elif timer.rounds:
+                timer.rounds -= 1
+                waiting.append(timer)
+            else:
+                self.pending -= 1
+                due.append(timer)
+        self.slots[self.current] = waiting
+        if self.pending:
+            self._after = self.widget.after(self.tick_ms, self._tick)
+        for timer in due:
+            timer.callback()
+
+    def stop(self):
+        """Cancel every timer and disarm the tick."""
+        if self._after is not None:
+            self.widget.after_cancel(self._after)
+            self._after = None
+        self.slots = [[] for _ in self.slots]
+        self.pending = 0
+
+
+class ToastArea(tk.Frame):
+    """Stack of short, non-modal notifications that dismiss themselves."""
+
+    def __init__(self, master, wheel, font=('Arial', 12), **kwargs):
+        super().__init__(master, **kwargs)
+        self.wheel = wheel
+        self.font = font
+        self.toasts = []
+
+    def show(self, text, kind="info", duration_ms=TOAST_MS):
+        """Show a notification for ``duration_ms`` without blocking input."""
+        while len(self.toasts) >= MAX_TOASTS:
+            self._dismiss(self.toasts[0])
+        toast = tk.Label(self, text=text, font=self.font, fg="white", bg=TOAST_COLORS.get(kind, TOAST_COLORS["info"]),
+                         padx=10, pady=5, wraplength=360, justify="left")
+        toast.pack(side="bottom", anchor="e", pady=2)
+        toast.bind("<Button-1>", lambda event: self._dismiss(toast))
+        self.toasts.append(toast)
+        self.wheel.schedule(duration_ms, lambda: self._dismiss(toast))
+        self.lift()
+        return toast
+
+    def _dismiss(self, toast):
+        if toast in self.toasts:
+            self.toasts.remove(toast)
+            toast.destroy()
+
+
+class RoundCountdown:
+    """Closes a bidding round on its own once nobody has bid for a while.
+
+    Every ``phase_ms`` without a bid announces the next of ROUND_CALLS; one
+    more phase after the last call runs ``on_expire``. ``reset`` restarts
+    the countdown, e.g. on every bid.
+    """
+
+    def __init__(self, wheel, phase_ms, on_call, on_expire):
+        self.wheel = wheel
+        self.phase_ms = phase_ms
+        self.on_call = on_call
+        self.on_expire = on_expire
+        self.phase = 0
+        self._timer = None
+
+    def reset(self):
+        """Start counting down from the beginning."""
+        self.stop()
+        self.phase = 0
+        self._timer = self.wheel.schedule(self.phase_ms, self._advance)
+
+    def stop(self):
+        """Stop counting down."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _advance(self):
+        if self.phase < len(ROUND_CALLS):
+            call = ROUND_CALLS[self.phase]
+            self.phase += 1
+            self._timer = self.wheel.schedule(self.phase_ms, self._advance)
+            self.on_call(call)
+        else:
+            self._timer = None
+            self.on_expire()
@@ -0,0 +1,250 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from auction_engine import FIRST_PLAYER_ID
+
+# Category tag at the end of a player name, e.g. "Q15" in "Neel Gajjar (Q15)"
+CATEGORY_PATTERN = re.compile(r"\(([^()]*)\)\s*$")
+# Searchable words of a player name, tags included
+TOKEN_PATTERN = re.compile(r"\w+")
+# Search prefixes up to this length get a precomputed posting list; longer ones bisect the token table
+SHORT_PREFIX = 2
+
+ORDER_ID = "id"
+ORDER_NAME = "name"
+ORDER_PRICE = "price"
+SORT_ORDERS = (ORDER_ID, ORDER_NAME, ORDER_PRICE)
+
+
+def tokens_of(text):
+    """Return the case-folded words of a name or search query."""
+    return TOKEN_PATTERN.findall(str(text).casefold())
+
+
+def category_of(name):
+    """Return the category tag of a player name, or "" if it has none."""
+    match = CATEGORY_PATTERN.search(str(name))
+    return match.group(1).strip() if match else ""
+
+
+class PlayerCatalog:
+    """Unsold players keyed by stable player ID, indexed by base price and by category.
+
+    ``names`` and ``base_bids`` are the engine's per-player columns (indexed
+    by player ID - FIRST_PLAYER_ID). Removing or restoring a player is O(1)
+    in every index; queries walk only the index buckets they need and sort
+    with ranks that are computed once per sort order.
+
+    Text search uses a TokenIndex over the names, built on the first
+    search and kept up to date by ``add`` and ``remove`` from then on.
+    """
+
+    def __init__(self, names, base_bids, player_ids):
+        self.names = names
+        self.base_bids = base_bids
+        self.players = {}
+        self.by_price = {}
+        self.by_category = {}
+        self._orders = {}
+        self._ranks = {}
+        self._search = None
+        for player_id in player_ids:
+            self.add(player_id)
+        self.prices = sorted(self.by_price)
+        self.categories = sorted(category for category in self.by_category if category)
+
+    def __len__(self):
+        return len(self.players)
+
+    def __contains__(self, player_id):
+        return player_id in self.players
+
+    def add(self, player_id):
+        """Add a player, or put back one whose sale was undone."""
+        if player_id in self.players:
+            return
+        index = player_id - FIRST_PLAYER_ID
+        category = category_of(self.names[index])
+        self.players[player_id] = category
+        self.by_price.setdefault(self.base_bids[index], {})[player_id] = None
+        self.by_category.setdefault(category, {})[player_id] = None
+        if self._search is not None:
+            self._search.add(player_id)
+
+    def remove(self, player_id):
+        """Drop a sold player from the catalog and its indexes."""
+        category = self.players.pop(player_id, None)
+        if category is None:
+            return
+        del self.by_price[self.base_bids[player_id - FIRST_PLAYER_ID]][player_id]
+        del self.by_category[category][player_id]
+        if self._search is not None:
+            self._search.remove(player_id)
+
+    def category(self, player_id):
+        """Return the category tag of an unsold player."""
+        return self.players[player_id]
+
+    def query(self, category=None, min_price=None, max_price=None, order=ORDER_ID, descending=False, text=None):
+        """Return the IDs of the unsold players matching the filters, sorted by ``order``.
+
+        ``text`` keeps the players with a name word or tag starting with
+        each of its words, e.g. "vir q1" finds "Viraj Shah (Q13)".
+        """
+        has_range = min_price is not None or max_price is not None
+        low = min_price if min_price is not None else float("-inf")
+        high = max_price if max_price is not None else float("inf")
+        terms = tokens_of(text) if text else None
+        if terms:
+            candidates = self.search(terms)
+            if category is not None or has_range:
+                players = self.players
+                base_bids = self.base_bids
+                candidates = [player_id for player_id in candidates
+                              if (category is None or players[player_id] == category)
+                              and (not has_range or low <= base_bids[player_id - FIRST_PLAYER_ID] <= high)]
+            if order == ORDER_ID:
+                # Posting lists are in player ID order already
+                return candidates[::-1] if descending else candidates
+        elif category is not None:
+            candidates = self.by_category.get(category, {})
+            if has_range:
+                base_bids = self.base_bids
+                candidates = [player_id for player_id in candidates
+                              if low <= base_bids[player_id - FIRST_PLAYER_ID] <= high]
+        elif has_range:
+            prices = self.prices[bisect_left(self.prices, low):bisect_right(self.prices, high)]
+            candidates = [player_id for price in prices for player_id in self.by_price[price]]
+        else:
+            candidates = self.players
+        return self._sorted(candidates, order, descending)
+
+    def search(self, terms):
+        """Return the IDs of the unsold players matching every search term, in player ID order."""
+        return self._search_index().search(terms)
+
+    def build_search_index(self):
+        """Build the text search index now rather than on the first search."""
+        self._search_index()
+
+    def _search_index(self):
+        if self._search is None:
+            self._search = TokenIndex(self.names, self.players)
+        return self._search
+
+    def _sorted(self, candidates, order, descending):
+        if order == ORDER_ID:
+            return sorted(candidates, reverse=descending)
+        rank = self._rank(order)
+        if len(candidates) > len(rank) // 8:
+            # Most players match: filtering the precomputed order beats sorting them again
+            members = candidates if isinstance(candidates, dict) else set(candidates)
+            result = [player_id for player_id in self._order(order) if player_id in members]
+            if descending:
+                result.reverse()
+            return result
+        return sorted(candidates, key=lambda player_id: rank[player_id - FIRST_PLAYER_ID], reverse=descending)
+
+    def _order(self, order):
+        """Return all player IDs, sold or not, in sort order; computed once per order."""
+        players = self._orders.get(order)
+        if players is None:
+            players = self._orders[order] = self._compute_order(order)
+        return players
+
+    def _compute_order(self, order):
+        names = self.names
+        base_bids = self.base_bids
+        if order == ORDER_NAME:
+            key = lambda index: (str(names[index]).casefold(), index)
+        elif order == ORDER_PRICE:
+            key = lambda index: (base_bids[index], index)
+        else:
+            raise ValueError(f"Unknown sort order: {order}")
+        return [FIRST_PLAYER_ID + index for index in sorted(range(len(base_bids)), key=key)]
+
+    def _rank(self, order):
+        rank = self._ranks.get(order)
+        if rank is None:
+            rank = array("i", [0]) * len(self.base_bids)
+            for position, player_id in enumerate(self._order(order)):
+                rank[player_id - FIRST_PLAYER_ID] = position
+            self._ranks[order] = rank
+        return rank
+
+
+class TokenIndex:
+    """Prefix index over the words of player names, holding the players currently added.
+
+    Words longer than SHORT_PREFIX characters get a posting list of their
+    own, found for longer search terms by bisecting a sorted word table;
+    shorter terms use the posting list of every 1 to SHORT_PREFIX character
+    prefix. Posting lists are dicts used as ordered sets, so adding or
+    removing a player touches only its own few keys. They are kept in
+    player ID order: a player put back behind a higher ID marks the list
+    for one re-sort on its next use.
+    """
+
+    def __init__(self, names, player_ids):
+        self.player_tokens = []
+        self.player_keys = []
+        self.postings = {}
+        self.unordered = set()
+        long_tokens = set()
+        for name in names:
+            tokens = tuple(dict.fromkeys(tokens_of(name)))
+            keys = {token[:length] for token in tokens for length in range(1, SHORT_PREFIX + 1)}
+            keys.update(token for token in tokens if len(token) > SHORT_PREFIX)
+            long_tokens.update(token for token in tokens if len(token) > SHORT_PREFIX)
+            self.player_tokens.append(tokens)
+            self.player_keys.append(tuple(keys))
+        self.tokens = sorted(long_tokens)
+        for player_id in sorted(player_ids):
+            self.add(player_id)
+
+    def add(self, player_id):
+        """Make a player findable."""
+        postings = self.postings
+        for key in self.player_keys[player_id - FIRST_PLAYER_ID]:
+            posting = postings.get(key)
+            if posting is None:
+                posting = postings[key] = {}
+            elif posting and player_id < next(reversed(posting)):
+                self.unordered.add(key)
+            posting[player_id] = None
+
+    def remove(self, player_id):
+        """Stop finding a player, e.g. once sold."""
+        postings = self.postings
+        for key in self.player_keys[player_id - FIRST_PLAYER_ID]:
+            postings[key].pop(player_id, None)
+
+    def search(self, terms):
+        """Return the IDs of the players with a word starting with each term, in player ID order."""
+        postings = sorted((self._posting(term) for term in terms), key=len)
+        if len(terms) == 1:
+            return list(postings[0])
+        # Start from the shortest list and check the other terms against each player's own words
+        player_tokens = self.player_tokens
+        return [player_id for player_id in postings[0]
+                if all(any(token.startswith(term) for token in player_tokens[player_id - FIRST_PLAYER_ID])
+                       for term in terms)]
+
+    def _posting(self, term):
+        if len(term) <= SHORT_PREFIX:
+            return self._list(term)
+        tokens = self.tokens
+        start = bisect_left(tokens, term)
+        # Every word with the prefix sorts between the term and the term followed by the highest character
+        end = bisect_left(tokens, term + "\U0010ffff", start)
+        if end - start == 1:
+            return self._list(tokens[start])
+        return sorted({player_id for token in tokens[start:end] for player_id in self._list(token)})
+
+    def _list(self, key):
+        posting = self.postings.get(key, {})
+        if key in self.unordered:
+            posting = self.postings[key] = dict.fromkeys(sorted(posting))
+            self.unordered.discard(key)
+        return posting
@@ -0,0 +1,149 @@
+import tkinter as tk
+
+# Height in pixels of one player row
+ROW_HEIGHT = 34
+# Compact the row table once this many sold players have left gaps in it
+COMPACT_MIN_GAPS = 64
+
+
+class PlayerListView(tk.Frame):
+    """Scrollable list of player buttons that only creates widgets for visible rows.
+
+    Rows are stored by player ID. Removing a sold player leaves a gap in the
+    row table, which costs O(1); gaps are skipped when drawing and compacted
+    away in bulk once they make up half of the table.
+    """
+
+    def __init__(self, master, text_for, on_select, font=('Arial', 12), **kwargs):
+        super().__init__(master, **kwargs)
+        self.text_for = text_for
+        self.on_select = on_select
+        self.font = font
+        self._rows = []      # player IDs in display order, None where a player was removed
+        self._index = {}     # player ID -> position in self._rows
+        self._live = 0
+        self._top = 0        # position in self._rows of the first visible row
+        self._bottom = 0     # position in self._rows just past the last visible row
+        self._buttons = []   # widget pool, one per visible row
+
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.viewport = tk.Frame(self)
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.viewport.bind("<Configure>", lambda event: self.refresh())
+        self._bind_wheel(self.viewport)
+
+    # --- Data ---
+
+    def set_players(self, player_ids):
+        """Replace the listed players."""
+        self._rows = list(player_ids)
+        self._index = {player_id: pos for pos, player_id in enumerate(self._rows)}
+        self._live = len(self._rows)
+        self._top = 0
+        self.refresh()
+
+    def remove(self, player_id):
+        """Remove one player from the list."""
+        pos = self._index.pop(player_id, None)
+        if pos is None:
+            return
+        self._rows[pos] = None
+        self._live -= 1
+        gaps = len(self._rows) - self._live
+        if gaps >= COMPACT_MIN_GAPS and gaps * 2 >= len(self._rows):
+            self._compact()
+            self.refresh()
+        elif self._top <= pos < self._bottom:
+            self.refresh()
+
+    def __len__(self):
+        return self._live
+
+    def __contains__(self, player_id):
+        return player_id in self._index
+
+    def _compact(self):
+        top_player = self._first_live(self._top)
+        self._rows = [player_id for player_id in self._rows if player_id is not None]
+        self._index = {player_id: pos for pos, player_id in enumerate(self._rows)}
+        self._top = self._index.get(top_player, len(self._rows))
+
+    def _first_live(self, pos):
+        rows = self._rows
+        while pos < len(rows) and rows[pos] is None:
+            pos += 1
+        return rows[pos] if pos < len(rows) else None
+
+    # --- Drawing ---
+
+    def visible_rows(self):
+        """Return how many rows fit in the viewport."""
+        return max(1, self.viewport.winfo_height() // ROW_HEIGHT + 1)
+
+    def refresh(self):
+        """Redraw the visible rows."""
+        count = self.visible_rows()
+        while len(self._buttons) < count:
+            button = tk.Button(self.viewport, font=self.font, anchor="w")
+            self._bind_wheel(button)
+            self._buttons.append(button)
+
+        rows = self._rows
+        pos = min(self._top, len(rows))
+        for slot, button in enumerate(self._buttons):
+            while pos < len(rows) and rows[pos] is None:
+                pos += 1
+            if slot < count and pos < len(rows):
+                player_id = rows[pos]
+                button.config(
+                    text=self.text_for(player_id),
+                    command=lambda player_id=player_id: self.on_select(player_id)
+                )
+                button.place(x=0, y=slot * ROW_HEIGHT, relwidth=1, height=ROW_HEIGHT)
+                pos += 1
+            else:
+                button.place_forget()
+        self._bottom = pos
+
+        if rows:
+            self.scrollbar.set(self._top / len(rows), min(1.0, pos / len(rows)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # --- Scrolling ---
+
+    def yview(self, *args):
+        """Scrollbar callback implementing the ``moveto`` and ``scroll`` commands."""
+        if not self._rows:
+            return
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            steps = int(args[1])
+            if args[2] == "pages":
+                steps *= self.visible_rows() - 1
+            self.scroll_rows(steps)
+            return
+        self._top = max(0, min(self._top, len(self._rows) - self.visible_rows() + 1))
+        self.refresh()
+
+    def scroll_rows(self, steps):
+        """Scroll by ``steps`` listed players (negative scrolls up)."""
+        rows = self._rows
+        pos = self._top
+        step = 1 if steps > 0 else -1
+        for _ in range(abs(steps)):
+            nxt = pos + step
+            while 0 <= nxt < len(rows) and rows[nxt] is None:
+                nxt += step
+            if not 0 <= nxt < len(rows):
+                break
+            pos = nxt
+        self._top = pos
+        self.refresh()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda event: self.scroll_rows(-1 if event.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda event: self.scroll_rows(-1))
+        widget.bind("<Button-5>", lambda event: self.scroll_rows(1))
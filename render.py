@@ -0,0 +1,84 @@
+class LabelRenderer:
+    """Coalesces label updates into one refresh per idle cycle.
+
+    Callers mark which parts of the display changed; the next Tk idle
+    callback redraws only those: the status lines and the money and
+    inventory labels of the marked teams.
+    """
+
+    def __init__(self, widget, render_status, render_money, render_inventory):
+        self.widget = widget
+        self.render_status = render_status
+        self.render_money = render_money
+        self.render_inventory = render_inventory
+        self.status_dirty = False
+        self.money_dirty = set()
+        self.inventory_dirty = set()
+        self._scheduled = None
+
+    def mark_status(self):
+        """Redraw the current item and bid status lines."""
+        self.status_dirty = True
+        self._schedule()
+
+    def mark_team(self, team_id, money=True, inventory=True):
+        """Redraw one team's money and/or inventory label."""
+        if money:
+            self.money_dirty.add(team_id)
+        if inventory:
+            self.inventory_dirty.add(team_id)
+        self._schedule()
+
+    def mark_all(self, team_ids):
+        """Redraw everything."""
+        self.status_dirty = True
+        self.money_dirty.update(team_ids)
+        self.inventory_dirty.update(team_ids)
+        self._schedule()
+
+    def _schedule(self):
+        if self._scheduled is None:
+            self._scheduled = self.widget.after_idle(self.flush)
+
+    def flush(self):
+        """Redraw the marked widgets now."""
+        if self._scheduled is not None:
+            self.widget.after_cancel(self._scheduled)
+            self._scheduled = None
+        if self.status_dirty:
+            self.status_dirty = False
+            self.render_status()
+        money_dirty, self.money_dirty = self.money_dirty, set()
+        for team_id in money_dirty:
+            self.render_money(team_id)
+        inventory_dirty, self.inventory_dirty = self.inventory_dirty, set()
+        for team_id in inventory_dirty:
+            self.render_inventory(team_id)
+
+
+class InventoryText:
+    """Per-team inventory text that grows by one line per purchase instead of being rebuilt."""
+
+    def __init__(self, format_line):
+        self.format_line = format_line   # (position, player ID, price) -> line of text
+        self.texts = {}
+        self.counts = {}
+
+    def get(self, team_id):
+        """Return the inventory text of a team."""
+        return self.texts.get(team_id, "")
+
+    def append(self, team_id, player_id, price):
+        """Add one purchased player to the end of a team's inventory text."""
+        count = self.counts.get(team_id, 0) + 1
+        line = self.format_line(count, player_id, price)
+        self.texts[team_id] = f"{self.texts[team_id]}\n{line}" if count > 1 else line
+        self.counts[team_id] = count
+
+    def rebuild(self, team_id, inventory):
+        """Regenerate a team's text from its ``{player ID: price}`` inventory."""
+        self.texts[team_id] = "\n".join(
+            self.format_line(idx + 1, player_id, price)
+            for idx, (player_id, price) in enumerate(inventory.items())
+        )
+        self.counts[team_id] = len(inventory)
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import marshal
+import os
+import time
+
+from bid_ladder import BidLadder
+from roster_loader import Roster, load_roster
+
+# Parsed rosters are cached here unless AUCTION_ROSTER_CACHE names another directory
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "auction-manager", "rosters")
+# Least recently used entries are evicted once the cache grows past this many bytes
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Bumped whenever the entry layout or the roster rules change; marshal data is only valid for one Python version too
+FORMAT = f"roster-2-marshal-{marshal.version}"
+INDEX_FILE = "index.json"
+
+
+def file_digest(path):
+    """Return the BLAKE2b hex digest of a file's content."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RosterCache:
+    """On-disk cache of parsed and validated rosters, keyed by file content.
+
+    Each entry holds one roster's teams, players and ladder in marshal
+    form, named after the BLAKE2b digest of the roster file. The index
+    remembers every roster path's mtime and size with the digest last seen
+    there: if both still match, the file is neither hashed nor parsed. A
+    changed file gets a new digest, so stale entries are never returned.
+    Entries are evicted least recently used first once they take more than
+    ``max_bytes``.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or os.environ.get("AUCTION_ROSTER_CACHE") or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.directory, INDEX_FILE)
+
+    def load(self, file_path, loader=load_roster):
+        """Return the roster of ``file_path``, parsing it with ``loader`` only on a cache miss.
+
+        The cache is best effort: if it cannot be read or written, the file
+        is parsed as if there were no cache.
+        """
+        try:
+            index = self._read_index()
+            path = os.path.abspath(file_path)
+            stat = os.stat(path)
+            known = index["paths"].get(path)
+            if known is not None and known[:2] == [stat.st_mtime_ns, stat.st_size] and known[2] in index["entries"]:
+                digest = known[2]
+            else:
+                digest = file_digest(path)
+        except (OSError, ValueError, TypeError, KeyError):
+            return loader(file_path)
+        roster = None
+        if digest in index["entries"]:
+            try:
+                roster = self._read_entry(digest)
+            except (OSError, ValueError, EOFError, TypeError):
+                # A damaged entry is treated as a miss and written again
+                del index["entries"][digest]
+        if roster is None:
+            roster = loader(file_path)
+            try:
+                size = self._write_entry(digest, roster)
+            except (OSError, ValueError):
+                return roster
+            index["entries"][digest] = [size, 0]
+        index["paths"][path] = [stat.st_mtime_ns, stat.st_size, digest]
+        index["entries"][digest][1] = time.time()
+        try:
+            self._evict(index)
+            self._write_index(index)
+        except OSError:
+            pass
+        return roster
+
+    def clear(self):
+        """Delete every cached roster."""
+        index = self._read_index()
+        for digest in index["entries"]:
+            self._remove_entry(digest)
+        self._write_index({"format": FORMAT, "paths": {}, "entries": {}})
+
+    # --- Internals ---
+
+    def _entry_path(self, digest):
+        return os.path.join(self.directory, digest + ".roster")
+
+    def _read_entry(self, digest):
+        with open(self._entry_path(digest), "rb") as f:
+            # One read and loads(): marshal.load() on a file object reads it in tiny pieces
+            teams, players, ladder = marshal.loads(f.read())
+        return Roster(teams, players, BidLadder(ladder) if ladder else None)
+
+    def _write_entry(self, digest, roster):
+        """Write one entry and return its size; raises ValueError for cell values marshal cannot store."""
+        data = marshal.dumps((
+            [tuple(team) for team in roster.teams],
+            [tuple(player) for player in roster.players],
+            roster.ladder.tiers() if roster.ladder is not None else None,
+        ))
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._entry_path(digest) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._entry_path(digest))
+        return len(data)
+
+    def _remove_entry(self, digest):
+        try:
+            os.remove(self._entry_path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            index = None
+        if not index or index.get("format") != FORMAT:
+            # Entries written in another format or by another Python version are ignored and replaced
+            return {"format": FORMAT, "paths": {}, "entries": {}}
+        return index
+
+    def _write_index(self, index):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _evict(self, index):
+        entries = index["entries"]
+        total = sum(size for size, _ in entries.values())
+        if total <= self.max_bytes:
+            return
+        for digest in sorted(entries, key=lambda digest: entries[digest][1]):
+            if total <= self.max_bytes or len(entries) == 1:
+                break
+            total -= entries.pop(digest)[0]
+            self._remove_entry(digest)
+        index["paths"] = {path: known for path, known in index["paths"].items() if known[2] in entries}
+
+
+def load_roster_cached(file_path, cache=None):
+    """Load a roster through the default RosterCache."""
+    return (cache or RosterCache()).load(file_path)
@@ -0,0 +1,95 @@
+import os
+
+from bid_ladder import LADDER_SHEET, parse_ladder_rows
+
+
+class RosterError(ValueError):
+    """Raised when a roster file does not have the expected layout."""
+
+
+class Roster:
+    """Teams and players read from a roster file.
+
+    ``teams`` holds ``(team name, starting money)`` pairs and ``players``
+    holds ``(player name, base bid)`` pairs, both in file order. ``ladder``
+    is the league's BidLadder when the file has one, otherwise None.
+    """
+
+    def __init__(self, teams, players, ladder=None):
+        self.teams = teams
+        self.players = players
+        self.ladder = ladder
+
+
+def load_roster(file_path):
+    """Load the roster from the first sheet of an Excel file.
+
+    The sheet holds a header row and one row per team, a blank row, then a
+    second header row and one row per player. Only the first two columns
+    are used. An optional "BidLadder" sheet lists ``(bid from, increment)``
+    tiers under a header row.
+    """
+    if os.path.splitext(file_path)[1].lower() == ".xls":
+        return load_roster_xls(file_path)
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        roster = parse_roster_rows(wb.worksheets[0].iter_rows(values_only=True))
+        if LADDER_SHEET in wb.sheetnames:
+            roster.ladder = parse_ladder_rows(wb[LADDER_SHEET].iter_rows(values_only=True))
+        return roster
+    finally:
+        wb.close()
+
+
+def parse_roster_rows(rows):
+    """Build a Roster from the cell values of a roster sheet in a single pass.
+
+    The first completely empty row ends the teams. Later completely empty
+    rows are skipped; a row with only some of its cells filled is an error.
+    """
+    rows = iter(rows)
+    next(rows, None)  # Team header row
+    teams = []
+    players = []
+    section = teams
+    skip_header = False
+    for row_number, row in enumerate(rows, start=2):
+        if all(_empty(value) for value in row):
+            if section is teams:
+                section = players
+                skip_header = True
+            continue
+        if skip_header:
+            skip_header = False
+            continue
+        name, value = (tuple(row[:2]) + (None, None))[:2]
+        if _empty(name) or _empty(value):
+            raise RosterError(f"File contains missing values in row {row_number}. Please fill all cells.")
+        try:
+            section.append((name, int(value)))
+        except ValueError:
+            raise RosterError(f"Row {row_number} has {value!r} where a number was expected.") from None
+    if section is teams:
+        raise RosterError("No blank row separating the teams from the players.")
+    return Roster(teams, players)
+
+
+def _empty(value):
+    # Cells holding only spaces look empty in Excel, so they count as empty
+    return value is None or isinstance(value, str) and not value.strip()
+
+
+def load_roster_xls(file_path):
+    """Load a legacy .xls roster, which openpyxl cannot read, through pandas."""
+    import pandas as pd
+    with pd.ExcelFile(file_path) as book:
+        roster = parse_roster_rows(_sheet_rows(pd, book.parse(0, header=None)))
+        if LADDER_SHEET in book.sheet_names:
+            roster.ladder = parse_ladder_rows(_sheet_rows(pd, book.parse(LADDER_SHEET, header=None)))
+    return roster
+
+
+def _sheet_rows(pd, sheet):
+    return (tuple(None if pd.isnull(value) else value for value in row)
+            for row in sheet.itertuples(index=False))
@@ -0,0 +1,407 @@
+import argparse
+import hashlib
+import json
+import marshal
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from auction_engine import FIRST_PLAYER_ID, FIRST_TEAM_ID, NO_TEAM, OK, AuctionEngine, apply_event
+from auction_history import AuctionHistory
+from player_catalog import category_of
+from session_manifest import SESSION_PATTERN
+
+# {auction name}_{YYYYMMDD}.xlsx holds a day's sessions; {auction name}_{YYYYMMDD}_Session_N.xlsx holds one
+WORKBOOK_PATTERN = re.compile(r"^(?P<auction>.+)_(?P<day>\d{8})(?:_(?P<session>Session_\d+))?\.xlsx$")
+# Workbooks from before the Steps column only say how far a Rewind or Redo moved in its comment
+STEPS_PATTERN = re.compile(r"(\d+) step")
+# StateLog columns of the Steps and Replaces fields
+STEPS_COLUMN = 9
+REPLACES_COLUMN = 10
+DEFAULT_INDEX_DIR = ".season-index"
+# Bumped whenever the chunk layout changes; marshal data is only valid for one Python version too
+FORMAT = f"season-1-marshal-{marshal.version}"
+INDEX_FILE = "index.json"
+# Normalized StateLog columns, one value per event row
+EVENT_COLUMNS = ("auction", "day", "session", "timestamp", "event", "team", "player", "tag", "base_bid",
+                 "bid_amount", "final")
+
+
+def discover(directories, auction_name=None):
+    """Return the daily and per-session workbooks under ``directories``, sorted by path."""
+    paths = []
+    for directory in directories:
+        for root, _, names in os.walk(directory):
+            for name in names:
+                match = WORKBOOK_PATTERN.match(name)
+                if match is None or name.startswith("~$") or name.endswith(".tmp.xlsx"):
+                    continue
+                if auction_name is None or match.group("auction") == auction_name:
+                    paths.append(os.path.abspath(os.path.join(root, name)))
+    return sorted(paths)
+
+
+def _cell(row, column):
+    return row[column] if column < len(row) else None
+
+
+def _number(value):
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_session_sheet(rows):
+    """Read one session sheet laid out by ``write_header_to_excel``.
+
+    Returns ``(teams, players, events)``: ``(name, starting money)`` and
+    ``(name, base bid)`` pairs in ID order and the StateLog rows, or None if
+    the sheet has no player table.
+    """
+    teams = []
+    players = []
+    events = []
+    section = None
+    for row in rows:
+        first = _cell(row, 0)
+        if section is None:
+            if first == "PlayerID":
+                section = "roster"
+        elif section == "roster":
+            # Read-only worksheets may skip the blank row before the StateLog header
+            if first == "Timestamp":
+                section = "log"
+                continue
+            if first is None and _cell(row, 4) is None:
+                section = "gap"
+                continue
+            if first is not None:
+                players.append((str(_cell(row, 1)), _number(_cell(row, 2)) or 0))
+            if _cell(row, 4) is not None:
+                teams.append((str(_cell(row, 4)), _number(_cell(row, 6)) or 0))
+        elif section == "gap":
+            if first == "Timestamp":
+                section = "log"
+        elif first is not None:
+            events.append(row)
+    return (teams, players, events) if section is not None else None
+
+
+def replay_sales(teams, players, events):
+    """Return the positions of the Bought rows whose sale stands at the end of the session.
+
+    The StateLog is replayed through an AuctionEngine with an undo history,
+    so sales that were later stepped back are not counted. If the log cannot
+    be replayed, the last Bought row of each player is taken instead.
+    """
+    last_sale = {}
+    for pos, row in enumerate(events):
+        if _cell(row, 1) == "Bought":
+            last_sale[_number(_cell(row, 4))] = pos
+    engine = AuctionEngine(teams, players)
+    AuctionHistory(engine)
+    try:
+        for row in events:
+            steps = _number(_cell(row, STEPS_COLUMN))
+            if steps is None:
+                match = STEPS_PATTERN.search(str(_cell(row, 8) or ""))
+                steps = int(match.group(1)) if match else 1
+            record = {
+                "event": _cell(row, 1),
+                "manager_id": _number(_cell(row, 2)) or NO_TEAM,
+                "player_id": _number(_cell(row, 4)),
+                "bid_amount": _number(_cell(row, 7)),
+                "steps": steps,
+            }
+            replaces = _number(_cell(row, REPLACES_COLUMN))
+            if replaces is not None:
+                # The open lot a selection dropped while other lots were open
+                record["replaces"] = replaces
+            if apply_event(engine, record) != OK:
+                raise ValueError(f"cannot replay {record['event']}")
+    except (ValueError, KeyError, IndexError, TypeError):
+        return set(last_sale.values())
+    final = set()
+    for player_id, pos in last_sale.items():
+        row = events[pos]
+        team_id = _number(_cell(row, 2))
+        if team_id is not None and engine.inventory[team_id].get(player_id) == _number(_cell(row, 7)):
+            final.add(pos)
+    return final
+
+
+def parse_workbook(path):
+    """Normalize the StateLog of every session sheet in one workbook into columns.
+
+    Runs in a worker process, so it takes and returns only plain values:
+    ``{"sessions": [session names], "columns": {column: values}}``.
+    """
+    from openpyxl import load_workbook
+    match = WORKBOOK_PATTERN.match(os.path.basename(path))
+    auction = match.group("auction")
+    raw_day = match.group("day")
+    day = f"{raw_day[:4]}-{raw_day[4:6]}-{raw_day[6:]}"
+    columns = {column: [] for column in EVENT_COLUMNS}
+    sessions = []
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet_name in wb.sheetnames:
+            if not SESSION_PATTERN.search(sheet_name):
+                continue
+            parsed = parse_session_sheet(wb[sheet_name].iter_rows(values_only=True))
+            if parsed is None:
+                continue
+            teams, players, events = parsed
+            sessions.append(sheet_name)
+            final = replay_sales(teams, players, events)
+            for pos, row in enumerate(events):
+                team_id = _number(_cell(row, 2))
+                player_id = _number(_cell(row, 4))
+                player = _cell(row, 5)
+                columns["auction"].append(auction)
+                columns["day"].append(day)
+                columns["session"].append(sheet_name)
+                columns["timestamp"].append(str(_cell(row, 0)))
+                columns["event"].append(_cell(row, 1))
+                columns["team"].append(teams[team_id - FIRST_TEAM_ID][0]
+                                       if team_id and team_id - FIRST_TEAM_ID < len(teams) else None)
+                columns["player"].append(player)
+                columns["tag"].append(category_of(player) if player is not None else None)
+                base_bid = _number(_cell(row, 6))
+                if base_bid is None and player_id and 0 <= player_id - FIRST_PLAYER_ID < len(players):
+                    base_bid = players[player_id - FIRST_PLAYER_ID][1]
+                columns["base_bid"].append(base_bid)
+                columns["bid_amount"].append(_number(_cell(row, 7)))
+                columns["final"].append(pos in final)
+    finally:
+        wb.close()
+    return {"sessions": sessions, "columns": columns}
+
+
+def _try_parse_workbook(path):
+    """Return ``(parse_workbook(path), None)``, or ``(None, message)`` if the workbook cannot be read."""
+    try:
+        return parse_workbook(path), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+class SeasonIndex:
+    """Persistent, incremental store of normalized StateLog columns, one chunk per workbook.
+
+    The index remembers each workbook's mtime and size: ``update`` only
+    parses workbooks that are new or changed since the last run, on a
+    process pool, and drops the chunks of workbooks that are gone.
+    """
+
+    def __init__(self, directory=DEFAULT_INDEX_DIR):
+        self.directory = directory
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.files = self._read_index()
+
+    def update(self, paths, workers=None):
+        """Bring the index in line with ``paths`` and return how many workbooks were parsed.
+
+        Workbooks that cannot be read, e.g. because they are being saved,
+        are skipped and tried again next time.
+        """
+        paths = [os.path.abspath(path) for path in paths]
+        stale = []
+        for path in paths:
+            stat = os.stat(path)
+            known = self.files.get(path)
+            if known is None or known["stamp"] != [stat.st_mtime_ns, stat.st_size]:
+                stale.append((path, [stat.st_mtime_ns, stat.st_size]))
+        wanted = set(paths)
+        for path in [path for path in self.files if path not in wanted]:
+            self._remove_chunk(self.files.pop(path)["chunk"])
+        skipped = 0
+        if stale:
+            os.makedirs(self.directory, exist_ok=True)
+            if len(stale) == 1 or workers == 1:
+                results = [_try_parse_workbook(path) for path, _ in stale]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_try_parse_workbook, [path for path, _ in stale], chunksize=4))
+            for (path, stamp), (result, error) in zip(stale, results):
+                if error is not None:
+                    # Left out of the index, so the workbook is tried again on the next run
+                    print(f"Skipping {path}: {error}")
+                    skipped += 1
+                    continue
+                chunk = hashlib.blake2b(path.encode("utf-8"), digest_size=16).hexdigest() + ".chunk"
+                self._write_chunk(chunk, result["columns"])
+                self.files[path] = {"stamp": stamp, "chunk": chunk, "sessions": result["sessions"]}
+        self._write_index()
+        return len(stale) - skipped
+
+    def dataset(self):
+        """Return a SeasonDataset of every indexed event.
+
+        A session found both in its own workbook and in a merged daily
+        workbook is read from its own workbook only.
+        """
+        own = {}
+        for path in self.files:
+            match = WORKBOOK_PATTERN.match(os.path.basename(path))
+            if match.group("session"):
+                own.setdefault((match.group("auction"), match.group("day")), set()).add(match.group("session"))
+        columns = {column: [] for column in EVENT_COLUMNS}
+        for path in sorted(self.files):
+            match = WORKBOOK_PATTERN.match(os.path.basename(path))
+            chunk = self._read_chunk(self.files[path]["chunk"])
+            separate = own.get((match.group("auction"), match.group("day")))
+            if match.group("session") is None and separate:
+                keep = [session not in separate for session in chunk["session"]]
+                if not all(keep):
+                    chunk = {column: [value for value, kept in zip(values, keep) if kept]
+                             for column, values in chunk.items()}
+            for column in EVENT_COLUMNS:
+                columns[column] += chunk[column]
+        return SeasonDataset(columns)
+
+    # --- Internals ---
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return {}
+        # Chunks written in another format or by another Python version are parsed again
+        return index["files"] if index.get("format") == FORMAT else {}
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT, "files": self.files}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _read_chunk(self, chunk):
+        with open(os.path.join(self.directory, chunk), "rb") as f:
+            return marshal.loads(f.read())
+
+    def _write_chunk(self, chunk, columns):
+        path = os.path.join(self.directory, chunk)
+        with open(path + ".tmp", "wb") as f:
+            f.write(marshal.dumps(columns))
+        os.replace(path + ".tmp", path)
+
+    def _remove_chunk(self, chunk):
+        try:
+            os.remove(os.path.join(self.directory, chunk))
+        except FileNotFoundError:
+            pass
+
+
+class SeasonDataset:
+    """StateLog events of many sessions as columns, ``{column: values}`` in EVENT_COLUMNS order."""
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["event"])
+
+    def sales(self):
+        """Return the positions of the sales that stood at the end of their session."""
+        columns = self.columns
+        return [pos for pos, (event, final) in enumerate(zip(columns["event"], columns["final"]))
+                if event == "Bought" and final]
+
+    def price_trend(self, tag=None):
+        """Return ``{tag: [(day, sales, average price, average premium over base)]}``, by day.
+
+        With ``tag`` set, only that tag's trend is returned.
+        """
+        columns = self.columns
+        totals = {}
+        for pos in self.sales():
+            player_tag = columns["tag"][pos]
+            if tag is not None and player_tag != tag:
+                continue
+            price = columns["bid_amount"][pos] or 0
+            day_totals = totals.setdefault(player_tag, {}).setdefault(columns["day"][pos], [0, 0, 0])
+            day_totals[0] += 1
+            day_totals[1] += price
+            day_totals[2] += price - (columns["base_bid"][pos] or 0)
+        return {
+            player_tag: [(day, count, price / count, premium / count)
+                         for day, (count, price, premium) in sorted(days.items())]
+            for player_tag, days in sorted(totals.items())
+        }
+
+    def spend_curve(self, team=None):
+        """Return ``{team: [(day, spent that day, cumulative spend)]}``.
+
+        With ``team`` set, only that team's curve is returned.
+        """
+        columns = self.columns
+        totals = {}
+        for pos in self.sales():
+            team_name = columns["team"][pos]
+            if team is not None and team_name != team:
+                continue
+            days = totals.setdefault(team_name, {})
+            days[columns["day"][pos]] = days.get(columns["day"][pos], 0) + (columns["bid_amount"][pos] or 0)
+        curves = {}
+        for team_name, days in sorted(totals.items()):
+            cumulative = 0
+            curve = []
+            for day, spent in sorted(days.items()):
+                cumulative += spent
+                curve.append((day, spent, cumulative))
+            curves[team_name] = curve
+        return curves
+
+    def summary(self):
+        """Return dataset-wide counts."""
+        columns = self.columns
+        return {
+            "days": len(set(columns["day"])),
+            "sessions": len(set(zip(columns["auction"], columns["day"], columns["session"]))),
+            "events": len(self),
+            "sales": len(self.sales()),
+            "tags": sorted({tag for tag in columns["tag"] if tag}),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse the StateLogs of many auction day workbooks")
+    parser.add_argument("directories", nargs="+", metavar="DIRECTORY",
+                        help="directories searched for {auction}_{YYYYMMDD}[_Session_N].xlsx workbooks")
+    parser.add_argument("--auction", help="only use workbooks of this auction name")
+    parser.add_argument("--index", default=DEFAULT_INDEX_DIR,
+                        help=f"directory of the incremental index (default {DEFAULT_INDEX_DIR})")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--price-trend", metavar="TAG", nargs="?", const="",
+                        help="average price per day of players with TAG (all tags if omitted)")
+    parser.add_argument("--spend-curve", metavar="TEAM", nargs="?", const="",
+                        help="spend per day and cumulative spend of TEAM (all teams if omitted)")
+    args = parser.parse_args()
+
+    index = SeasonIndex(args.index)
+    paths = discover(args.directories, args.auction)
+    parsed = index.update(paths, args.workers)
+    dataset = index.dataset()
+    summary = dataset.summary()
+    print(f"{len(paths)} workbooks ({parsed} parsed), {summary['days']} days, {summary['sessions']} sessions, "
+          f"{summary['events']} events, {summary['sales']} sales")
+    if args.price_trend is not None:
+        for tag, trend in dataset.price_trend(args.price_trend or None).items():
+            print(f"\n{tag or '(no tag)'}")
+            for day, count, price, premium in trend:
+                print(f"  {day}  {count:>4} sold  avg ₹{price:,.0f}  premium ₹{premium:,.0f}")
+    if args.spend_curve is not None:
+        for team, curve in dataset.spend_curve(args.spend_curve or None).items():
+            print(f"\n{team}")
+            for day, spent, cumulative in curve:
+                print(f"  {day}  ₹{spent:>10,}  total ₹{cumulative:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import csv
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from auction_engine import FIRST_PLAYER_ID, FIRST_TEAM_ID
+from event_journal import INTERNAL_EVENTS, STATELOG_FIELDS, iter_journal
+from session_manifest import MANIFEST_SUFFIX, SessionManifest
+from session_recovery import SessionState
+
+FORMATS = ("xlsx", "csv", "parquet")
+# Added to the session's file name, so an export never lands on the session's own workbook
+EXPORT_SUFFIX = "_export"
+PLAYER_COLUMNS = ("PlayerID", "Player Name", "Base Bid Value")
+TEAM_COLUMNS = ("Team Name", "Team ID", "Starting Money", "End Money")
+STATELOG_COLUMNS = ("Timestamp", "Event", "ManagerID", "ManagerName", "PlayerID", "PlayerName", "BaseBid",
+                    "BidAmount", "Comment", "Steps", "Replaces")
+
+
+class ExportError(RuntimeError):
+    """Raised when a journal cannot be exported, e.g. because it has no SessionStart record."""
+
+
+def session_tables(journal_path):
+    """Read a session journal once and return its tables as ``{table: (column names, columns)}``.
+
+    End money comes from replaying the journal, so undone bids and rewound
+    sales are accounted for whether or not the session was closed cleanly.
+    """
+    state = None
+    log = {field: [] for field in STATELOG_FIELDS}
+    for record, _ in iter_journal(journal_path):
+        event = record.get("event")
+        if state is None:
+            if event != "SessionStart":
+                raise ExportError(f"{journal_path} does not start with a SessionStart record")
+            state = SessionState.from_start_record(record)
+        elif event not in INTERNAL_EVENTS:
+            state.apply(record)
+            for field, column in log.items():
+                value = record.get(field)
+                # Journals store "" for "no team"; columnar formats want a missing value
+                column.append(None if value == "" else value)
+    if state is None:
+        raise ExportError(f"{journal_path} is empty")
+    engine = state.engine
+    players = [name for name, _ in state.players]
+    teams = [name for name, _ in state.teams]
+    return {
+        "Players": (PLAYER_COLUMNS, [
+            list(range(FIRST_PLAYER_ID, FIRST_PLAYER_ID + len(players))),
+            players,
+            [int(base) for _, base in state.players],
+        ]),
+        "Teams": (TEAM_COLUMNS, [
+            teams,
+            list(range(FIRST_TEAM_ID, FIRST_TEAM_ID + len(teams))),
+            [int(money) for _, money in state.teams],
+            engine.money[FIRST_TEAM_ID:],
+        ]),
+        "StateLog": (STATELOG_COLUMNS, [log[field] for field in STATELOG_FIELDS]),
+    }
+
+
+def write_xlsx(tables, path):
+    """Write every table to its own sheet of a write-only workbook, streaming rows straight to disk."""
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    for table, (names, columns) in tables.items():
+        ws = wb.create_sheet(table)
+        ws.append(names)
+        for row in zip(*columns):
+            ws.append(row)
+    wb.save(path)
+    return [path]
+
+
+def write_csv(tables, stem):
+    """Write every table to ``{stem}_{table}.csv``."""
+    paths = []
+    for table, (names, columns) in tables.items():
+        path = f"{stem}_{table.lower()}.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            writer.writerows(zip(*columns))
+        paths.append(path)
+    return paths
+
+
+def write_parquet(tables, stem):
+    """Write every table to ``{stem}_{table}.parquet``; needs pyarrow."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ExportError("Parquet export needs pyarrow (pip install pyarrow).")
+    paths = []
+    for table, (names, columns) in tables.items():
+        path = f"{stem}_{table.lower()}.parquet"
+        pq.write_table(pa.table(dict(zip(names, columns))), path)
+        paths.append(path)
+    return paths
+
+
+def export_session(journal_path, formats, out_dir, protected=()):
+    """Export one session journal in every format of ``formats`` and return the files written.
+
+    The journal is replayed once and all formats are written from the same
+    tables. Files are named ``{session}_export...`` in ``out_dir``; a path
+    in ``protected`` is never written. Runs in a worker process, so it
+    takes and returns only plain values.
+    """
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ExportError(f"Unknown export format: {fmt}")
+    stem = os.path.join(out_dir, os.path.splitext(os.path.basename(journal_path))[0] + EXPORT_SUFFIX)
+    if "xlsx" in formats and os.path.abspath(stem + ".xlsx") in protected:
+        raise ExportError(f"{stem}.xlsx is a session workbook listed in a manifest; not overwriting it")
+    tables = session_tables(journal_path)
+    paths = []
+    for fmt in formats:
+        if fmt == "xlsx":
+            paths += write_xlsx(tables, stem + ".xlsx")
+        elif fmt == "csv":
+            paths += write_csv(tables, stem)
+        else:
+            paths += write_parquet(tables, stem)
+    return paths
+
+
+def export_sessions(journal_paths, formats=("xlsx",), out_dir=".", workers=None):
+    """Export sessions in parallel, one process-pool job per session, and return the files written.
+
+    A single job runs in the calling process, since starting a pool would
+    cost more than it saves.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    protected = manifest_workbooks(out_dir)
+    jobs = [(journal_path, tuple(formats), out_dir, protected) for journal_path in journal_paths]
+    if len(jobs) <= 1 or workers == 1:
+        return [path for job in jobs for path in export_session(*job)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(export_session, *job) for job in jobs]
+        return [path for future in futures for path in future.result()]
+
+
+def manifest_workbooks(directory):
+    """Return the absolute paths of the workbooks the day manifests in ``directory`` list."""
+    paths = set()
+    for manifest_path in glob.glob(os.path.join(glob.escape(directory), "*" + MANIFEST_SUFFIX)):
+        manifest = SessionManifest(manifest_path[:-len(MANIFEST_SUFFIX)])
+        paths.add(os.path.abspath(manifest.legacy_workbook()))
+        paths.update(os.path.abspath(os.path.join(manifest.directory, entry["workbook"]))
+                     for entry in manifest.sessions)
+    return frozenset(paths)
+
+
+def journals_of(paths):
+    """Expand manifest files into the journals of their sessions; other paths are taken as journals."""
+    journals = []
+    for path in paths:
+        if path.endswith(MANIFEST_SUFFIX):
+            manifest = SessionManifest(path[:-len(MANIFEST_SUFFIX)])
+            journals += [os.path.join(manifest.directory, entry["journal"]) for entry in manifest.sessions]
+        else:
+            journals.append(path)
+    return journals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export finished auction sessions to xlsx, CSV or Parquet")
+    parser.add_argument("paths", nargs="+", metavar="JOURNAL_OR_MANIFEST",
+                        help="session journals, or day manifests whose sessions are all exported")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=["xlsx"], dest="formats")
+    parser.add_argument("--out", default=".", help="directory to write the exports to")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+    try:
+        paths = export_sessions(journals_of(args.paths), args.formats, args.out, args.workers)
+    except ExportError as e:
+        parser.exit(1, f"{e}\n")
+    for path in paths:
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import glob
+import json
+import os
+import re
+from datetime import datetime
+
+# The manifest of an auction day sits next to its session files: {auction}_{YYYYMMDD}.manifest.json
+MANIFEST_SUFFIX = ".manifest.json"
+SESSION_PATTERN = re.compile(r"Session_(\d+)$")
+
+
+def session_number(session_name):
+    """Return the number of a "Session_N" name, or None for any other name."""
+    match = SESSION_PATTERN.search(session_name)
+    return int(match.group(1)) if match else None
+
+
+class SessionManifest:
+    """Index of the per-session workbooks and journals of one auction day.
+
+    ``daily_stem`` is ``{auction name}_{YYYYMMDD}``, optionally with a
+    directory. Session N of the day writes ``{daily_stem}_Session_N.xlsx``
+    and ``{daily_stem}_Session_N.journal``; the manifest lists them so that
+    starting a session never has to open the workbooks of earlier ones.
+    """
+
+    def __init__(self, daily_stem):
+        self.daily_stem = daily_stem
+        self.path = daily_stem + MANIFEST_SUFFIX
+        self.directory = os.path.dirname(daily_stem)
+        self.sessions = []
+        self.reload()
+
+    def reload(self):
+        """Re-read the manifest, e.g. after another session of the day changed it."""
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                self.sessions = json.load(f)["sessions"]
+
+    @classmethod
+    def for_day(cls, auction_name, day=None, directory=""):
+        """Return the manifest of ``auction_name`` on ``day`` (today by default)."""
+        day = day or datetime.now()
+        return cls(os.path.join(directory, f"{auction_name}_{day.strftime('%Y%m%d')}"))
+
+    def session_workbook(self, session_name):
+        """Return the workbook path of a session of this day."""
+        return f"{self.daily_stem}_{session_name}.xlsx"
+
+    def session_journal(self, session_name):
+        """Return the journal path of a session of this day."""
+        return f"{self.daily_stem}_{session_name}.journal"
+
+    def legacy_workbook(self):
+        """Return the combined daily workbook path, written by older versions and by ``merge_sessions``."""
+        return f"{self.daily_stem}.xlsx"
+
+    def next_session_name(self):
+        """Return the name of the next session of the day."""
+        numbers = [entry["number"] for entry in self.sessions]
+        # Session files whose manifest entry was lost still take up their number
+        for path in glob.glob(glob.escape(self.daily_stem) + "_Session_*.xlsx"):
+            number = session_number(os.path.splitext(path)[0])
+            if number is not None:
+                numbers.append(number)
+        if not os.path.exists(self.path) and os.path.exists(self.legacy_workbook()):
+            # The day started before sessions had their own files: continue after its sheets
+            numbers += [number for number in map(session_number, _sheet_names(self.legacy_workbook()))
+                        if number is not None]
+        return f"Session_{max(numbers, default=0) + 1}"
+
+    def entry(self, session_name):
+        """Return the manifest entry of a session, or None."""
+        for entry in self.sessions:
+            if entry["session_name"] == session_name:
+                return entry
+        return None
+
+    def add_session(self, session_name):
+        """Record that a session has started (or resumed) and save the manifest."""
+        self.reload()
+        entry = self.entry(session_name)
+        if entry is None:
+            self.sessions.append({
+                "session_name": session_name,
+                "number": session_number(session_name),
+                "workbook": os.path.basename(self.session_workbook(session_name)),
+                "journal": os.path.basename(self.session_journal(session_name)),
+                "started": datetime.now().isoformat(timespec="seconds"),
+                "ended": None,
+            })
+        else:
+            entry["ended"] = None
+        self.save()
+
+    def end_session(self, session_name):
+        """Record that a session was closed and save the manifest."""
+        self.reload()
+        entry = self.entry(session_name)
+        if entry is not None:
+            entry["ended"] = datetime.now().isoformat(timespec="seconds")
+            self.save()
+
+    def save(self):
+        """Atomically replace the manifest file."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"daily_stem": os.path.basename(self.daily_stem), "sessions": self.sessions}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _sheet_names(path):
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def merge_sessions(daily_stem, output=None):
+    """Build the combined daily workbook, one sheet per session, from the per-session workbooks.
+
+    Sheets of an older combined workbook that have no session file of their
+    own are carried over, so merging over it loses nothing. Workbooks are
+    streamed in read-only mode and the result is written in write-only mode.
+    Returns the path of the combined workbook.
+    """
+    from openpyxl import Workbook, load_workbook
+    manifest = SessionManifest(daily_stem)
+    output = output or manifest.legacy_workbook()
+    sources = {}
+    legacy = manifest.legacy_workbook()
+    if os.path.exists(legacy):
+        for name in _sheet_names(legacy):
+            sources[name] = legacy
+    for entry in manifest.sessions:
+        path = os.path.join(manifest.directory, entry["workbook"])
+        if os.path.exists(path):
+            sources[entry["session_name"]] = path
+        else:
+            print(f"Missing session workbook: {path}")
+
+    merged = Workbook(write_only=True)
+    open_books = {}
+    try:
+        for name in sorted(sources, key=lambda name: (session_number(name) is None, session_number(name) or 0, name)):
+            path = sources[name]
+            if path not in open_books:
+                open_books[path] = load_workbook(path, read_only=True, data_only=True)
+            ws = merged.create_sheet(name)
+            for row in open_books[path][name].iter_rows(values_only=True):
+                ws.append(row)
+        tmp_path = output + ".tmp.xlsx"
+        merged.save(tmp_path)
+    finally:
+        for wb in open_books.values():
+            wb.close()
+    os.replace(tmp_path, output)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge an auction day's session workbooks into one workbook")
+    parser.add_argument("day", help="manifest file, or {auction name}_{YYYYMMDD} prefix of the day's files")
+    parser.add_argument("-o", "--output", help="combined workbook to write (default: {auction name}_{YYYYMMDD}.xlsx)")
+    args = parser.parse_args()
+    daily_stem = args.day[:-len(MANIFEST_SUFFIX)] if args.day.endswith(MANIFEST_SUFFIX) else args.day
+    print(f"Wrote {merge_sessions(daily_stem, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import glob
+import os
+
+from auction_engine import OK, AuctionEngine, apply_event
+from auction_history import AuctionHistory
+from bid_ladder import DEFAULT_LADDER, BidLadder
+from event_journal import INTERNAL_EVENTS, iter_journal, last_record
+from session_snapshot import RosterColumns, SessionSnapshot
+
+# Write a state snapshot every this many journaled events
+SNAPSHOT_EVENTS = 500
+
+
+class SessionState:
+    """Auction session metadata plus an AuctionEngine rebuilt by replaying journaled events.
+
+    The engine gets an AuctionHistory, so the replayed events can be undone
+    and redone once the session is resumed. ``history_complete`` is False
+    when the state came from a snapshot, whose history only starts there;
+    restore_history() brings the rest back.
+    """
+
+    def __init__(self, auction_name, excel_filename, session_name, teams, players, engine=None,
+                 ladder=DEFAULT_LADDER, squad_size=0):
+        self.auction_name = auction_name
+        self.excel_filename = excel_filename
+        self.session_name = session_name
+        self.teams = [tuple(team) for team in teams]
+        self.players = players
+        if engine is None:
+            engine = AuctionEngine(self.teams, players, ladder)
+            if squad_size:
+                engine.set_squad_size(squad_size)
+        if engine.history is None:
+            AuctionHistory(engine)
+        self.engine = engine
+        self.seq = 0
+        self.history_complete = True
+
+    @classmethod
+    def from_start_record(cls, record):
+        """Build the initial state from a journal's SessionStart record."""
+        return cls(
+            record["auction_name"],
+            record["excel_filename"],
+            record["session_name"],
+            record["teams"],
+            record["players"],
+            ladder=BidLadder(record["bid_ladder"]) if record.get("bid_ladder") else DEFAULT_LADDER,
+            squad_size=record.get("squad_size", 0),
+        )
+
+    def apply(self, record):
+        """Apply one journaled event to the engine and return its result code."""
+        self.seq = record.get("seq", self.seq + 1)
+        return apply_event(self.engine, record)
+
+
+def snapshot_path(journal_path):
+    """Return the snapshot file that belongs to a journal."""
+    return journal_path + ".snap"
+
+
+def load_snapshot(journal_path):
+    """Return ``(state, journal offset)`` from the journal's snapshot, or None if there is no usable one."""
+    path = snapshot_path(journal_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with SessionSnapshot(path) as snapshot:
+            engine = snapshot.to_engine()
+            meta = snapshot.meta
+            state = SessionState(meta["auction_name"], meta["excel_filename"], meta["session_name"],
+                                 meta["teams"], RosterColumns(engine.player_names, engine.player_base), engine)
+            state.seq = snapshot.seq
+            state.history_complete = False
+            return state, snapshot.offset
+    except (OSError, ValueError):
+        return None
+
+
+def recover_session(journal_path, use_snapshot=True):
+    """Rebuild the state of a session from its latest snapshot and journal tail.
+
+    The snapshot holds no undo history. If the tail rewinds or redoes steps
+    from before the snapshot, the whole journal is replayed instead;
+    otherwise the history starts at the snapshot until restore_history()
+    is called.
+    """
+    state = None
+    offset = 0
+    snapshot = load_snapshot(journal_path) if use_snapshot else None
+    if snapshot is not None:
+        state, offset = snapshot
+    for record, _ in iter_journal(journal_path, offset):
+        event = record.get("event")
+        if state is None:
+            if event != "SessionStart":
+                raise ValueError(f"{journal_path} does not start with a SessionStart record")
+            state = SessionState.from_start_record(record)
+            state.seq = record["seq"]
+        elif record["seq"] > state.seq and event not in INTERNAL_EVENTS:
+            if state.apply(record) != OK and snapshot is not None:
+                return recover_session(journal_path, use_snapshot=False)
+    if state is None:
+        raise ValueError(f"{journal_path} is empty")
+    return state
+
+
+def restore_history(engine, journal_path):
+    """Give an engine resumed from a snapshot the undo history of its whole session.
+
+    The journal is replayed from its start into a new engine. If that ends
+    in the same state, the new engine's state and history are moved into
+    ``engine`` in place, so everything holding ``engine`` keeps working.
+    Proxy ceilings and budget policies are not journaled and are kept.
+    Returns whether the history was restored.
+    """
+    replayed = recover_session(journal_path, use_snapshot=False).engine
+    if replayed.to_state() != engine.to_state():
+        return False
+    for name in AuctionEngine.__slots__:
+        if name not in ("proxy_ceilings", "budget_shares"):
+            setattr(engine, name, getattr(replayed, name))
+    engine.history.engine = engine
+    return True
+
+
+def find_unfinished_sessions(auction_name, directory="."):
+    """Return the journals of ``auction_name`` that were never closed, newest first."""
+    journals = []
+    for path in glob.glob(os.path.join(glob.escape(directory), f"{glob.escape(auction_name)}_*_Session_*.journal")):
+        if os.path.getsize(path) == 0:
+            continue
+        record = last_record(path)
+        if record is None or record.get("event") != "SessionEnd":
+            journals.append(path)
+    journals.sort(key=os.path.getmtime, reverse=True)
+    return journals
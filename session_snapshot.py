@@ -0,0 +1,237 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+
+from auction_engine import FIRST_PLAYER_ID, FIRST_TEAM_ID, AuctionEngine
+from bid_ladder import DEFAULT_LADDER, BidLadder
+
+MAGIC = b"AUCSNAP1"
+# magic, seq, journal offset, teams, players, sold players, history entries, metadata bytes,
+# name bytes, current player, current bid, highest bidder, bidding enabled
+HEADER = struct.Struct("<8sqqiiiiiqiqii")
+UNSOLD = -1
+
+
+def _pad(length):
+    """Return the padding that keeps the next column 8-byte aligned."""
+    return -length % 8
+
+
+def _copy_column(column):
+    """Copy a memoryview column into an array with a single memcpy."""
+    copy = array(column.format)
+    with column.cast("B") as raw:
+        copy.frombytes(raw)
+    return copy
+
+
+class NameTable:
+    """Sequence of player names decoded on access from a UTF-8 blob and an offsets column."""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class RosterColumns:
+    """Sequence of ``(player name, base bid)`` pairs over snapshot columns."""
+
+    def __init__(self, names, base):
+        self.names = names
+        self.base = base
+
+    def __len__(self):
+        return len(self.base)
+
+    def __getitem__(self, index):
+        return self.names[index], self.base[index]
+
+    def __iter__(self):
+        return zip(self.names, self.base)
+
+
+class SnapshotWriter:
+    """Writes columnar binary snapshots of one session.
+
+    The player name and base bid columns never change during a session, so
+    they are encoded once and reused by every later snapshot.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._static = None
+
+    def _encode_static(self, engine):
+        names = [name.encode("utf-8") for name in engine.player_names]
+        offsets = array("q", [0])
+        total = 0
+        for name in names:
+            total += len(name)
+            offsets.append(total)
+        blob = b"".join(names)
+        return (
+            blob + b"\0" * _pad(len(blob)),
+            len(blob),
+            offsets.tobytes(),
+            array("i", range(FIRST_PLAYER_ID, FIRST_PLAYER_ID + len(names))).tobytes(),
+            array("q", engine.player_base).tobytes(),
+        )
+
+    def write(self, state, offset):
+        """Atomically replace the snapshot with the given SessionState at journal byte ``offset``."""
+        engine = state.engine
+        if self._static is None:
+            self._static = self._encode_static(engine)
+        names_blob, names_len, name_offsets, player_ids, base_bids = self._static
+
+        n_players = len(engine.player_base)
+        sold_price = array("q", [UNSOLD]) * n_players
+        owner = array("i", [0]) * n_players
+        position = array("i", [0]) * n_players
+        sold_players = array("i")
+        for team_id in engine.team_ids():
+            for pos, (player_id, price) in enumerate(engine.inventory[team_id].items(), 1):
+                index = player_id - FIRST_PLAYER_ID
+                sold_price[index] = price
+                owner[index] = team_id
+                position[index] = pos
+                sold_players.append(player_id)
+
+        meta = json.dumps({
+            "auction_name": state.auction_name,
+            "excel_filename": state.excel_filename,
+            "session_name": state.session_name,
+            "teams": [list(team) for team in state.teams],
+            "bid_ladder": engine.ladder.tiers(),
+            "squad_size": engine.squad_size,
+            # Parked lots are few and small, so they travel in the metadata rather than as columns
+            "lots": [[player_id, bid, leader, history]
+                     for player_id, (bid, leader, history) in sorted(engine.lots.items())],
+        }, ensure_ascii=False).encode("utf-8")
+        history = engine.bid_history
+        header = HEADER.pack(
+            MAGIC, state.seq, offset, len(state.teams), n_players, len(sold_players), len(history),
+            len(meta), names_len,
+            engine.current_player, engine.current_bid, engine.highest_bidder, int(engine.bidding_enabled)
+        )
+        chunks = [
+            header, b"\0" * _pad(len(header)),
+            meta, b"\0" * _pad(len(meta)),
+            names_blob, name_offsets,
+            player_ids, b"\0" * _pad(len(player_ids)),
+            base_bids, sold_price.tobytes(),
+            owner.tobytes(), position.tobytes(), b"\0" * _pad(8 * n_players),
+            sold_players.tobytes(), b"\0" * _pad(4 * len(sold_players)),
+            array("q", engine.money[FIRST_TEAM_ID:]).tobytes(),
+            array("q", [leader for leader, _ in history]).tobytes(),
+            array("q", [bid for _, bid in history]).tobytes(),
+        ]
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class SessionSnapshot:
+    """Memory-mapped, read-only view of a snapshot file.
+
+    Each column is a zero-copy memoryview into the mapped file:
+    ``player_id``, ``base_bid``, ``sold_price`` (-1 when unsold), ``owner``
+    (0 when unsold), ``position`` (order within the owner's inventory),
+    ``sold_players`` (sold player IDs grouped by team in inventory order),
+    ``money`` and the ``history_leader``/``history_bid`` bid stack. The
+    columns are only valid until ``close()``; ``to_engine`` copies what it
+    keeps.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        self._views = [view]
+        (magic, self.seq, self.offset, n_teams, n_players, n_sold, n_history, meta_len, names_len,
+         self.current_player, self.current_bid, self.highest_bidder, bidding_enabled) = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an auction snapshot")
+        self.bidding_enabled = bool(bidding_enabled)
+        pos = HEADER.size + _pad(HEADER.size)
+
+        def take(length):
+            nonlocal pos
+            chunk = view[pos:pos + length]
+            pos += length + _pad(length)
+            self._views.append(chunk)
+            return chunk
+
+        self.meta = json.loads(bytes(take(meta_len)).decode("utf-8"))
+        self._names_blob = take(names_len)
+        self._name_offsets = self._cast(take(8 * (n_players + 1)), "q")
+        self.player_names = NameTable(self._names_blob, self._name_offsets)
+        self.player_id = self._cast(take(4 * n_players), "i")
+        self.base_bid = self._cast(take(8 * n_players), "q")
+        self.sold_price = self._cast(take(8 * n_players), "q")
+        owner_and_position = take(8 * n_players)
+        self.owner = self._cast(owner_and_position[:4 * n_players], "i")
+        self.position = self._cast(owner_and_position[4 * n_players:], "i")
+        self.sold_players = self._cast(take(4 * n_sold), "i")
+        self.money = self._cast(take(8 * n_teams), "q")
+        self.history_leader = self._cast(take(8 * n_history), "q")
+        self.history_bid = self._cast(take(8 * n_history), "q")
+
+    def _cast(self, chunk, typecode):
+        column = chunk.cast(typecode)
+        self._views.append(column)
+        return column
+
+    def close(self):
+        """Release the columns and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def to_engine(self):
+        """Build an AuctionEngine holding the snapshot's state."""
+        teams = [(name, money) for name, money in self.meta["teams"]]
+        ladder = BidLadder(self.meta["bid_ladder"]) if self.meta.get("bid_ladder") else DEFAULT_LADDER
+        engine = AuctionEngine(teams, (), ladder)
+        engine.money = [0] + self.money.tolist()
+        engine.player_names = NameTable(bytes(self._names_blob), _copy_column(self._name_offsets))
+        engine.player_base = _copy_column(self.base_bid)
+        remaining = dict.fromkeys(range(FIRST_PLAYER_ID, FIRST_PLAYER_ID + len(self.base_bid)))
+        for player_id in self.sold_players:
+            index = player_id - FIRST_PLAYER_ID
+            engine.inventory[self.owner[index]][player_id] = self.sold_price[index]
+            del remaining[player_id]
+        engine.remaining = remaining
+        engine.current_player = self.current_player
+        engine.current_bid = self.current_bid
+        engine.highest_bidder = self.highest_bidder
+        engine.bid_history = list(zip(self.history_leader.tolist(), self.history_bid.tolist()))
+        engine.bidding_enabled = self.bidding_enabled
+        engine.restore_lots({player_id: (bid, leader, [tuple(entry) for entry in history])
+                             for player_id, bid, leader, history in self.meta.get("lots", ())})
+        engine.set_squad_size(self.meta.get("squad_size", 0))
+        return engine
@@ -0,0 +1,61 @@
+import sys
+import threading
+import time
+
+# Taken when this module is first imported, i.e. right at the start of the app's imports
+PROCESS_START = time.perf_counter()
+
+# Phases reported by StartupTimer.report, as (label, start mark, end mark)
+PHASES = (
+    ("Imports", "start", "imports"),
+    ("First paint", "start", "first_paint"),
+    ("Roster load", "file_chosen", "roster_loaded"),
+    ("Session setup", "roster_loaded", "auction_ready"),
+    ("Load to first bid", "roster_loaded", "first_bid"),
+)
+
+
+class StartupTimer:
+    """Records named startup milestones and reports the time between them."""
+
+    def __init__(self):
+        self.enabled = False
+        self.marks = {"start": PROCESS_START}
+        self.reported = False
+
+    def mark(self, name):
+        """Record the first time a milestone is reached."""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter()
+
+    def report(self):
+        """Return the timing report as text."""
+        lines = ["Startup timing:"]
+        for label, start, end in PHASES:
+            if start in self.marks and end in self.marks:
+                lines.append(f"  {label:<18} {(self.marks[end] - self.marks[start]) * 1000:9.1f} ms")
+            else:
+                lines.append(f"  {label:<18}       n/a")
+        return "\n".join(lines)
+
+    def print_report(self, file=sys.stderr):
+        """Print the report once, if timing was requested."""
+        if self.enabled and not self.reported:
+            self.reported = True
+            print(self.report(), file=file)
+
+
+startup_timer = StartupTimer()
+
+
+def prewarm_imports(*module_names):
+    """Import heavy modules on a background thread while the user is busy with the UI."""
+    def run():
+        for name in module_names:
+            try:
+                __import__(name)
+            except ImportError:
+                pass
+    thread = threading.Thread(target=run, name="ImportPrewarm", daemon=True)
+    thread.start()
+    return thread
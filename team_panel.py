@@ -0,0 +1,240 @@
+import tkinter as tk
+
+# Width in pixels of one team column
+COLUMN_WIDTH = 220
+# Height in pixels of one row of the summary table
+ROW_HEIGHT = 32
+SUMMARY_COLUMNS = ("Team", "Money", "Max Bid", "Players")
+COLUMNS = "columns"
+TABLE = "table"
+
+
+class TeamSlot:
+    """Widgets showing one team: a column of the full view or a row of the summary table."""
+
+    def __init__(self, panel, parent, mode):
+        font = panel.font
+        self.team_id = None
+        self.enabled = None
+        self.frame = tk.Frame(parent, bd=1, relief="groove" if mode == TABLE else "flat")
+        self.bid_button = None
+        if panel.on_bid is not None:
+            self.bid_button = tk.Button(self.frame, text="Bid", font=font, bg="lightblue",
+                                        command=lambda: panel.on_bid(self.team_id))
+            # Right-click registers the team's private proxy ceiling for the current player
+            self.bid_button.bind("<Button-3>", lambda event: panel.on_proxy(self.team_id))
+        if mode == COLUMNS:
+            self.money_label = tk.Label(self.frame, font=(font[0], font[1], 'bold'), width=20, anchor="n")
+            self.money_label.pack(side="top", fill="x", pady=3)
+            self.heading_label = tk.Label(self.frame, font=(font[0], font[1], 'bold'), width=20, anchor="n")
+            self.heading_label.pack(side="top", fill="x")
+            self.bid_button.config(width=12, height=2)
+            self.bid_button.pack(side="bottom", pady=5)
+            self.inventory_label = tk.Label(self.frame, font=font, width=20, wraplength=200, justify="center",
+                                            anchor="n")
+            self.inventory_label.pack(side="top", fill="both", expand=True)
+            self.cells = ()
+        else:
+            self.cells = []
+            for column in range(len(panel.columns)):
+                cell = tk.Label(self.frame, font=font, anchor="w")
+                cell.grid(row=0, column=column, padx=5, sticky="w")
+                self.frame.columnconfigure(column, weight=1, uniform="summary")
+                self.cells.append(cell)
+            if self.bid_button is not None:
+                self.bid_button.config(width=6)
+                self.bid_button.grid(row=0, column=len(panel.columns), padx=5)
+        for widget in (self.frame, self.bid_button, *self.cells):
+            if widget is not None:
+                panel.bind_wheel(widget)
+
+
+class TeamPanelView(tk.Frame):
+    """Scrollable team panel that only creates widgets for the teams in view.
+
+    In COLUMNS mode every visible team gets a column with its money,
+    inventory and Bid button; in TABLE mode a compact summary row. A fixed
+    pool of slots, sized to the viewport, is reassigned to teams as the
+    panel scrolls, so the widget count and the cost of a resize depend on
+    the window size, not on the number of teams. Redraws for teams out of
+    view are skipped.
+    """
+
+    def __init__(self, master, team_ids, money_text, inventory_text, summary, can_bid, on_bid, on_proxy,
+                 mode=COLUMNS, font=('Arial', 12), columns=SUMMARY_COLUMNS, **kwargs):
+        """``summary(team_id)`` returns the ``columns`` values of a team.
+
+        Without ``on_bid`` the table rows have no Bid button, for read-only
+        tables; only TABLE mode works that way.
+        """
+        super().__init__(master, **kwargs)
+        self.columns = columns
+        self.team_ids = list(team_ids)
+        self.money_text = money_text
+        self.inventory_text = inventory_text
+        self.summary = summary
+        self.can_bid = can_bid
+        self.on_bid = on_bid
+        self.on_proxy = on_proxy
+        self.font = font
+        self.mode = mode
+        self._top = 0        # position in self.team_ids of the first team in view
+        self._slots = {COLUMNS: [], TABLE: []}
+        self._visible = {}   # team ID -> slot, for the teams in view
+
+        self.header = tk.Frame(self)
+        for column, heading in enumerate(columns):
+            tk.Label(self.header, text=heading, font=(font[0], font[1], 'bold'), anchor="w").grid(
+                row=0, column=column, padx=5, sticky="w")
+            self.header.columnconfigure(column, weight=1, uniform="summary")
+        if on_bid is not None:
+            # Keeps the headings over their cells next to the rows' Bid buttons
+            tk.Label(self.header, text="", width=6, font=font).grid(row=0, column=len(columns), padx=5)
+        self.xscrollbar = tk.Scrollbar(self, orient="horizontal", command=self.view)
+        self.yscrollbar = tk.Scrollbar(self, orient="vertical", command=self.view)
+        self.viewport = tk.Frame(self)
+        self.viewport.bind("<Configure>", lambda event: self.refresh())
+        self.bind_wheel(self.viewport)
+        self._pack()
+
+    def _pack(self):
+        for widget in (self.header, self.xscrollbar, self.yscrollbar, self.viewport):
+            widget.pack_forget()
+        if self.mode == COLUMNS:
+            self.xscrollbar.pack(side="bottom", fill="x")
+        else:
+            self.header.pack(side="top", fill="x")
+            self.yscrollbar.pack(side="right", fill="y")
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+    def set_mode(self, mode):
+        """Switch between the full team columns and the compact summary table."""
+        if mode == self.mode:
+            return
+        for slot in self._slots[self.mode]:
+            slot.frame.place_forget()
+            slot.team_id = None
+        self._visible = {}
+        self.mode = mode
+        self._pack()
+        self.refresh()
+
+    def toggle_mode(self):
+        """Switch to the other mode."""
+        self.set_mode(TABLE if self.mode == COLUMNS else COLUMNS)
+
+    # --- Drawing ---
+
+    def visible_teams(self):
+        """Return how many teams fit in the viewport, counting a partly visible one."""
+        if self.mode == COLUMNS:
+            return max(1, self.viewport.winfo_width() // COLUMN_WIDTH + 1)
+        return max(1, self.viewport.winfo_height() // ROW_HEIGHT + 1)
+
+    def refresh(self):
+        """Reassign the slots to the teams in view and redraw them."""
+        team_ids = self.team_ids
+        visible = self.visible_teams()
+        # The last team may be scrolled fully into view, leaving the partly visible slot empty
+        self._top = max(0, min(self._top, len(team_ids) - max(1, visible - 1)))
+        count = min(visible, len(team_ids) - self._top)
+        slots = self._slots[self.mode]
+        while len(slots) < count:
+            slots.append(TeamSlot(self, self.viewport, self.mode))
+        # Teams that all fit share the width between them; otherwise columns keep a fixed width
+        fits = self.mode == COLUMNS and len(team_ids) * COLUMN_WIDTH <= self.viewport.winfo_width()
+        self._visible = {}
+        for pos, slot in enumerate(slots):
+            if pos >= count:
+                slot.frame.place_forget()
+                slot.team_id = None
+                continue
+            team_id = team_ids[self._top + pos]
+            if slot.team_id != team_id:
+                slot.team_id = team_id
+                slot.enabled = None
+            self._visible[team_id] = slot
+            if self.mode == TABLE:
+                slot.frame.place(x=0, y=pos * ROW_HEIGHT, relwidth=1, height=ROW_HEIGHT)
+            elif fits:
+                slot.frame.place(relx=pos / len(team_ids), y=0, relwidth=1 / len(team_ids), relheight=1)
+            else:
+                slot.frame.place(x=pos * COLUMN_WIDTH, y=0, width=COLUMN_WIDTH, relheight=1)
+            self._draw(slot)
+        scrollbar = self.xscrollbar if self.mode == COLUMNS else self.yscrollbar
+        if team_ids:
+            scrollbar.set(self._top / len(team_ids), min(1.0, (self._top + count) / len(team_ids)))
+        else:
+            scrollbar.set(0.0, 1.0)
+
+    def _draw(self, slot):
+        team_id = slot.team_id
+        if self.mode == COLUMNS:
+            slot.money_label.config(text=self.money_text(team_id))
+            slot.heading_label.config(text=f"{self.summary(team_id)[0]} \nInventory:")
+            slot.inventory_label.config(text=self.inventory_text(team_id))
+        else:
+            self._draw_summary(slot)
+        self._draw_bid_button(slot)
+
+    def _draw_summary(self, slot):
+        for cell, value in zip(slot.cells, self.summary(slot.team_id)):
+            cell.config(text=value)
+
+    def _draw_bid_button(self, slot):
+        if slot.bid_button is None:
+            return
+        enabled = self.can_bid(slot.team_id)
+        if slot.enabled != enabled:
+            slot.enabled = enabled
+            slot.bid_button.config(state="normal" if enabled else "disabled")
+
+    def refresh_money(self, team_id):
+        """Redraw a team's money, if it is in view."""
+        slot = self._visible.get(team_id)
+        if slot is None:
+            return
+        if self.mode == COLUMNS:
+            slot.money_label.config(text=self.money_text(team_id))
+        else:
+            self._draw_summary(slot)
+
+    def refresh_inventory(self, team_id):
+        """Redraw a team's inventory (or player count in the table), if it is in view."""
+        slot = self._visible.get(team_id)
+        if slot is None:
+            return
+        if self.mode == COLUMNS:
+            slot.inventory_label.config(text=self.inventory_text(team_id))
+        else:
+            self._draw_summary(slot)
+
+    def refresh_bid_buttons(self):
+        """Enable or grey out the Bid buttons in view."""
+        for slot in self._visible.values():
+            self._draw_bid_button(slot)
+
+    # --- Scrolling ---
+
+    def view(self, *args):
+        """Scrollbar callback implementing the ``moveto`` and ``scroll`` commands."""
+        if not self.team_ids:
+            return
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self.team_ids))
+        elif args[0] == "scroll":
+            steps = int(args[1])
+            if args[2] == "pages":
+                steps *= max(1, self.visible_teams() - 1)
+            self._top += steps
+        self.refresh()
+
+    def scroll_teams(self, steps):
+        """Scroll by ``steps`` teams (negative scrolls back)."""
+        self._top += steps
+        self.refresh()
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda event: self.scroll_teams(-1 if event.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda event: self.scroll_teams(-1))
+        widget.bind("<Button-5>", lambda event: self.scroll_teams(1))
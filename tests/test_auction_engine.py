@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auction_engine import BIDDING_CLOSED, OK, AuctionEngine, apply_event, execute  # noqa: E402
+from auction_history import AuctionHistory  # noqa: E402
+
+TEAMS = [("A", 1000), ("B", 1000)]
+PLAYERS = [("P1", 100), ("P2", 50)]
+
+
+def sold_engine():
+    """Return an engine in which team 1 has bought player 101 for 110."""
+    engine = AuctionEngine(TEAMS, PLAYERS)
+    AuctionHistory(engine)
+    for event in ({"event": "SelectPlayer", "manager_id": 0, "player_id": 101, "bid_amount": None},
+                  {"event": "Bid", "manager_id": 1, "player_id": 101, "bid_amount": 110},
+                  {"event": "Bought", "manager_id": 1, "player_id": 101, "bid_amount": 110}):
+        assert apply_event(engine, event) == OK
+    return engine
+
+
+def test_replayed_second_sale_is_refused():
+    engine = sold_engine()
+    assert apply_event(engine, {"event": "SelectPlayer", "manager_id": 0, "player_id": 101,
+                                "bid_amount": None}) == BIDDING_CLOSED
+    assert apply_event(engine, {"event": "Bid", "manager_id": 2, "player_id": 101,
+                                "bid_amount": 120}) == BIDDING_CLOSED
+    assert apply_event(engine, {"event": "Bought", "manager_id": 2, "player_id": 101,
+                                "bid_amount": 120}) == BIDDING_CLOSED
+    assert engine.money == [0, 890, 1000]
+    assert engine.inventory[1] == {101: 110}
+    assert engine.inventory[2] == {}
+
+
+def test_sold_or_unknown_player_cannot_be_selected():
+    engine = sold_engine()
+    for command in ({"type": "select", "player_id": 101}, {"type": "open", "player_id": 101},
+                    {"type": "select", "player_id": 999}, {"type": "open", "player_id": -1}):
+        assert execute(engine, command) == (BIDDING_CLOSED, None)
+    assert engine.select(101) == BIDDING_CLOSED
+    assert execute(engine, {"type": "select", "player_id": 102})[0] == OK
+    assert engine.current_player == 102